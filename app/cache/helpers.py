@@ -17,17 +17,31 @@ Caching Pattern:
     The standard caching workflow implemented by this module:
 
     1. Check Cache (unless force_refresh=True):
-        - Lookup data in Redis using cache_key
+        - Lookup data in the in-process L1 cache, then in Redis, using cache_key
+        - If found in Redis: Populate L1 for subsequent requests, for at most
+          min(CACHE_L1_TTL, ttl) seconds
         - If found: Log cache hit and return immediately
+        - If a negative marker (neg:{cache_key}) is found and the endpoint
+          opted in with negative_cache=True: Re-raise the recorded 404/403
+          without calling the upstream API
         - If not found or expired: Continue to step 2
 
     2. Fetch from API:
+        - If a fetch for the same cache_key is already in flight, await its
+          result instead of calling the API again (request coalescing)
+        - At most RIOT_MAX_CONCURRENT_REQUESTS fetches per region run at once;
+          further misses wait for a slot instead of flooding the upstream API
         - Call provided fetch_fn to get data from Riot API
         - Handle any errors with appropriate exception mapping
         - Log the API call with context
 
     3. Store in Cache:
-        - Save response in Redis with specified TTL
+        - Save response in Redis with specified TTL (fire-and-forget: the
+          response is returned without waiting for the Redis acknowledgement;
+          failed writes are logged)
+        - Concurrent writes are coalesced by a background writer and flushed
+          in batches (MSET + EXPIRE in one pipeline per TTL)
+        - Save response in the L1 cache (lifetime min(CACHE_L1_TTL, ttl))
         - Log successful cache storage
         - Return data to caller
 
@@ -35,7 +49,17 @@ Caching Pattern:
         Request → Check Redis → Miss → Fetch from Riot API → Store in Redis → Return
 
     Example flow for a cache hit:
-        Request → Check Redis → Hit → Return (no API call!)
+        Request → Check L1 → Miss → Check Redis → Hit → Store in L1 → Return (no API call!)
+
+    Example flow for a hot key:
+        Request → Check L1 → Hit → Return (no Redis round trip!)
+
+Redis Failures:
+    Redis errors never fail a request: reads that fail or exceed
+    CACHE_OP_TIMEOUT are treated as misses, and failed writes are logged.
+    A circuit breaker (app.cache.redis_cache.redis_breaker) skips Redis
+    entirely after repeated failures, so a degraded Redis does not add a
+    timeout to every request.
 
 Error Handling:
     All Riot API and HTTP errors are caught and mapped to custom exceptions:
@@ -49,12 +73,22 @@ Error Handling:
     Special handling for Data Dragon 403 errors provides helpful messages
     about the deprecated "latest" version alias.
 
+    Endpoints that pass negative_cache=True have upstream HTTP 404 and Data
+    Dragon 403 responses negatively cached for CACHE_TTL_NEGATIVE seconds
+    (never longer than the endpoint's own TTL), so floods of requests for
+    missing resources do not reach the upstream API. Errors raised directly
+    as RiotAPIException (e.g. by the Riot client) are not negatively cached.
+
 Logging:
     All operations are logged with structured context:
-    - Cache hits: source="cache"
-    - API fetches: source="riot_api"
-    - Errors: Full context with status codes and URLs
-    - Success: Confirmation with cache key and TTL
+    - Cache hits: source="cache" (DEBUG)
+    - API fetches: source="riot_api" (DEBUG)
+    - Errors: Full context with status codes and URLs (logged immediately)
+    - Summary: hit/miss counts per resource every minute (INFO)
+
+    Hits and misses are not logged on the request path: they are appended to
+    a bounded ring buffer that a background task drains every 100 ms, replaying
+    the records at DEBUG and aggregating them into the periodic summary.
 
     Log messages include user-provided context dict for request-specific details.
 
@@ -91,16 +125,23 @@ Performance Benefits:
 
 See Also:
     app.cache.redis_cache: Low-level Redis cache interface
+    app.cache.memory: In-process L1 cache
     app.routers.*: Router endpoints using these helpers
     app.exceptions: Custom exception classes for error handling
 """
 
-from typing import Any, Awaitable, Callable
+import asyncio
+import re
+from collections import Counter, deque
+from functools import partial
+from typing import Any, Awaitable, Callable, Mapping, NoReturn
 
 import httpx
 from loguru import logger
 
-from app.cache.redis_cache import cache
+from app.cache.memory import local_cache
+from app.cache.redis_cache import cache, known_keys, redis_breaker
+from app.config import settings
 from app.exceptions import (
     RiotAPIException,
     UnauthorizedException,
@@ -111,6 +152,387 @@ from app.exceptions import (
 )
 
 
+# Negative caching: "known missing" markers stored under neg:{cache_key}
+
+_NEGATIVE_PREFIX = "neg:"
+
+
+def _store_negative(cache_key: str, marker: dict[str, Any], negative_ttl: int) -> None:
+    """
+    Remember an upstream 404/403 for negative_ttl seconds.
+
+    Args:
+        cache_key: Cache key of the missing resource
+        marker: Status (and message) needed to re-raise the error
+        negative_ttl: Marker lifetime in seconds (0 when the endpoint did not opt in)
+    """
+    if negative_ttl <= 0:
+        return
+    negative_key = _NEGATIVE_PREFIX + cache_key
+    _schedule_cache_write(negative_key, marker, negative_ttl)
+    local_cache.set(negative_key, marker, ttl=negative_ttl)
+
+
+def _raise_negative(marker: dict[str, Any], resource_name: str) -> NoReturn:
+    """Re-raise the error recorded in a negative cache marker."""
+    if marker.get("status") == 403:
+        raise ForbiddenException(message=marker.get("message", "Forbidden"))
+    raise NotFoundException(resource_type=resource_name)
+
+
+# Error mapping helpers (each raises the gateway exception for an upstream error)
+
+_AUTH_ERROR_PATTERN = re.compile(
+    r"(?P<unauthorized>invalid or expired)|(?P<forbidden>access)", re.IGNORECASE
+)
+
+
+def _raise_auth_error(error_msg: str) -> NoReturn:
+    """Map a Riot client authentication ValueError to a gateway exception."""
+    kinds = {match.lastgroup for match in _AUTH_ERROR_PATTERN.finditer(error_msg)}
+    if "unauthorized" in kinds:
+        raise UnauthorizedException(message=error_msg)
+    if "forbidden" in kinds:
+        raise ForbiddenException(message=error_msg)
+    raise InternalServerException(error_type="Authentication error", details=error_msg)
+
+
+def _raise_forbidden(
+    e: httpx.HTTPStatusError,
+    cache_key: str,
+    negative_ttl: int,
+    resource_name: str,
+    context: dict[str, Any],
+) -> NoReturn:
+    """Handle 403, with a more helpful message for Data Dragon."""
+    url = str(e.request.url)
+    if "ddragon" in url.lower():
+        logger.error(f"Data Dragon 403 error for {resource_name}: {e}", url=url, **context)
+        message = f"Data Dragon access forbidden. The 'latest' version alias is no longer supported. Please specify an actual version number or contact support. URL: {url}"
+        _store_negative(cache_key, {"status": 403, "message": message}, negative_ttl)
+        raise ForbiddenException(message=message)
+    raise ForbiddenException()
+
+
+def _raise_not_found(
+    e: httpx.HTTPStatusError,
+    cache_key: str,
+    negative_ttl: int,
+    resource_name: str,
+    context: dict[str, Any],
+) -> NoReturn:
+    """Handle 404, remembering the miss so repeated requests skip the upstream call."""
+    _store_negative(cache_key, {"status": 404}, negative_ttl)
+    raise NotFoundException(resource_type=resource_name)
+
+
+def _raise_rate_limited(
+    e: httpx.HTTPStatusError,
+    cache_key: str,
+    negative_ttl: int,
+    resource_name: str,
+    context: dict[str, Any],
+) -> NoReturn:
+    """Handle 429, propagating the upstream Retry-After."""
+    raise RateLimitException(retry_after=int(e.response.headers.get("Retry-After", 1)))
+
+
+def _raise_upstream_error(
+    e: httpx.HTTPStatusError,
+    cache_key: str,
+    negative_ttl: int,
+    resource_name: str,
+    context: dict[str, Any],
+) -> NoReturn:
+    """Handle 5xx."""
+    logger.error(
+        f"Server error fetching {resource_name}: {e}",
+        status_code=e.response.status_code,
+        url=str(e.request.url),
+        **context,
+    )
+    raise InternalServerException(error_type="Upstream server error", details=str(e))
+
+
+def _raise_http_error(
+    e: httpx.HTTPStatusError,
+    cache_key: str,
+    negative_ttl: int,
+    resource_name: str,
+    context: dict[str, Any],
+) -> NoReturn:
+    """Handle any other HTTP error status."""
+    raise InternalServerException(error_type="HTTP error", details=str(e))
+
+
+_STATUS_HANDLERS: Mapping[
+    int, Callable[[httpx.HTTPStatusError, str, int, str, dict[str, Any]], NoReturn]
+] = {
+    403: _raise_forbidden,
+    404: _raise_not_found,
+    429: _raise_rate_limited,
+}
+
+
+class _SharedFetch:
+    """An upstream fetch task and the number of callers currently awaiting it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+# In-flight fetches keyed by cache key, shared by concurrent cache misses
+_inflight: dict[str, _SharedFetch] = {}
+
+
+def _forget_inflight(cache_key: str, shared: _SharedFetch, task: asyncio.Task) -> None:
+    """Drop a finished fetch from the in-flight table (unless already replaced)."""
+    if _inflight.get(cache_key) is shared:
+        del _inflight[cache_key]
+
+
+# Upper bound on concurrent upstream fetches, per region (Riot limits are per region)
+_upstream_semaphores: dict[str, asyncio.Semaphore] = {}
+
+
+def _upstream_semaphore(context: dict[str, Any]) -> asyncio.Semaphore:
+    """Return the semaphore bounding upstream fetches for the request's region."""
+    region = context.get("region")
+    region = getattr(region, "value", region) or "default"
+    semaphore = _upstream_semaphores.get(region)
+    if semaphore is None:
+        semaphore = _upstream_semaphores[region] = asyncio.Semaphore(
+            settings.riot_max_concurrent_requests
+        )
+    return semaphore
+
+
+# Write coalescing: misses enqueue their SET and a single writer task flushes
+# them in batches (MSET + EXPIRE in one pipeline) every few milliseconds
+_WRITE_BATCH_WINDOW = 0.005  # seconds to wait for more writes before flushing
+_WRITE_MAX_BATCH = 128  # maximum writes per pipeline
+_WRITE_QUEUE_SIZE = 10_000  # above this, writes bypass the queue
+
+_write_queue: asyncio.Queue | None = None
+_writer_task: asyncio.Task | None = None
+
+# Direct fire-and-forget writes used when the queue is full (strong references
+# keep tasks alive until they finish)
+_pending_writes: set[asyncio.Task] = set()
+
+
+def _on_write_done(task: asyncio.Task) -> None:
+    """Forget a finished cache write and log its failure, if any."""
+    _pending_writes.discard(task)
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.warning("Cache write failed: {}", exc)
+
+
+async def _flush_writes(batch: list[tuple[str, Any, int]]) -> None:
+    """
+    Write a batch of entries to Redis, one pipeline per distinct TTL.
+
+    Args:
+        batch: (cache_key, data, ttl) tuples
+    """
+    by_ttl: dict[int, list[tuple[str, Any]]] = {}
+    for cache_key, data, ttl in batch:
+        by_ttl.setdefault(ttl, []).append((cache_key, data))
+
+    for ttl, pairs in by_ttl.items():
+        if not redis_breaker.allow():
+            logger.debug("Redis circuit open, dropping {} cache write(s)", len(pairs))
+            continue
+        try:
+            await cache.multi_set(pairs, ttl=ttl)
+        except Exception as e:
+            redis_breaker.record_failure()
+            logger.warning("Cache write failed for {} key(s): {}", len(pairs), e)
+        else:
+            redis_breaker.record_success()
+
+
+async def _cache_get_many(keys: list[str]) -> list[Any]:
+    """
+    Read several keys from Redis in one MGET, treating errors and slow replies as misses.
+
+    Skips Redis entirely while the circuit breaker is open.
+
+    Args:
+        keys: Redis cache keys
+
+    Returns:
+        One value per key (None on miss, failure or open circuit)
+    """
+    if not redis_breaker.allow():
+        return [None] * len(keys)
+    try:
+        values = await cache.multi_get(keys, timeout=settings.cache_op_timeout)
+    except Exception as e:
+        redis_breaker.record_failure()
+        logger.warning("Cache read failed, falling back to API: {!r}", e)
+        return [None] * len(keys)
+    redis_breaker.record_success()
+    return values
+
+
+async def _writer_loop(queue: asyncio.Queue) -> None:
+    """Drain the write queue, flushing accumulated writes in batches."""
+    while True:
+        batch = [await queue.get()]
+        await asyncio.sleep(_WRITE_BATCH_WINDOW)
+        while len(batch) < _WRITE_MAX_BATCH and not queue.empty():
+            batch.append(queue.get_nowait())
+
+        try:
+            await _flush_writes(batch)
+        finally:
+            for _ in batch:
+                queue.task_done()
+
+
+def _get_write_queue() -> asyncio.Queue:
+    """Return the write queue, starting the writer task for the running loop if needed."""
+    global _write_queue, _writer_task
+
+    loop = asyncio.get_running_loop()
+    queue = _write_queue
+    if (
+        queue is None
+        or _writer_task is None
+        or _writer_task.done()
+        or _writer_task.get_loop() is not loop
+    ):
+        queue = _write_queue = asyncio.Queue(maxsize=_WRITE_QUEUE_SIZE)
+        _writer_task = loop.create_task(_writer_loop(queue))
+    return queue
+
+
+def _schedule_cache_write(cache_key: str, data: Any, ttl: int) -> None:
+    """
+    Store data in Redis without making the caller wait for the acknowledgement.
+
+    Writes are queued for the batching writer; if the queue is full the write
+    is issued directly as a background task. A lost write only costs one extra
+    upstream call later, so failures are logged instead of being surfaced.
+
+    Args:
+        cache_key: Redis cache key
+        data: Data to store
+        ttl: Time-to-live in seconds
+    """
+    try:
+        _get_write_queue().put_nowait((cache_key, data, ttl))
+    except asyncio.QueueFull:
+        task = asyncio.create_task(_flush_writes([(cache_key, data, ttl)]))
+        _pending_writes.add(task)
+        task.add_done_callback(_on_write_done)
+
+
+async def drain_cache_writes() -> None:
+    """Flush all queued and pending cache writes and stop the writer task."""
+    global _writer_task
+
+    if _writer_task is not None and _writer_task.get_loop() is asyncio.get_running_loop():
+        if not _writer_task.done() and _write_queue is not None:
+            await _write_queue.join()
+            _writer_task.cancel()
+        _writer_task = None
+
+    if _pending_writes:
+        await asyncio.gather(*_pending_writes, return_exceptions=True)
+
+
+# Request-path logging: hits and misses are appended to a bounded ring and a
+# background task replays them (DEBUG) and emits a periodic INFO summary, so
+# requests never format log records or touch the log sinks themselves
+_LOG_FLUSH_INTERVAL = 0.1  # seconds between ring drains
+_LOG_SUMMARY_INTERVAL = 60.0  # seconds between hit/miss summary lines
+_LOG_RING_SIZE = 10_000  # oldest records are dropped beyond this
+
+_log_ring: deque[tuple[str, str, dict[str, Any]]] = deque(maxlen=_LOG_RING_SIZE)
+_log_counts: Counter[tuple[str, str]] = Counter()
+_log_task: asyncio.Task | None = None
+
+
+def _record_access(resource_name: str, source: str, context: dict[str, Any]) -> None:
+    """
+    Queue a cache access log record without formatting it.
+
+    Args:
+        resource_name: Human-readable resource name
+        source: "cache" or "riot_api"
+        context: Context data to include in the log
+    """
+    global _log_task
+
+    _log_ring.append((resource_name, source, context))
+    if (
+        _log_task is None
+        or _log_task.done()
+        or _log_task.get_loop() is not asyncio.get_running_loop()
+    ):
+        _log_task = asyncio.get_running_loop().create_task(_log_drain_loop())
+
+
+def _flush_log_ring() -> None:
+    """Replay queued access records to the logger and update hit/miss counts."""
+    while _log_ring:
+        resource_name, source, context = _log_ring.popleft()
+        _log_counts[resource_name, source] += 1
+        logger.debug("{} retrieved from {}", resource_name, source, **{**context, "source": source})
+
+
+def _log_summary() -> None:
+    """Emit one INFO line summarizing cache hits and misses since the last summary."""
+    if not _log_counts:
+        return
+
+    per_resource: dict[str, list[int]] = {}
+    for (resource_name, source), count in _log_counts.items():
+        hits_misses = per_resource.setdefault(resource_name, [0, 0])
+        hits_misses[0 if source == "cache" else 1] += count
+    _log_counts.clear()
+
+    hits = sum(h for h, _ in per_resource.values())
+    misses = sum(m for _, m in per_resource.values())
+    logger.info(
+        "Cache activity: {} hit(s), {} miss(es)",
+        hits,
+        misses,
+        resources={name: {"hits": h, "misses": m} for name, (h, m) in per_resource.items()},
+    )
+
+
+async def _log_drain_loop() -> None:
+    """Drain the access log ring periodically and emit summaries."""
+    loop = asyncio.get_running_loop()
+    next_summary = loop.time() + _LOG_SUMMARY_INTERVAL
+    while True:
+        await asyncio.sleep(_LOG_FLUSH_INTERVAL)
+        _flush_log_ring()
+        if loop.time() >= next_summary:
+            _log_summary()
+            next_summary = loop.time() + _LOG_SUMMARY_INTERVAL
+
+
+def flush_cache_logs() -> None:
+    """Emit all queued access logs and the pending summary, and stop the drain task."""
+    global _log_task
+
+    if _log_task is not None:
+        _log_task.cancel()
+        _log_task = None
+    _flush_log_ring()
+    _log_summary()
+
+
 async def fetch_with_cache(
     cache_key: str,
     resource_name: str,
@@ -118,6 +540,7 @@ async def fetch_with_cache(
     ttl: int,
     context: dict[str, Any] | None = None,
     force_refresh: bool = False,
+    negative_cache: bool = False,
 ) -> Any:
     """
     Fetch data with automatic caching and consistent logging.
@@ -132,6 +555,8 @@ async def fetch_with_cache(
         ttl: Time-to-live for the cached data in seconds
         context: Optional dict of context data to include in logs (e.g., {"region": "euw1", "match_id": "EUW1_123"})
         force_refresh: If True, bypass cache and force fetch from API
+        negative_cache: If True, remember upstream 404s (and Data Dragon 403s) for
+            min(CACHE_TTL_NEGATIVE, ttl) seconds and re-raise them without calling the API
 
     Returns:
         The fetched or cached data
@@ -148,67 +573,117 @@ async def fetch_with_cache(
         ... )
     """
     context = context or {}
+    negative_ttl = min(settings.cache_ttl_negative, ttl) if negative_cache else 0
 
     # Check cache (unless force refresh)
     if not force_refresh:
-        cached_data = await cache.get(cache_key)
+        cached_data = local_cache.get(cache_key)
+        if not cached_data:
+            negative_key = _NEGATIVE_PREFIX + cache_key
+            negative = local_cache.get(negative_key) if negative_ttl else None
+            if negative is None:
+                # Positive and negative entries in a single round trip
+                lookup_keys = [cache_key, negative_key] if negative_ttl else [cache_key]
+                cached_data, *markers = await _cache_get_many(lookup_keys)
+                negative = markers[0] if markers else None
+                if cached_data:
+                    # The Redis entry's remaining TTL is unknown: keep the L1 copy short
+                    local_cache.set(cache_key, cached_data, ttl=min(settings.cache_l1_ttl, ttl))
+                elif negative:
+                    local_cache.set(negative_key, negative, ttl=negative_ttl)
+            if negative and not cached_data:
+                _record_access(resource_name, "cache", context)
+                _raise_negative(negative, resource_name)
         if cached_data:
-            log_context = context.copy()
-            log_context["source"] = "cache"
-            logger.info(f"{resource_name} retrieved from cache", **log_context)
+            _record_access(resource_name, "cache", context)
             return cached_data
 
+    return await _fetch_coalesced(cache_key, resource_name, fetch_fn, ttl, negative_ttl, context)
+
+
+async def _fetch_coalesced(
+    cache_key: str,
+    resource_name: str,
+    fetch_fn: Callable[[], Awaitable[Any]],
+    ttl: int,
+    negative_ttl: int,
+    context: dict[str, Any],
+) -> Any:
+    """
+    Fetch a missing key, sharing one upstream call between concurrent callers.
+
+    The fetch runs in its own task rather than in the first caller, and each
+    caller awaits it through asyncio.shield(). A cancelled caller (e.g. a
+    client that disconnected) therefore never cancels the fetch for the
+    others; the task is only cancelled once no caller is waiting for it.
+
+    Args:
+        cache_key: Redis cache key for storing the data
+        resource_name: Human-readable resource name for logging
+        fetch_fn: Async callable that fetches data from Riot API
+        ttl: Time-to-live for the cached data in seconds
+        negative_ttl: Lifetime of a 404/403 marker in seconds (0 disables it)
+        context: Context data to include in logs
+
+    Returns:
+        The fetched data
+    """
+    # Coalesce concurrent misses: the first caller starts the fetch, all of them wait
+    shared = _inflight.get(cache_key)
+    if shared is None:
+        task = asyncio.get_running_loop().create_task(
+            _fetch_and_store(cache_key, resource_name, fetch_fn, ttl, negative_ttl, context)
+        )
+        shared = _inflight[cache_key] = _SharedFetch(task)
+        task.add_done_callback(partial(_forget_inflight, cache_key, shared))
+
+    shared.waiters += 1
+    try:
+        return await asyncio.shield(shared.task)
+    finally:
+        shared.waiters -= 1
+        if not shared.waiters and not shared.task.done():
+            # Every caller gave up: stop the upstream call
+            shared.task.cancel()
+
+
+async def _fetch_and_store(
+    cache_key: str,
+    resource_name: str,
+    fetch_fn: Callable[[], Awaitable[Any]],
+    ttl: int,
+    negative_ttl: int,
+    context: dict[str, Any],
+) -> Any:
+    """
+    Fetch data from the upstream API, map errors and store the result in cache.
+
+    Args:
+        cache_key: Redis cache key for storing the data
+        resource_name: Human-readable resource name for logging
+        fetch_fn: Async callable that fetches data from Riot API
+        ttl: Time-to-live for the cached data in seconds
+        negative_ttl: Lifetime of a 404/403 marker in seconds (0 disables it)
+        context: Context data to include in logs
+
+    Returns:
+        The fetched data
+    """
     # Fetch from Riot API
-    log_context = context.copy()
-    log_context["source"] = "riot_api"
-    logger.info(f"{resource_name} retrieved from Riot API", **log_context)
+    _record_access(resource_name, "riot_api", context)
 
     try:
-        data = await fetch_fn()
+        async with _upstream_semaphore(context):
+            data = await fetch_fn()
     except ValueError as e:
         # Handle authentication/authorization errors from Riot client
-        error_msg = str(e)
-        if "invalid or expired" in error_msg.lower():
-            raise UnauthorizedException(message=error_msg)
-        elif "access" in error_msg.lower():
-            raise ForbiddenException(message=error_msg)
-        else:
-            raise InternalServerException(error_type="Authentication error", details=error_msg)
+        _raise_auth_error(str(e))
     except httpx.HTTPStatusError as e:
         # Handle HTTP errors from API calls
-        error_msg = str(e)
-
-        # Special handling for Data Dragon 403 errors
-        if e.response.status_code == 403:
-            if "ddragon" in str(e.request.url).lower():
-                logger.error(
-                    f"Data Dragon 403 error for {resource_name}: {error_msg}",
-                    url=str(e.request.url),
-                    **context,
-                )
-                # Provide more helpful error message for Data Dragon
-                raise ForbiddenException(
-                    message=f"Data Dragon access forbidden. The 'latest' version alias is no longer supported. Please specify an actual version number or contact support. URL: {e.request.url}"
-                )
-            else:
-                raise ForbiddenException()
-
-        # Handle other HTTP status codes
-        if e.response.status_code == 404:
-            raise NotFoundException(resource_type=resource_name)
-        elif e.response.status_code == 429:
-            retry_after = int(e.response.headers.get("Retry-After", 1))
-            raise RateLimitException(retry_after=retry_after)
-        elif 500 <= e.response.status_code < 600:
-            logger.error(
-                f"Server error fetching {resource_name}: {error_msg}",
-                status_code=e.response.status_code,
-                url=str(e.request.url),
-                **context,
-            )
-            raise InternalServerException(error_type="Upstream server error", details=error_msg)
-        else:
-            raise InternalServerException(error_type="HTTP error", details=error_msg)
+        handler = _STATUS_HANDLERS.get(e.response.status_code)
+        if handler is None:
+            handler = _raise_upstream_error if e.response.status_code >= 500 else _raise_http_error
+        handler(e, cache_key, negative_ttl, resource_name, context)
     except RiotAPIException:
         # Re-raise our custom API exceptions without wrapping
         raise
@@ -217,8 +692,9 @@ async def fetch_with_cache(
         logger.error(f"Unexpected error fetching {resource_name}: {e}", **context)
         raise InternalServerException(error_type="Unexpected error", details=str(e))
 
-    # Store in cache
-    await cache.set(cache_key, data, ttl=ttl)
-    logger.success(f"{resource_name} fetched and cached", **context)
+    # Store in cache (Redis write is not awaited)
+    _schedule_cache_write(cache_key, data, ttl)
+    local_cache.set(cache_key, data, ttl=min(settings.cache_l1_ttl, ttl))
+    known_keys.add(cache_key, ttl)
 
     return data
@@ -0,0 +1,127 @@
+"""In-process L1 cache sitting in front of Redis.
+
+This module provides a small, bounded, TTL-aware cache that lives inside each
+gateway worker process. It holds already-deserialized Python objects so that hot
+keys (champion rotation, platform status, static Data Dragon payloads) are served
+with a dict lookup instead of a Redis round trip plus JSON decoding.
+
+Cache Layers:
+    Request → L1 (process memory) → L2 (Redis) → Riot API
+
+    - L1 entries are short-lived (CACHE_L1_TTL, default 60 seconds) so that
+      workers never drift far from the shared Redis state
+    - An entry lives min(CACHE_L1_TTL, endpoint TTL) seconds from the moment
+      it is stored in L1. An entry copied from a Redis hit starts a fresh
+      lifetime, so it can outlive the Redis entry by up to CACHE_L1_TTL
+    - The cache is bounded (CACHE_L1_MAXSIZE entries); the least recently used
+      entry is evicted when the limit is reached
+
+Consistency:
+    Each worker has its own L1, so an update written by one worker becomes
+    visible to the others once their L1 entry expires. This is acceptable for
+    the gateway's data, which is already served with TTL-based staleness.
+
+Usage:
+    ```python
+    from app.cache.memory import local_cache
+
+    local_cache.set("champion:rotation:euw1", data, ttl=86400)
+    data = local_cache.get("champion:rotation:euw1")
+    ```
+
+See Also:
+    app.cache.helpers: fetch_with_cache, which consults this cache first
+    app.cache.redis_cache: Shared Redis cache (L2)
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any
+
+from app.config import settings
+
+
+class MemoryCache:
+    """Bounded in-process cache with per-entry expiry.
+
+    Entries are stored as ``key -> (expires_at, value)`` in an OrderedDict kept
+    in least-recently-used order. Expired entries are dropped lazily on access.
+
+    Attributes:
+        maxsize (int): Maximum number of entries kept in memory
+        ttl (int): Upper bound (seconds) for the lifetime of any entry
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: int = 60):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries before LRU eviction kicks in
+            ttl: Maximum lifetime of an entry in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Any | None:
+        """
+        Get a value from the cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        """
+        Store a value in the cache.
+
+        Args:
+            key: Cache key
+            value: Deserialized value to store
+            ttl: Lifetime in seconds, capped at the cache-wide ttl
+        """
+        if self.maxsize <= 0 or self.ttl <= 0:
+            return
+
+        lifetime = self.ttl if ttl is None else min(ttl, self.ttl)
+        self._data[key] = (time.monotonic() + lifetime, value)
+        self._data.move_to_end(key)
+
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: str) -> None:
+        """
+        Remove a key from the cache if present.
+
+        Args:
+            key: Cache key
+        """
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        """Return the number of entries currently held (including expired ones)."""
+        return len(self._data)
+
+
+# Global in-process cache instance
+local_cache = MemoryCache(maxsize=settings.cache_l1_maxsize, ttl=settings.cache_l1_ttl)
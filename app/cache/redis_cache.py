@@ -1,4 +1,4 @@
-"""Redis cache configuration and management using aiocache library.
+"""Redis cache configuration and management using redis.asyncio.
 
 This module provides the Redis caching infrastructure for the gateway application.
 It implements TTL-based (Time-To-Live) caching for Riot API responses to minimize
@@ -25,6 +25,12 @@ Cache Key Structure:
     The "lol" prefix (namespace) prevents key collisions with other applications
     sharing the same Redis instance.
 
+    Riot API routers build every key with key_for(resource, region, ident),
+    which reuses a cached, interned "resource:region:" prefix so requests only
+    concatenate the identifier, and renders region enums by their value.
+    Static Data Dragon / Community Dragon keys have no region and are
+    formatted directly.
+
 TTL Configuration:
     Different data types have different staleness tolerances:
     - Static data (champion rotation): 24 hours
@@ -45,7 +51,8 @@ Redis Configuration:
     The module creates a global cache instance at import time.
 
 Serialization:
-    - Uses JsonSerializer from aiocache for automatic JSON encoding/decoding
+    - Values are encoded with orjson straight to bytes and decoded from the
+      raw bytes Redis returns
     - Handles Python dicts, lists, and primitives automatically
     - Response data from Riot API is already in JSON-compatible format
 
@@ -56,18 +63,30 @@ Error Handling:
     - Timeout errors: Logged and bypass cache
 
     The gateway can operate without Redis (degraded performance mode).
+    Repeated failures open a circuit breaker (redis_breaker) so requests skip
+    Redis entirely instead of each waiting for a timeout; after a cooldown a
+    single request probes Redis and closes the breaker on success.
+
+Invalidation:
+    Keys written through fetch_with_cache are indexed in a prefix trie of
+    ":"-separated segments (known_keys), so RedisCache.invalidate_prefix() can remove e.g. all
+    "summoner:euw1:" entries with pipelined UNLINKs instead of SCAN + DEL.
 
 Health Monitoring:
     The RedisCache class provides a ping() method for health checks:
     - Used by /health endpoint
-    - Tests actual Redis connectivity
+    - Tests actual Redis connectivity with a single PING
     - Returns boolean status
 
 Performance Considerations:
-    - Connection pooling handled by aiocache/aioredis
+    - A single connection pool (REDIS_MAX_CONNECTIONS, default 100) is shared
+      by the cache and the match tracker; callers wait for a free connection
+      when the cap is reached, for at most REDIS_POOL_TIMEOUT seconds
     - Async operations prevent blocking
-    - Namespace prefix adds minimal overhead
-    - JSON serialization is efficient for API responses
+    - NamespacedCache calls redis.asyncio directly; the namespace prefix is a
+      single string concatenation per key
+    - orjson (de)serializes large payloads such as match timelines several
+      times faster than the stdlib json module
 
 Usage:
     This module exports a global `cache` instance that should be used
@@ -95,21 +114,187 @@ See Also:
     app.config: Redis configuration settings
 """
 
-from aiocache import Cache
-from aiocache.serializers import JsonSerializer
+import asyncio
+import sys
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Any
+
+import orjson
+import redis.asyncio as redis
 from loguru import logger
 
+from app.cache.memory import local_cache
 from app.config import settings
 
 
-# Global cache instance configured for Redis
-cache = Cache(
-    Cache.REDIS,
-    endpoint=settings.redis_host,
+class NamespacedCache:
+    """Thin async cache over redis.asyncio with orjson values and a key namespace.
+
+    Exposes the small get/set/delete/multi_get/multi_set subset of the aiocache
+    API the gateway uses, but calls redis-py directly: one key concatenation
+    and one orjson call around each command, with no plugin hooks, serializer
+    dispatch or per-call connection handling. Values are stored as plain JSON,
+    so entries written by the previous aiocache setup remain readable.
+
+    Attributes:
+        client (redis.Redis): Underlying redis.asyncio client
+        namespace (str): Prefix joined to every key with ":"
+    """
+
+    def __init__(self, client: redis.Redis, namespace: str = "lol"):
+        """
+        Initialize the cache.
+
+        Args:
+            client: redis.asyncio client to issue commands with
+            namespace: Prefix for all keys
+        """
+        self.client = client
+        self.namespace = namespace
+        self._prefix = f"{namespace}:"
+
+    def build_key(self, key: str) -> str:
+        """Return the namespaced Redis key for a cache key."""
+        return self._prefix + key
+
+    @staticmethod
+    def dumps(value: Any) -> bytes:
+        """Serialize a value to JSON bytes (non-str dict keys are stringified, as with json)."""
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+    @staticmethod
+    def loads(value: bytes | None) -> Any:
+        """Deserialize JSON bytes, returning None for missing keys."""
+        if value is None:
+            return None
+        return orjson.loads(value)
+
+    async def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get a value from the cache.
+
+        Args:
+            key: Cache key (without namespace)
+            default: Value returned when the key is missing
+
+        Returns:
+            The deserialized value, or default if missing or expired
+        """
+        value = await self.client.get(self._prefix + key)
+        return default if value is None else orjson.loads(value)
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
+        """
+        Store a value in the cache.
+
+        Args:
+            key: Cache key (without namespace)
+            value: JSON-serializable value
+            ttl: Time-to-live in seconds (None or 0 for no expiry)
+
+        Returns:
+            True once stored
+        """
+        return bool(await self.client.set(self._prefix + key, self.dumps(value), ex=ttl or None))
+
+    async def delete(self, key: str) -> int:
+        """
+        Delete a key from the cache with UNLINK.
+
+        UNLINK reclaims the value's memory in a background thread, so deleting
+        a large value never blocks Redis the way DEL would.
+
+        Args:
+            key: Cache key (without namespace)
+
+        Returns:
+            Number of keys removed (0 or 1)
+        """
+        return int(await self.client.unlink(self._prefix + key))
+
+    async def exists(self, key: str) -> bool:
+        """Return whether a key is present in the cache."""
+        return bool(await self.client.exists(self._prefix + key))
+
+    async def multi_get(self, keys: list[str], timeout: float | None = None) -> list[Any]:
+        """
+        Get several values with a single MGET.
+
+        The timeout covers the MGET call only (including the wait for a pool
+        connection, which the pool bounds on its own with REDIS_POOL_TIMEOUT);
+        decoding the values is not counted, so a large payload is not mistaken
+        for a slow Redis.
+
+        Args:
+            keys: Cache keys (without namespace)
+            timeout: Seconds to wait for the reply (None waits indefinitely)
+
+        Returns:
+            Deserialized values in the same order, None for missing keys
+
+        Raises:
+            TimeoutError: If Redis does not reply within timeout
+        """
+        prefix = self._prefix
+        values = await asyncio.wait_for(self.client.mget([prefix + key for key in keys]), timeout)
+        return [None if value is None else orjson.loads(value) for value in values]
+
+    async def multi_set(self, pairs: list[tuple[str, Any]], ttl: int | None = None) -> bool:
+        """
+        Store several values in one pipelined round trip.
+
+        Each pair is written with its own SET ... EX, so a value never exists
+        without its expiry.
+
+        Args:
+            pairs: (key, value) pairs (keys without namespace)
+            ttl: Time-to-live in seconds applied to every pair
+
+        Returns:
+            True once stored
+        """
+        ex = ttl or None
+        async with self.client.pipeline(transaction=False) as pipe:
+            for key, value in pairs:
+                pipe.set(self._prefix + key, self.dumps(value), ex=ex)
+            await pipe.execute()
+        return True
+
+    async def clear(self) -> bool:
+        """Remove every key in the current Redis database."""
+        return bool(await self.client.flushdb())
+
+    async def raw(self, command: str, *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a redis-py client method by name (e.g., raw("ping")).
+
+        Args:
+            command: Name of the redis.asyncio.Redis method
+            *args: Positional arguments for the command
+            **kwargs: Keyword arguments for the command
+
+        Returns:
+            The command's raw result
+        """
+        return await getattr(self.client, command)(*args, **kwargs)
+
+
+# Connection pool shared with other Redis users (e.g. the match tracker);
+# callers wait for a free connection once the cap is reached
+connection_pool = redis.BlockingConnectionPool(
+    host=settings.redis_host,
     port=settings.redis_port,
     db=settings.redis_db,
     password=settings.redis_password if settings.redis_password else None,
-    serializer=JsonSerializer(),
+    max_connections=settings.redis_max_connections,
+    timeout=settings.redis_pool_timeout,
+)
+
+# Global cache instance configured for Redis
+cache = NamespacedCache(
+    redis.Redis(connection_pool=connection_pool),
     namespace="lol",  # Prefix for all cache keys
 )
 
@@ -121,6 +306,280 @@ logger.info(
 )
 
 
+@lru_cache(maxsize=1024)
+def _key_prefix(resource: str, region: str) -> str:
+    """Build and intern the "resource:region:" prefix shared by a family of keys."""
+    region = getattr(region, "value", region)  # Region enums contribute their value
+    return sys.intern(f"{resource}:{region}:")
+
+
+@lru_cache(maxsize=1024)
+def _region_key(resource: str, region: str) -> str:
+    """Build and intern the "resource:region" key of a per-region resource."""
+    return sys.intern(_key_prefix(resource, region)[:-1])
+
+
+def key_for(resource: str, region: str, ident: str | None = None) -> str:
+    """Build a cache key from a resource, a region and an identifier.
+
+    The "resource:region:" prefix is computed once per (resource, region) pair
+    and reused, so each request only concatenates the identifier. Resources
+    with one entry per region (e.g. featured games) omit the identifier and
+    get the cached "resource:region" key itself. Keys are passed to the cache
+    without namespace (the cache adds "lol:").
+
+    Args:
+        resource: Resource family (e.g., "summoner:puuid", "match:timeline")
+        region: Region code or region enum (e.g., "euw1", PlatformRegion.EUROPE)
+        ident: Resource identifier (e.g., a PUUID or match ID), or None for
+            per-region resources
+
+    Returns:
+        str: Cache key such as "summoner:puuid:euw1:abc123"
+
+    Example:
+        ```python
+        key_for("match", "europe", "EUW1_123")  # "match:europe:EUW1_123"
+        key_for("spectator:featured", "euw1")  # "spectator:featured:euw1"
+        ```
+    """
+    if ident is None:
+        return _region_key(resource, region)
+    return _key_prefix(resource, region) + ident
+
+
+class RedisBreaker:
+    """Circuit breaker that lets callers bypass Redis while it is unhealthy.
+
+    States:
+        - closed: Redis is used normally; failures are counted
+        - open: Redis is skipped until the cooldown has elapsed
+        - half_open: after the cooldown one request probes Redis; success
+          closes the breaker, failure opens it again
+
+    Only one probe is let through per cooldown period, so a probe that never
+    reports back cannot keep the breaker stuck.
+
+    Attributes:
+        threshold (int): Failures within the window that open the breaker
+        window (float): Seconds over which failures are counted
+        cooldown (float): Seconds the breaker stays open before probing
+        state (str): Current state ("closed", "open" or "half_open")
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, threshold: int = 5, window: float = 10, cooldown: float = 30):
+        """
+        Initialize a closed breaker.
+
+        Args:
+            threshold: Failures within the window that open the breaker
+            window: Seconds over which failures are counted
+            cooldown: Seconds the breaker stays open before probing
+        """
+        self.threshold = threshold
+        self.window = window
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self.opened_at = 0.0
+        self._failures: deque[float] = deque()
+
+    def allow(self) -> bool:
+        """
+        Check whether a Redis call may be attempted.
+
+        Returns:
+            True if Redis should be used, False to bypass it
+        """
+        if self.state == self.CLOSED:
+            return True
+
+        now = time.monotonic()
+        if now - self.opened_at < self.cooldown:
+            return False
+
+        # Let one probe through per cooldown period
+        self.state = self.HALF_OPEN
+        self.opened_at = now
+        return True
+
+    def record_success(self) -> None:
+        """Record a successful Redis call, closing the breaker if needed."""
+        if self.state != self.CLOSED:
+            logger.info("Redis circuit breaker closed, cache re-enabled")
+            self.state = self.CLOSED
+            self._failures.clear()
+
+    def record_failure(self) -> None:
+        """Record a failed or timed-out Redis call, opening the breaker if needed."""
+        now = time.monotonic()
+        if self.state == self.HALF_OPEN:
+            self._open(now)
+            return
+
+        self._failures.append(now)
+        while self._failures and now - self._failures[0] > self.window:
+            self._failures.popleft()
+        if self.state == self.CLOSED and len(self._failures) >= self.threshold:
+            self._open(now)
+
+    def reset(self) -> None:
+        """Return to the closed state and forget past failures."""
+        self.state = self.CLOSED
+        self.opened_at = 0.0
+        self._failures.clear()
+
+    def _open(self, now: float) -> None:
+        """Open the breaker for one cooldown period."""
+        self.state = self.OPEN
+        self.opened_at = now
+        self._failures.clear()
+        logger.warning("Redis circuit breaker opened, bypassing cache for {}s", self.cooldown)
+
+
+# Global breaker guarding cache reads and writes in fetch_with_cache
+redis_breaker = RedisBreaker(
+    threshold=settings.cache_breaker_threshold,
+    window=settings.cache_breaker_window,
+    cooldown=settings.cache_breaker_cooldown,
+)
+
+_END = None  # Trie node marker holding the key's expiry deadline
+_SEP = ":"  # Cache key segment separator
+_UNLINK_CHUNK = 500  # Keys per UNLINK command
+
+
+class KeyTrie:
+    """Prefix tree of cache keys written by this process.
+
+    Lets a prefix such as "summoner:euw1:" be resolved to its keys without a
+    SCAN over the whole Redis keyspace. Nodes are ":"-separated key segments
+    rather than characters, so the index holds one small dict per segment;
+    a prefix ending inside a segment ("summoner:eu") is matched against the
+    child segments of its last complete one.
+
+    Each key stores its expiry deadline so that expired keys are skipped.
+    The index is bounded by maxsize: once full, expired keys are pruned at
+    most once per prune_interval and new keys are ignored in between, so
+    inserts never walk the whole trie on the hot path.
+
+    Attributes:
+        maxsize (int): Maximum number of keys tracked
+        prune_interval (float): Minimum seconds between two prunes of a full index
+    """
+
+    def __init__(self, maxsize: int = 100_000, prune_interval: float = 60.0):
+        """
+        Initialize an empty trie.
+
+        Args:
+            maxsize: Maximum number of keys tracked before new keys are ignored
+            prune_interval: Minimum seconds between two prunes of a full index
+        """
+        self.maxsize = maxsize
+        self.prune_interval = prune_interval
+        self._root: dict = {}
+        self._size = 0
+        self._next_prune = 0.0
+
+    def add(self, key: str, ttl: int) -> None:
+        """
+        Track a key written to the cache.
+
+        Args:
+            key: Cache key (without namespace)
+            ttl: Time-to-live of the key in seconds
+        """
+        now = time.monotonic()
+        if self._size >= self.maxsize:
+            if now < self._next_prune:
+                return
+            self.prune()
+            self._next_prune = now + self.prune_interval
+            if self._size >= self.maxsize:
+                return
+
+        node = self._root
+        for segment in key.split(_SEP):
+            node = node.setdefault(segment, {})
+        if _END not in node:
+            self._size += 1
+        node[_END] = now + ttl
+
+    def pop_prefix(self, prefix: str) -> list[str]:
+        """
+        Remove and return all live keys starting with prefix.
+
+        Args:
+            prefix: Key prefix (without namespace)
+
+        Returns:
+            Unexpired keys that were tracked under the prefix
+        """
+        *segments, partial = prefix.split(_SEP)
+        parents = []
+        node = self._root
+        for segment in segments:
+            next_node = node.get(segment)
+            if next_node is None:
+                return []
+            parents.append((node, segment))
+            node = next_node
+
+        now = time.monotonic()
+        keys = []
+        removed = 0
+        base = _SEP.join(segments)
+        for segment in [s for s in node if s is not _END and s.startswith(partial)]:
+            stack = [(node.pop(segment), f"{base}{_SEP}{segment}" if segments else segment)]
+            while stack:
+                current, path = stack.pop()
+                for child_segment, child in current.items():
+                    if child_segment is _END:
+                        removed += 1
+                        if child > now:
+                            keys.append(path)
+                    else:
+                        stack.append((child, f"{path}{_SEP}{child_segment}"))
+
+        # Drop ancestors left empty
+        while parents and not node:
+            parent, segment = parents.pop()
+            del parent[segment]
+            node = parent
+        self._size -= removed
+        return keys
+
+    def prune(self) -> None:
+        """Drop expired keys from the trie."""
+        now = time.monotonic()
+
+        def _prune(node: dict) -> int:
+            removed = 0
+            expires_at = node.get(_END)
+            if expires_at is not None and expires_at <= now:
+                del node[_END]
+                removed += 1
+            for segment in [s for s in node if s is not _END]:
+                removed += _prune(node[segment])
+                if not node[segment]:
+                    del node[segment]
+            return removed
+
+        self._size -= _prune(self._root)
+
+    def __len__(self) -> int:
+        """Return the number of tracked keys (including expired ones)."""
+        return self._size
+
+
+# Keys written through fetch_with_cache by this process, for prefix invalidation
+known_keys = KeyTrie()
+
+
 class RedisCache:
     """Redis cache wrapper providing health monitoring and connectivity testing.
 
@@ -129,11 +588,11 @@ class RedisCache:
     to verify Redis availability.
 
     The wrapper is intentionally minimal, delegating most operations to the
-    underlying aiocache instance while providing specific health monitoring
+    underlying cache instance while providing specific health monitoring
     capabilities.
 
     Attributes:
-        cache (Cache): The underlying aiocache instance configured for Redis
+        cache (NamespacedCache): The underlying cache instance configured for Redis
 
     Example:
         ```python
@@ -155,15 +614,14 @@ class RedisCache:
         self.cache = cache
 
     async def ping(self) -> bool:
-        """Tests Redis connectivity and basic operations.
+        """Tests Redis connectivity with a native PING.
 
         This method verifies that Redis is:
         - Reachable from the application
-        - Accepting connections
-        - Able to perform basic read/write operations
+        - Accepting connections and answering commands
 
-        The test performs a complete write-read-delete cycle to ensure
-        full functionality rather than just TCP connectivity.
+        A single PING costs one round trip and, unlike a write-read-delete
+        cycle, does not touch the keyspace or the appendonly file.
 
         Returns:
             bool: True if Redis is healthy and responsive, False if any
@@ -172,8 +630,6 @@ class RedisCache:
         Note:
             - This method never raises exceptions; failures return False
             - All errors are logged for debugging
-            - Test uses a temporary key that is immediately deleted
-            - 10-second TTL ensures cleanup even if delete fails
 
         Example:
             ```python
@@ -186,11 +642,47 @@ class RedisCache:
             ```
         """
         try:
-            # Use a simple GET operation as ping equivalent
-            await self.cache.set("health_check", "ok", ttl=10)
-            result: str | None = await self.cache.get("health_check")
-            await self.cache.delete("health_check")
-            return result == "ok"
+            return bool(await self.cache.raw("ping"))
         except Exception as exc:
             logger.error(f"Redis ping failed: {exc}")
             return False
+
+    async def invalidate_prefix(self, prefix: str) -> int:
+        """Delete every known cache key starting with prefix.
+
+        Keys are resolved through the in-process key trie rather than a
+        SCAN MATCH over the whole keyspace, then removed with pipelined
+        non-blocking UNLINK commands in a single round trip. Matching
+        entries are also dropped from the L1 cache.
+
+        Args:
+            prefix: Key prefix without namespace (e.g., "summoner:euw1:")
+
+        Returns:
+            int: Number of keys invalidated
+
+        Note:
+            Only keys written by this process are known; entries cached by
+            other gateway instances expire through their TTL.
+
+        Example:
+            ```python
+            redis = RedisCache()
+            await redis.invalidate_prefix("summoner:euw1:")
+            ```
+        """
+        keys = known_keys.pop_prefix(prefix)
+        if not keys:
+            return 0
+
+        for key in keys:
+            local_cache.pop(key)
+
+        namespaced = [f"{self.cache.namespace}:{key}" for key in keys]
+        async with self.cache.client.pipeline(transaction=False) as pipe:
+            for i in range(0, len(namespaced), _UNLINK_CHUNK):
+                pipe.unlink(*namespaced[i : i + _UNLINK_CHUNK])
+            await pipe.execute()
+
+        logger.info("Invalidated {} cache key(s) with prefix {}", len(keys), prefix)
+        return len(keys)
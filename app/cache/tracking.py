@@ -1,48 +1,178 @@
 """
-Match tracking service using Redis SETs.
+Match tracking service using Redis SETs or Bloom filters.
 
 Provides permanent tracking of processed matches to avoid reprocessing.
-Uses Redis SETs with NO TTL - data persists across restarts via appendonly file.
+Data has NO TTL - it persists across restarts via appendonly file.
+
+Local Mirror (set backend, MATCH_TRACKING_LOCAL_MIRROR, off by default):
+    When enabled, each worker keeps an in-memory copy of the processed sets so that
+    is_processed() answers without a Redis round trip. The mirror is loaded
+    with SSCAN on startup and kept current through the
+    "processed:events" pub/sub channel, on which every mark_processed() call
+    publishes "region:match_id". The sets only ever grow, so a mirror can be
+    missing a very recent mark from another worker but never holds a match
+    that is not in Redis. Regions not mirrored fall back to SISMEMBER.
+
+Backends (MATCH_TRACKING_BACKEND):
+    - "set" (default): exact membership with a Redis SET per region
+    - "bloom": a RedisBloom filter per region for membership plus a
+      HyperLogLog for the processed count. Uses a fraction of the memory of
+      a SET; a false positive only means the match is looked up in the cache
+      before being fetched. Requires the RedisBloom module (Redis Stack or
+      Redis 8+).
 """
 
+import asyncio
+from typing import Awaitable, cast
+
 import redis.asyncio as redis
+from redis.asyncio.client import PubSub
 from loguru import logger
 
+from app.cache.redis_cache import connection_pool
 from app.config import settings
+from app.models.common import PlatformRegion
+
+# Pub/sub channel carrying "region:match_id" for every newly processed match
+EVENTS_CHANNEL = "processed:events"
 
 
 class MatchTracker:
     """
-    Track processed matches in Redis using SET data structure.
+    Track processed matches in Redis.
+
+    Key patterns:
+        - "set" backend: processed_matches:{region} (SET)
+        - "bloom" backend: processed_matches_bf:{region} (Bloom filter) and
+          processed_matches_hll:{region} (HyperLogLog)
 
-    Key pattern: processed_matches:{region}
     No TTL - permanent storage backed by Redis appendonly file.
     """
 
     def __init__(self):
         """Initialize tracker (connection established on startup)."""
         self.redis: redis.Redis | None = None
+        self.use_bloom = settings.match_tracking_backend == "bloom"
+        self._local: dict[str, set[str]] = {}
+        self._pubsub: PubSub | None = None
+        self._listener: asyncio.Task | None = None
         logger.info("Match tracker initialized (connection pending)")
 
     async def connect(self):
         """
-        Establish Redis connection.
+        Establish Redis connection and load the local mirror, if enabled.
 
+        Reuses the cache's connection pool instead of opening a second one.
         Should be called during FastAPI startup event.
         """
-        redis_url = f"redis://{settings.redis_host}:{settings.redis_port}/{settings.redis_db}"
-        if settings.redis_password:
-            redis_url = f"redis://:{settings.redis_password}@{settings.redis_host}:{settings.redis_port}/{settings.redis_db}"
-
-        self.redis = await redis.from_url(redis_url, decode_responses=True)
+        self.redis = redis.Redis(connection_pool=connection_pool)
         logger.success("Match tracker connected to Redis")
 
+        if not self.use_bloom and settings.match_tracking_local_mirror:
+            await self._start_mirror()
+
     async def close(self):
-        """Close Redis connection."""
+        """Close Redis connection (the shared pool stays open for the cache)."""
+        await self._stop_mirror()
         if self.redis:
-            await self.redis.close()
+            await self.redis.aclose()
             logger.info("Match tracker connection closed")
 
+    async def _start_mirror(self):
+        """
+        Subscribe to processed events and load every region's set into memory.
+
+        The subscription is made before loading so that matches marked while
+        the sets are being scanned are not lost. If Redis is unavailable the
+        mirror stays empty and lookups go to Redis.
+        """
+        if self.redis is None:
+            return
+
+        try:
+            self._pubsub = self.redis.pubsub()
+            await self._pubsub.subscribe(EVENTS_CHANNEL)
+
+            self._local = await self._load_sets([region.value for region in PlatformRegion])
+        except Exception as e:
+            logger.warning("Match tracker mirror unavailable, using Redis lookups: {}", e)
+            await self._stop_mirror()
+            return
+
+        self._listener = asyncio.create_task(self._listen())
+        logger.info(
+            "Match tracker mirror loaded: {} match(es)",
+            sum(len(members) for members in self._local.values()),
+        )
+
+    async def _load_sets(self, regions: list[str]) -> dict[str, set[str]]:
+        """
+        Read the processed SETs of several regions with pipelined SSCANs.
+
+        Every round trip carries one SSCAN per region whose cursor has not
+        returned to 0, so small sets are all read in a single round trip
+        instead of one per region.
+
+        Args:
+            regions: Region codes to load
+
+        Returns:
+            Members of each region's SET, keyed by region
+        """
+        assert self.redis is not None
+        members: dict[str, set[str]] = {region: set() for region in regions}
+        cursors = dict.fromkeys(regions, 0)
+        while cursors:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for region, cursor in cursors.items():
+                    pipe.sscan(f"processed_matches:{region}", cursor=cursor, count=1000)
+                results = await pipe.execute()
+
+            next_cursors = {}
+            for region, (cursor, batch) in zip(cursors, results):
+                members[region].update(match_id.decode() for match_id in batch)
+                if cursor:
+                    next_cursors[region] = cursor
+            cursors = next_cursors
+        return members
+
+    async def _stop_mirror(self):
+        """Stop the pub/sub listener and drop the local mirror."""
+        if self._listener:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._listener = None
+        if self._pubsub:
+            try:
+                await self._pubsub.aclose()
+            except Exception:
+                pass
+            self._pubsub = None
+        self._local.clear()
+
+    async def _listen(self):
+        """Apply processed events published by any worker to the local mirror."""
+        if self._pubsub is None:
+            return
+
+        try:
+            async for message in self._pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                region, _, match_id = message["data"].decode().partition(":")
+                members = self._local.get(region)
+                if members is not None:
+                    members.add(match_id)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Without events the mirror would go stale; fall back to Redis lookups
+            logger.warning("Match tracker mirror disconnected, using Redis lookups: {}", e)
+            self._local.clear()
+
     async def is_processed(self, region: str, match_id: str) -> bool:
         """
         Check if a match has already been processed.
@@ -58,6 +188,16 @@ class MatchTracker:
             logger.warning("Redis not connected, assuming match not processed")
             return False
 
+        members = self._local.get(region)
+        if members is not None:
+            return match_id in members
+
+        if self.use_bloom:
+            result = await self.redis.execute_command(
+                "BF.EXISTS", f"processed_matches_bf:{region}", match_id
+            )
+            return bool(result)
+
         key = f"processed_matches:{region}"
         result = await self.redis.sismember(key, match_id)
         return bool(result)
@@ -74,14 +214,72 @@ class MatchTracker:
             logger.warning("Redis not connected, cannot mark match as processed")
             return
 
-        key = f"processed_matches:{region}"
-        _ = await self.redis.sadd(key, match_id)
+        if self.use_bloom:
+            await self._bloom_add(region, [match_id])
+        else:
+            await self._set_add(region, [match_id])
         logger.debug("Marked match as processed: {}/{}", region, match_id)
 
+    async def is_processed_many(self, region: str, match_ids: list[str]) -> list[bool]:
+        """
+        Check several matches in a single round trip (SMISMEMBER / BF.MEXISTS).
+
+        Args:
+            region: Region code (e.g., 'euw1')
+            match_ids: Match IDs to check
+
+        Returns:
+            One flag per match ID, in the same order
+        """
+        if not match_ids:
+            return []
+
+        if not self.redis:
+            logger.warning("Redis not connected, assuming matches not processed")
+            return [False] * len(match_ids)
+
+        members = self._local.get(region)
+        if members is not None:
+            return [match_id in members for match_id in match_ids]
+
+        if self.use_bloom:
+            result = await self.redis.execute_command(
+                "BF.MEXISTS", f"processed_matches_bf:{region}", *match_ids
+            )
+        else:
+            key = f"processed_matches:{region}"
+            # redis-py types the reply as sync-or-async; the asyncio client always awaits
+            result = await cast(Awaitable[list[int]], self.redis.smismember(key, match_ids))
+        return [bool(flag) for flag in result]
+
+    async def mark_processed_many(self, region: str, match_ids: list[str]):
+        """
+        Mark several matches as processed in a single round trip (SADD / BF.INSERT).
+
+        Args:
+            region: Region code (e.g., 'euw1')
+            match_ids: Match IDs to mark
+        """
+        if not match_ids:
+            return
+
+        if not self.redis:
+            logger.warning("Redis not connected, cannot mark matches as processed")
+            return
+
+        if self.use_bloom:
+            await self._bloom_add(region, match_ids)
+        else:
+            await self._set_add(region, match_ids)
+        logger.debug("Marked {} matches as processed in {}", len(match_ids), region)
+
     async def get_processed_count(self, region: str) -> int:
         """
         Get count of processed matches for a region.
 
+        With the "bloom" backend the count is a HyperLogLog estimate
+        (standard error 0.81%).
+
         Args:
             region: Region code (e.g., 'euw1')
 
@@ -91,10 +289,65 @@ class MatchTracker:
         if not self.redis:
             return 0
 
+        if self.use_bloom:
+            result = await self.redis.pfcount(f"processed_matches_hll:{region}")
+            return int(result)
+
         key = f"processed_matches:{region}"
         result = await self.redis.scard(key)
         return int(result)
 
+    async def _set_add(self, region: str, match_ids: list[str]):
+        """
+        Add matches to the region's SET, the local mirror and other workers' mirrors.
+
+        Without a mirror this is a plain SADD; with one, SADD and the PUBLISH
+        events share a single round trip.
+
+        Args:
+            region: Region code (e.g., 'euw1')
+            match_ids: Match IDs to add
+        """
+        assert self.redis is not None
+        key = f"processed_matches:{region}"
+        members = self._local.get(region)
+        if members is None:
+            _ = await self.redis.sadd(key, *match_ids)
+            return
+
+        members.update(match_ids)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.sadd(key, *match_ids)
+            for match_id in match_ids:
+                pipe.publish(EVENTS_CHANNEL, f"{region}:{match_id}")
+            await pipe.execute()
+
+    async def _bloom_add(self, region: str, match_ids: list[str]):
+        """
+        Add matches to the region's Bloom filter and HyperLogLog in one round trip.
+
+        BF.INSERT creates the filter with the configured capacity and error
+        rate the first time it is used.
+
+        Args:
+            region: Region code (e.g., 'euw1')
+            match_ids: Match IDs to add
+        """
+        assert self.redis is not None
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.execute_command(
+                "BF.INSERT",
+                f"processed_matches_bf:{region}",
+                "CAPACITY",
+                settings.match_tracking_bloom_capacity,
+                "ERROR",
+                settings.match_tracking_bloom_error_rate,
+                "ITEMS",
+                *match_ids,
+            )
+            pipe.pfadd(f"processed_matches_hll:{region}", *match_ids)
+            await pipe.execute()
+
 
 # Global tracker instance
 tracker = MatchTracker()
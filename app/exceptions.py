@@ -6,7 +6,12 @@ appropriate status codes and error messages conforming to the
 OpenAPI error specification.
 """
 
-from typing import Any
+from __future__ import annotations
+
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Callable
 
 from fastapi import HTTPException, status
 
@@ -23,7 +28,7 @@ class RiotAPIException(HTTPException):
         self,
         status_code: int,
         message: str,
-        headers: dict[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
     ):
         """
         Initialize Riot API exception.
@@ -33,7 +38,9 @@ class RiotAPIException(HTTPException):
             message: Human-readable error message
             headers: Optional HTTP headers to include in response
         """
-        super().__init__(status_code=status_code, detail=message, headers=headers)
+        # Headers may be a shared read-only mapping; they are only read when the
+        # response is built
+        super().__init__(status_code=status_code, detail=message, headers=headers)  # type: ignore[arg-type]
         self.message = message
 
 
@@ -119,6 +126,19 @@ class NotFoundException(RiotAPIException):
         )
 
 
+# Precomputed 429 messages and Retry-After values for common wait times
+_RATE_LIMIT_MESSAGES: dict[int, str] = {
+    seconds: sys.intern(f"Rate limit exceeded. Retry after {seconds} seconds")
+    for seconds in (1, 2, 3, 5, 10, 20, 30, 60, 120)
+}
+
+# Read-only response headers shared by every exception that uses them
+_RETRY_AFTER_HEADERS: dict[int, Mapping[str, str]] = {
+    seconds: MappingProxyType({"Retry-After": str(seconds)}) for seconds in _RATE_LIMIT_MESSAGES
+}
+_SERVICE_UNAVAILABLE_HEADERS = _RETRY_AFTER_HEADERS[60]  # Suggest retrying after 1 minute
+
+
 class RateLimitException(RiotAPIException):
     """
     429 Too Many Requests - Rate limit exceeded.
@@ -138,12 +158,15 @@ class RateLimitException(RiotAPIException):
         """
         # Use exact Riot message if provided, otherwise use default
         final_message = (
-            message if message else f"Rate limit exceeded. Retry after {retry_after} seconds"
+            message
+            or _RATE_LIMIT_MESSAGES.get(retry_after)
+            or f"Rate limit exceeded. Retry after {retry_after} seconds"
         )
         super().__init__(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             message=final_message,
-            headers={"Retry-After": str(retry_after)},
+            headers=_RETRY_AFTER_HEADERS.get(retry_after)
+            or MappingProxyType({"Retry-After": str(retry_after)}),
         )
         self.retry_after = retry_after
 
@@ -190,20 +213,25 @@ class ServiceUnavailableException(RiotAPIException):
         super().__init__(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             message=message,
-            headers={"Retry-After": "60"},  # Suggest retrying after 1 minute
+            headers=_SERVICE_UNAVAILABLE_HEADERS,
         )
 
 
-# HTTP Status Code to Exception mapping for easy lookup
-STATUS_CODE_TO_EXCEPTION: dict[int, type[RiotAPIException]] = {
-    400: BadRequestException,
-    401: UnauthorizedException,
-    403: ForbiddenException,
-    404: NotFoundException,
-    429: RateLimitException,
-    500: InternalServerException,
-    503: ServiceUnavailableException,
-}
+# HTTP Status Code to Exception mapping for easy lookup (read-only, safe to share)
+STATUS_CODE_TO_EXCEPTION: Mapping[int, type[RiotAPIException]] = MappingProxyType(
+    {
+        400: BadRequestException,
+        401: UnauthorizedException,
+        403: ForbiddenException,
+        404: NotFoundException,
+        429: RateLimitException,
+        500: InternalServerException,
+        503: ServiceUnavailableException,
+    }
+)
+
+# Status codes with a dedicated exception class, for membership checks
+STATUS_CODES_WITH_MAPPING: frozenset[int] = frozenset(STATUS_CODE_TO_EXCEPTION)
 
 
 def get_exception_for_status_code(
@@ -226,21 +254,35 @@ def get_exception_for_status_code(
         >>> exc = get_exception_for_status_code(404, resource_type="summoner")
         >>> raise exc
     """
-    # Handle different exception constructors with their specific signatures
-    if status_code == 404 and "resource_type" in kwargs:
-        return NotFoundException(resource_type=kwargs["resource_type"])
-    elif status_code == 429 and "retry_after" in kwargs:
-        return RateLimitException(retry_after=kwargs["retry_after"])
-    elif status_code == 400:
-        return BadRequestException(message=message or "Invalid request parameters")
-    elif status_code == 401:
-        return UnauthorizedException(message=message or "Unauthorized")
-    elif status_code == 403:
-        return ForbiddenException(message=message or "Forbidden")
-    elif status_code == 500:
-        return InternalServerException(error_type=message or "Internal server error")
-    elif status_code == 503:
-        return ServiceUnavailableException(message=message or "Service temporarily unavailable")
-    else:
-        # Default for unmapped status codes
-        return InternalServerException(error_type=message or "An error occurred")
+    factory: Callable[..., RiotAPIException] = _STATUS_EXCEPTION_FACTORIES.get(
+        status_code, _default_exception
+    )
+    return factory(message, **kwargs)
+
+
+def _default_exception(message: str | None, **kwargs: Any) -> RiotAPIException:
+    """Build the exception for status codes without a dedicated class."""
+    return InternalServerException(error_type=message or "An error occurred")
+
+
+# Exception constructors by status code, each taking the optional message plus
+# the keyword arguments of its exception class. A fresh instance is built per
+# call: exceptions carry their own traceback and context once raised, so
+# instances cannot be shared between requests.
+_STATUS_EXCEPTION_FACTORIES: dict[int, Callable[..., RiotAPIException]] = {
+    400: lambda message, **kw: BadRequestException(message=message or "Invalid request parameters"),
+    401: lambda message, **kw: UnauthorizedException(message=message or "Unauthorized"),
+    403: lambda message, **kw: ForbiddenException(message=message or "Forbidden"),
+    404: lambda message, resource_type=None, **kw: NotFoundException(
+        resource_type=resource_type or message or "Data not found"
+    ),
+    429: lambda message, retry_after=1, **kw: RateLimitException(
+        retry_after=retry_after, message=message
+    ),
+    500: lambda message, **kw: InternalServerException(
+        error_type=message or "Internal server error"
+    ),
+    503: lambda message, **kw: ServiceUnavailableException(
+        message=message or "Service temporarily unavailable"
+    ),
+}
@@ -1,59 +1,42 @@
 """FastAPI application for League of Legends API Gateway."""
 
+import importlib
 import sys
+from collections.abc import Callable, Coroutine
 from contextlib import asynccontextmanager
+from typing import Any
 
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from loguru import logger
 
+from app.cache.helpers import drain_cache_writes, flush_cache_logs
 from app.cache.tracking import tracker
-from app.config import settings
+from app.config import get_settings
 from app.exceptions import RiotAPIException
 from app.providers.registry import get_registry, initialize_providers
 from app.riot.client import riot_client
-from app.utils.error_formatter import format_error_response, format_validation_error
-from app.routers import (
-    health,
-    monitoring,
-    summoner,
-    match,
-    league,
-    league_exp,
-    champion,
-    champion_mastery,
-    spectator,
-    platform,
-    account,
-    clash,
-    security,
-    challenges,
-    tournament,
-    tournament_stub,
-)
-from app.routers.ddragon import (
-    additional as ddragon_additional,
-    champions as ddragon_champions,
-    items as ddragon_items,
-    versions as ddragon_versions,
-)
-from app.routers.cdragon import (
-    additional as cdragon_additional,
-    champions as cdragon_champions,
-    skins as cdragon_skins,
-    tft as cdragon_tft,
+from app.utils.error_formatter import (
+    format_error_body,
+    format_internal_error_body,
+    format_validation_body,
 )
 from app.middleware.error_monitoring import ErrorMonitoringMiddleware
 
 
+settings = get_settings()
+
 # Configure loguru
+# enqueue hands records to a background thread so request handlers never block
+# on stderr; ANSI colors are only rendered when attached to a terminal.
 logger.remove()  # Remove default handler
 logger.add(
     sys.stderr,
     format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>",
     level=settings.log_level,
-    colorize=True,
+    colorize=sys.stderr.isatty(),
+    enqueue=True,
 )
 
 
@@ -81,96 +64,83 @@ async def lifespan(app: FastAPI):
 
     # Initialize API providers
     initialize_providers()
-    logger.info(f"Initialized {len(get_registry().get_all_providers())} API provider(s)")
+    logger.opt(lazy=True).info(
+        "Initialized {} API provider(s)", lambda: len(get_registry().get_all_providers())
+    )
 
     # Initialize Redis connection for tracking
     await tracker.connect()
+
+    # Build the OpenAPI schema now; FastAPI caches it, so the first
+    # /openapi.json or /docs request does not pay for walking every route
+    if app.openapi_url:
+        app.openapi()
+
     logger.success("Gateway started successfully")
 
     yield
 
     # Shutdown
     logger.info("Shutting down LOL API Gateway")
+    await drain_cache_writes()
+    flush_cache_logs()
+    await tracker.close()
     await riot_client.close()
 
     # Close all providers
     await get_registry().close_all()
     logger.success("Gateway shutdown complete")
-
-
-# Create FastAPI app
-app = FastAPI(
-    title="LOL API Gateway",
-    description="""
-    Multi-provider API Gateway for League of Legends data.
-
-    Supports:
-    - Riot Games Developer API (live game data)
-    - Data Dragon CDN (static game data)
-    - Community Dragon (enhanced static data and assets)
-
-    Features:
-    - Intelligent caching with Redis
-    - Rate limiting and key rotation
-    - Match tracking to avoid reprocessing
-    - Multi-provider fallback support
-    - Comprehensive error monitoring and health checks
-    """,
-    version="2.1.0",
-    lifespan=lifespan,
-)
-
-# Add error monitoring middleware
-app.add_middleware(ErrorMonitoringMiddleware, max_error_history=1000, alert_threshold=10)
+    await logger.complete()
 
 
 # Exception Handlers
-@app.exception_handler(RiotAPIException)
-async def riot_api_exception_handler(request: Request, exc: RiotAPIException) -> JSONResponse:
+async def riot_api_exception_handler(request: Request, exc: RiotAPIException) -> Response:
     """
     Handle custom Riot API exceptions.
 
     Formats RiotAPIException instances into standardized error responses
-    conforming to the OpenAPI error specification.
+    conforming to the OpenAPI error specification. Encoded bodies are
+    cached per (status code, message), so repeated errors skip serialization.
     """
-    logger.warning(
-        f"RiotAPIException: {exc.status_code} - {exc.message} (path: {request.url.path})"
-    )
-
-    error_content = format_error_response(
-        status_code=exc.status_code,
-        message=exc.message,
+    logger.opt(lazy=True).warning(
+        "RiotAPIException: {} - {} (path: {})",
+        lambda: exc.status_code,
+        lambda: exc.message,
+        lambda: request.url.path,
     )
 
-    return JSONResponse(
+    return Response(
+        content=format_error_body(exc.status_code, exc.message),
         status_code=exc.status_code,
-        content=error_content,
         headers=exc.headers,
+        media_type="application/json",
     )
 
 
-@app.exception_handler(RequestValidationError)
-async def validation_exception_handler(
-    request: Request, exc: RequestValidationError
-) -> JSONResponse:
+async def validation_exception_handler(request: Request, exc: RequestValidationError) -> Response:
     """
     Handle request validation errors (422 -> 400).
 
     Converts FastAPI validation errors into 400 Bad Request responses
     with standardized error format.
     """
-    logger.warning(f"Validation error on {request.method} {request.url.path}: {exc.errors()}")
-
-    error_content = format_validation_error(exc.errors())
+    errors = exc.errors()
+    # The path is built from the scope only if the record passes the level filter
+    logger.opt(lazy=True).warning(
+        "Validation error on {} {}: {}",
+        lambda: request.method,
+        lambda: request.url.path,
+        lambda: errors,
+    )
 
-    return JSONResponse(
+    return Response(
+        content=format_validation_body(errors),
         status_code=status.HTTP_400_BAD_REQUEST,
-        content=error_content,
+        media_type="application/json",
     )
 
 
-@app.exception_handler(Exception)
-async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def generic_exception_handler(request: Request, exc: Exception) -> Response:
     """
     Handle unexpected exceptions as 500 Internal Server Error.
 
@@ -178,54 +148,111 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
     The error monitoring middleware will also track these errors.
     """
     logger.error(
-        f"Unhandled exception on {request.method} {request.url.path}: {type(exc).__name__}: {exc}"
+        "Unhandled exception on {} {}: {}: {}",
+        request.method,
+        request.url.path,
+        type(exc).__name__,
+        exc,
     )
 
-    error_content = format_error_response(
+    return Response(
+        content=format_internal_error_body(type(exc)),
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        message=f"Internal server error: {type(exc).__name__}",
+        media_type="application/json",
     )
 
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=error_content,
-    )
 
+# Passed to the FastAPI constructor so the handler table is complete before the
+# middleware stack is first built, rather than mutated by decorators afterwards.
+EXCEPTION_HANDLERS: dict[
+    int | type[Exception], Callable[[Request, Any], Coroutine[Any, Any, Response]]
+] = {
+    RiotAPIException: riot_api_exception_handler,
+    RequestValidationError: validation_exception_handler,
+    Exception: generic_exception_handler,
+}
+
+
+# Create FastAPI app
+app = FastAPI(
+    title="LOL API Gateway",
+    description="""
+    Multi-provider API Gateway for League of Legends data.
+
+    Supports:
+    - Riot Games Developer API (live game data)
+    - Data Dragon CDN (static game data)
+    - Community Dragon (enhanced static data and assets)
+
+    Features:
+    - Intelligent caching with Redis
+    - Rate limiting and key rotation
+    - Match tracking to avoid reprocessing
+    - Multi-provider fallback support
+    - Comprehensive error monitoring and health checks
+    """,
+    version="2.1.0",
+    lifespan=lifespan,
+    exception_handlers=EXCEPTION_HANDLERS,
+    default_response_class=ORJSONResponse,
+)
+
+# Add error monitoring middleware
+app.add_middleware(ErrorMonitoringMiddleware, max_error_history=1000, alert_threshold=10)
+
+
+# Routers as (module, provider) pairs. Modules whose provider is not listed in
+# ENABLED_PROVIDERS are never imported, so a worker without Data Dragon or
+# Community Dragon does not load their routers, schemas and clients.
+ROUTER_MODULES: tuple[tuple[str, str | None], ...] = (
+    # Health & Monitoring
+    ("app.routers.health", None),  # Health monitoring (basic + detailed)
+    ("app.routers.monitoring", None),  # Error monitoring endpoints
+    # Riot API (always enabled)
+    ("app.routers.account", None),  # Account API (Riot ID lookups)
+    ("app.routers.summoner", None),  # Summoner-V4
+    ("app.routers.match", None),  # Match-V5
+    ("app.routers.league", None),  # League-V4
+    ("app.routers.league_exp", None),  # League-EXP-V4 (experimental)
+    ("app.routers.champion", None),  # Champion-V3 (rotations)
+    ("app.routers.champion_mastery", None),  # Champion-Mastery-V4
+    ("app.routers.spectator", None),  # Spectator-V5 (live games)
+    ("app.routers.platform", None),  # Platform/Status-V4
+    ("app.routers.clash", None),  # Clash-V1
+    ("app.routers.challenges", None),  # Challenges-V1
+    ("app.routers.tournament", None),  # Tournament-V5 (production)
+    ("app.routers.tournament_stub", None),  # Tournament-Stub-V5 (testing)
+    ("app.routers.security", None),  # Security monitoring
+    # Data Dragon
+    ("app.routers.ddragon.versions", "data_dragon"),  # Versions and languages
+    ("app.routers.ddragon.champions", "data_dragon"),  # Champion static data
+    ("app.routers.ddragon.items", "data_dragon"),  # Items, runes, summoner spells
+    # Maps, missions, stickers, language strings, bulk data
+    ("app.routers.ddragon.additional", "data_dragon"),
+    # Community Dragon
+    ("app.routers.cdragon.champions", "community_dragon"),  # Enhanced champion data
+    ("app.routers.cdragon.skins", "community_dragon"),  # Skin and chroma data
+    ("app.routers.cdragon.tft", "community_dragon"),  # TFT data
+    # Chromas, ward skins, missions, lore, loot
+    ("app.routers.cdragon.additional", "community_dragon"),
+)
+
+
+def include_routers(app: FastAPI) -> None:
+    """
+    Import and include the routers of every enabled provider.
+
+    Args:
+        app (FastAPI): The FastAPI application instance.
+    """
+    for module_name, provider_name in ROUTER_MODULES:
+        if provider_name is None or provider_name in settings.enabled_providers:
+            app.include_router(importlib.import_module(module_name).router)
+
+
+include_routers(app)
 
-# Include routers - Health & Monitoring
-app.include_router(health.router)  # Health monitoring (basic + detailed)
-app.include_router(monitoring.router)  # Error monitoring endpoints
-
-# Include routers - Riot API
-app.include_router(account.router)  # Account API (Riot ID lookups)
-app.include_router(summoner.router)  # Summoner-V4
-app.include_router(match.router)  # Match-V5
-app.include_router(league.router)  # League-V4
-app.include_router(league_exp.router)  # League-EXP-V4 (experimental)
-app.include_router(champion.router)  # Champion-V3 (rotations)
-app.include_router(champion_mastery.router)  # Champion-Mastery-V4
-app.include_router(spectator.router)  # Spectator-V5 (live games)
-app.include_router(platform.router)  # Platform/Status-V4
-app.include_router(clash.router)  # Clash-V1
-app.include_router(challenges.router)  # Challenges-V1
-app.include_router(tournament.router)  # Tournament-V5 (production)
-app.include_router(tournament_stub.router)  # Tournament-Stub-V5 (testing)
-app.include_router(security.router)  # Security monitoring
-
-# Include routers - Data Dragon
-app.include_router(ddragon_versions.router)  # Versions and languages
-app.include_router(ddragon_champions.router)  # Champion static data
-app.include_router(ddragon_items.router)  # Items, runes, summoner spells
-app.include_router(
-    ddragon_additional.router
-)  # Maps, missions, stickers, language strings, bulk data
-
-# Include routers - Community Dragon
-app.include_router(cdragon_champions.router)  # Enhanced champion data
-app.include_router(cdragon_skins.router)  # Skin and chroma data
-app.include_router(cdragon_tft.router)  # TFT data
-app.include_router(cdragon_additional.router)  # Chromas, ward skins, missions, lore, loot
-
-logger.info(
-    "FastAPI app initialized with all API endpoints (Riot API, Data Dragon, Community Dragon, Health Monitoring, Security, Tournament)"
+logger.opt(lazy=True).info(
+    "FastAPI app initialized with API endpoints for providers: {}",
+    lambda: ", ".join(sorted(settings.enabled_providers | {"riot_api"})),
 )
@@ -17,23 +17,69 @@ Example:
     ```
 """
 
+import re
 import time
 from collections import defaultdict, deque
-from typing import Awaitable, Callable, Dict, List, Optional, Set
+from dataclasses import dataclass
+from itertools import islice
+from typing import Dict, List, Optional, Set
 
-from fastapi import Request, Response
-from fastapi.responses import JSONResponse
 from loguru import logger
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.models.common import ErrorMetrics, ErrorRecord
-from app.utils.error_formatter import format_error_response
+from app.utils.error_formatter import format_internal_error_body
 
 
 # Global instance reference for router access
 _global_instance: "ErrorMonitoringMiddleware | None" = None
 
 
+@dataclass(slots=True, kw_only=True)
+class _RawErrorRecord:
+    """Unvalidated error record kept in the middleware's history buffers.
+
+    Has the same fields as ErrorRecord, which is only built when records
+    are handed out by get_recent_errors(), so recording an error does not
+    run pydantic validation.
+    """
+
+    timestamp: float
+    endpoint: str
+    provider: str | None = None
+    status_code: int
+    method: str
+    path: str
+    duration: float
+    error_type: str | None = None
+    error_message: str | None = None
+    is_client_error: bool = False
+    is_server_error: bool = False
+
+    def to_model(self) -> ErrorRecord:
+        """Return the record as a validated ErrorRecord."""
+        return ErrorRecord.model_validate(self, from_attributes=True)
+
+
+def _elapsed(start_ns: int) -> float:
+    """Return the seconds elapsed since a time.monotonic_ns() reading."""
+    return (time.monotonic_ns() - start_ns) / 1e9
+
+
+def _count_since(records: deque[_RawErrorRecord], cutoff: float) -> int:
+    """Count the records with a timestamp at or after cutoff.
+
+    Records are appended as they happen, so the scan runs from the newest
+    record and stops at the first one older than the window.
+    """
+    count = 0
+    for record in reversed(records):
+        if record.timestamp < cutoff:
+            break
+        count += 1
+    return count
+
+
 def get_global_error_monitor() -> "ErrorMonitoringMiddleware":
     """Get the global error monitoring instance.
 
@@ -60,13 +106,17 @@ def get_global_error_monitor() -> "ErrorMonitoringMiddleware":
     return _global_instance
 
 
-class ErrorMonitoringMiddleware(BaseHTTPMiddleware):
+class ErrorMonitoringMiddleware:
     """
     Middleware for comprehensive error monitoring and tracking.
 
     Tracks HTTP errors, exceptions, and provides detailed metrics
     for monitoring system health and detecting reliability issues.
 
+    Implemented as a plain ASGI middleware: the response status is read from
+    the "http.response.start" message as it is sent, so requests are not
+    wrapped in the extra task and streams that BaseHTTPMiddleware adds.
+
     The middleware automatically:
     - Records all 4xx and 5xx errors
     - Tracks consecutive failures per endpoint
@@ -80,8 +130,9 @@ class ErrorMonitoringMiddleware(BaseHTTPMiddleware):
         provider_error_counts: Error count per provider
         status_code_counts: Error count per HTTP status code
         recent_errors: Last 100 errors for quick access
-        consecutive_failures: Current consecutive failure count per endpoint
-        last_success_times: Timestamp of last successful request per endpoint
+        consecutive_failures: Current consecutive failure count per failing endpoint
+        last_success_times: Timestamp of the success that last ended a failure
+            streak, per endpoint
         active_alerts: Set of currently active alert keys
 
     Example:
@@ -95,12 +146,31 @@ class ErrorMonitoringMiddleware(BaseHTTPMiddleware):
         ```
     """
 
-    def __init__(self, app, max_error_history: int = 1000, alert_threshold: int = 10):
+    __slots__ = (
+        "app",
+        "error_history",
+        "error_counts",
+        "provider_error_counts",
+        "status_code_counts",
+        "recent_errors",
+        "consecutive_failures",
+        "last_success_times",
+        "active_alerts",
+        "_last_alert_times",
+        "_server_error_count",
+        "_client_error_count",
+        "alert_threshold",
+        "alert_cooldown",
+        "provider_patterns",
+        "_provider_re",
+    )
+
+    def __init__(self, app: ASGIApp, max_error_history: int = 1000, alert_threshold: int = 10):
         """
         Initialize error monitoring middleware.
 
         Args:
-            app: FastAPI application instance
+            app: Next ASGI application in the middleware stack
             max_error_history: Maximum number of error records to keep in memory.
                 Oldest errors are automatically discarded when limit is reached.
             alert_threshold: Number of consecutive errors before triggering an alert.
@@ -115,19 +185,23 @@ class ErrorMonitoringMiddleware(BaseHTTPMiddleware):
             )
             ```
         """
-        super().__init__(app)
+        self.app = app
         global _global_instance
         _global_instance = self
 
         # Error tracking data structures
-        self.error_history: deque[ErrorRecord] = deque(maxlen=max_error_history)
+        self.error_history: deque[_RawErrorRecord] = deque(maxlen=max_error_history)
         self.error_counts: Dict[str, int] = defaultdict(int)  # endpoint -> count
         self.provider_error_counts: Dict[str, int] = defaultdict(int)  # provider -> count
         self.status_code_counts: Dict[int, int] = defaultdict(int)  # status -> count
-        self.recent_errors: deque[ErrorRecord] = deque(maxlen=100)  # Last 100 errors
+        self.recent_errors: deque[_RawErrorRecord] = deque(maxlen=100)  # Last 100 errors
         self.consecutive_failures: Dict[str, int] = defaultdict(int)  # endpoint -> count
         self.last_success_times: Dict[str, float] = {}  # endpoint -> timestamp
         self.active_alerts: Set[str] = set()
+        self._last_alert_times: Dict[str, float] = {}  # alert key -> timestamp
+        # Server/client errors currently in error_history, kept as records rotate
+        self._server_error_count = 0
+        self._client_error_count = 0
 
         # Configuration
         self.alert_threshold = alert_threshold
@@ -147,74 +221,84 @@ class ErrorMonitoringMiddleware(BaseHTTPMiddleware):
             "data_dragon": ["/ddragon", "/dragon", "/champion", "/item", "/rune"],
             "community_dragon": ["/cdragon", "/cdn", "/assets"],
         }
+        self._provider_re = self._compile_provider_patterns()
 
         logger.info("Error monitoring middleware initialized")
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request and track any errors that occur.
 
-        This is the main middleware entry point. It wraps each request
+        This is the main middleware entry point. It wraps each HTTP request
         and tracks success/failure outcomes, recording detailed error
-        information when problems occur.
+        information when problems occur. Other scope types (lifespan,
+        websocket) are passed through untouched.
 
         Behavior:
-        - 2xx-3xx: Track as success, reset consecutive failure counter
+        - 2xx-3xx: Track as success, ending the endpoint's failure streak if any
         - 4xx: Track as client error, log warning
-        - 5xx or exception: Track as server error, increment failure counter, check alerts
+        - Exception: Track as server error, increment failure counter, check alerts
 
         Args:
-            request: Incoming HTTP request to process
-            call_next: Next middleware or endpoint handler in the chain
-
-        Returns:
-            HTTP response from the handler (or error response if exception occurred)
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
 
         Example:
-            This method is called automatically by FastAPI middleware system.
+            This method is called automatically by the ASGI server.
             No need to invoke it manually.
         """
-        start_time = time.time()
-        endpoint = self._get_endpoint_path(request)
-
-        try:
-            response = await call_next(request)
-
-            # Track successful requests
-            if 200 <= response.status_code < 400:
-                self._track_success(endpoint)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-            # Track client errors (4xx) as warnings
-            elif 400 <= response.status_code < 500:
-                self._track_client_error(request, response, start_time)
+        start_ns = time.monotonic_ns()
+        method: str = scope["method"]
+        path: str = scope["path"]
+        status_code = 0
 
-            return response
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
+        try:
+            await self.app(scope, receive, send_wrapper)
         except Exception as exc:
-            # Track server errors (5xx and exceptions)
-            return await self._handle_server_error(request, exc, start_time)
-
-    def _get_endpoint_path(self, request: Request) -> str:
-        """Extract the endpoint path from request.
-
-        Creates a unique identifier for each endpoint combining
-        HTTP method and URL path.
-
-        Args:
-            request: HTTP request to extract endpoint from
+            # Track server errors (exceptions)
+            self._track_server_error(method, path, exc, _elapsed(start_ns))
+            if status_code:
+                # The response has already started; nothing more can be sent
+                raise
+            await self._send_server_error(send, exc)
+            return
+
+        # Track successful requests; with no failure streak there is nothing to reset
+        if 200 <= status_code < 400:
+            if self.consecutive_failures:
+                self._track_success(f"{method} {path}")
+
+        # Track client errors (4xx) as warnings
+        elif 400 <= status_code < 500:
+            self._track_client_error(method, path, status_code, _elapsed(start_ns))
+
+    def _compile_provider_patterns(self) -> re.Pattern[str]:
+        """Compile provider_patterns into a single case-insensitive regex.
+
+        Each provider is one lookahead alternative anchored at the start of
+        the path, so providers are still tried in order and the first one with
+        a pattern anywhere in the path wins, as with the per-pattern checks.
+        The matching provider is the name of the group that matched.
 
         Returns:
-            Endpoint identifier in format "METHOD /path"
-
-        Example:
-            ```python
-            # Returns "GET /api/summoner/by-name"
-            endpoint = self._get_endpoint_path(request)
-            ```
+            Compiled pattern for use with match()
         """
-        return f"{request.method} {request.url.path}"
+        alternatives = [
+            f"(?=.*?(?P<{provider}>{'|'.join(map(re.escape, patterns))}))"
+            for provider, patterns in self.provider_patterns.items()
+        ]
+        return re.compile("|".join(alternatives), re.IGNORECASE | re.DOTALL)
 
     def _detect_provider(self, path: str) -> Optional[str]:
         """Detect which provider is likely handling the request based on path.
@@ -235,22 +319,18 @@ class ErrorMonitoringMiddleware(BaseHTTPMiddleware):
             # Returns: "riot_api"
             ```
         """
-        path_lower = path.lower()
-
-        for provider, patterns in self.provider_patterns.items():
-            if any(pattern in path_lower for pattern in patterns):
-                return provider
-
-        return "unknown"
+        match = self._provider_re.match(path)
+        return match.lastgroup if match else "unknown"
 
     def _track_success(self, endpoint: str):
-        """Track successful request to reset consecutive failure counter.
+        """Track successful request to end the endpoint's failure streak.
 
-        Called on every 2xx/3xx response to clear failure tracking and
-        update last success time.
+        Called on 2xx/3xx responses while any endpoint has consecutive
+        failures. Endpoints without a failure streak are left untouched, so
+        healthy traffic does not add an entry per requested path.
 
-        Side effects:
-        - Resets consecutive_failures counter to 0
+        Side effects (only if the endpoint was failing):
+        - Removes the endpoint from consecutive_failures
         - Updates last_success_times timestamp
         - Clears any active alerts for this endpoint
 
@@ -263,14 +343,15 @@ class ErrorMonitoringMiddleware(BaseHTTPMiddleware):
             self._track_success("GET /api/summoner")
             ```
         """
-        self.consecutive_failures[endpoint] = 0
+        if self.consecutive_failures.pop(endpoint, None) is None:
+            return
         self.last_success_times[endpoint] = time.time()
 
         # Clear any existing alerts for this endpoint
-        alert_key = f"consecutive_failures:{endpoint}"
-        self.active_alerts.discard(alert_key)
+        if self.active_alerts:
+            self.active_alerts.discard(f"consecutive_failures:{endpoint}")
 
-    def _track_client_error(self, request: Request, response: Response, start_time: float):
+    def _track_client_error(self, method: str, path: str, status_code: int, duration: float):
         """Track client errors (4xx) with detailed logging.
 
         Records 4xx errors in error history and logs them as warnings.
@@ -278,27 +359,27 @@ class ErrorMonitoringMiddleware(BaseHTTPMiddleware):
         they typically indicate user mistakes rather than system problems.
 
         Args:
-            request: HTTP request that caused the error
-            response: Error response being returned
-            start_time: Timestamp when request processing started
+            method: HTTP method of the request
+            path: URL path of the request
+            status_code: Status code of the error response
+            duration: Request processing time in seconds
 
         Example:
             ```python
             # Called automatically for 4xx responses
-            self._track_client_error(request, response, start_time)
+            self._track_client_error("GET", "/lol/summoner/v4/...", 404, 0.012)
             ```
         """
-        endpoint = self._get_endpoint_path(request)
-        provider = self._detect_provider(request.url.path)
-        duration = time.time() - start_time
+        endpoint = f"{method} {path}"
+        provider = self._detect_provider(path)
 
-        error_record = ErrorRecord(
+        error_record = _RawErrorRecord(
             timestamp=time.time(),
             endpoint=endpoint,
             provider=provider,
-            status_code=response.status_code,
-            method=request.method,
-            path=request.url.path,
+            status_code=status_code,
+            method=method,
+            path=path,
             duration=duration,
             is_client_error=True,
         )
@@ -307,44 +388,43 @@ class ErrorMonitoringMiddleware(BaseHTTPMiddleware):
 
         # Log warning for client errors
         logger.warning(
-            f"Client error: {endpoint} -> {response.status_code} "
-            f"(provider: {provider}, duration: {duration:.3f}s)"
+            "Client error: {} -> {} (provider: {}, duration: {:.3f}s)",
+            endpoint,
+            status_code,
+            provider,
+            duration,
         )
 
-    async def _handle_server_error(
-        self, request: Request, exc: Exception, start_time: float
-    ) -> JSONResponse:
-        """Handle server errors with comprehensive tracking.
+    def _track_server_error(self, method: str, path: str, exc: Exception, duration: float):
+        """Track server errors with comprehensive tracking.
 
-        Creates error record, increments consecutive failure counter,
-        checks for alert conditions, and returns standardized error response.
+        Creates error record, increments consecutive failure counter
+        and checks for alert conditions.
 
         Args:
-            request: HTTP request that caused the error
+            method: HTTP method of the request
+            path: URL path of the request
             exc: Exception that was raised
-            start_time: Timestamp when request processing started
-
-        Returns:
-            JSONResponse with 500 status and OpenAPI-compliant error format
+            duration: Request processing time in seconds
 
         Example:
             ```python
             # Called automatically when exceptions occur
-            response = await self._handle_server_error(request, exc, start_time)
+            self._track_server_error("GET", "/lol/summoner/v4/...", exc, 0.012)
             ```
         """
-        endpoint = self._get_endpoint_path(request)
-        provider = self._detect_provider(request.url.path)
-        duration = time.time() - start_time
+        endpoint = f"{method} {path}"
+        provider = self._detect_provider(path)
+        now = time.time()
 
         # Create error record
-        error_record = ErrorRecord(
-            timestamp=time.time(),
+        error_record = _RawErrorRecord(
+            timestamp=now,
             endpoint=endpoint,
             provider=provider,
             status_code=500,
-            method=request.method,
-            path=request.url.path,
+            method=method,
+            path=path,
             duration=duration,
             error_type=type(exc).__name__,
             error_message=str(exc),
@@ -358,27 +438,41 @@ class ErrorMonitoringMiddleware(BaseHTTPMiddleware):
         failure_count = self.consecutive_failures[endpoint]
 
         # Check for alert conditions
-        self._check_alert_conditions(endpoint, provider, failure_count)
+        self._check_alert_conditions(endpoint, provider, failure_count, now)
 
         # Log error with context
         logger.error(
-            f"Server error: {endpoint} -> {type(exc).__name__}: {exc} "
-            f"(provider: {provider}, consecutive failures: {failure_count}, "
-            f"duration: {duration:.3f}s)"
+            "Server error: {} -> {}: {} (provider: {}, consecutive failures: {}, "
+            "duration: {:.3f}s)",
+            endpoint,
+            type(exc).__name__,
+            exc,
+            provider,
+            failure_count,
+            duration,
         )
 
-        # Return standardized error response in OpenAPI Error format
-        error_content = format_error_response(
-            status_code=500,
-            message=f"Internal server error: {type(exc).__name__}",
-        )
+    async def _send_server_error(self, send: Send, exc: Exception):
+        """Send the standardized 500 response for an unhandled exception.
 
-        return JSONResponse(
-            status_code=500,
-            content=error_content,
+        Args:
+            send: ASGI send channel
+            exc: Exception that was raised
+        """
+        body = format_internal_error_body(type(exc))
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 500,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            }
         )
+        await send({"type": "http.response.body", "body": body})
 
-    def _record_error(self, error_record: ErrorRecord):
+    def _record_error(self, error_record: _RawErrorRecord):
         """Record error in tracking data structures.
 
         Adds error to history and updates all relevant counters.
@@ -389,7 +483,7 @@ class ErrorMonitoringMiddleware(BaseHTTPMiddleware):
 
         Example:
             ```python
-            record = ErrorRecord(
+            record = _RawErrorRecord(
                 timestamp=time.time(),
                 endpoint="GET /api/summoner",
                 status_code=500,
@@ -398,9 +492,15 @@ class ErrorMonitoringMiddleware(BaseHTTPMiddleware):
             self._record_error(record)
             ```
         """
-        # Add to history
+        # Add to history, uncounting the record the deque is about to evict
+        if len(self.error_history) == self.error_history.maxlen:
+            evicted = self.error_history[0]
+            self._server_error_count -= evicted.is_server_error
+            self._client_error_count -= evicted.is_client_error
         self.error_history.append(error_record)
         self.recent_errors.append(error_record)
+        self._server_error_count += error_record.is_server_error
+        self._client_error_count += error_record.is_client_error
 
         # Update counters
         self.error_counts[error_record.endpoint] += 1
@@ -410,7 +510,7 @@ class ErrorMonitoringMiddleware(BaseHTTPMiddleware):
             self.provider_error_counts[error_record.provider] += 1
 
     def _check_alert_conditions(
-        self, endpoint: str, provider: Optional[str], consecutive_failures: int
+        self, endpoint: str, provider: Optional[str], consecutive_failures: int, now: float
     ):
         """Check if error conditions warrant an alert.
 
@@ -421,27 +521,31 @@ class ErrorMonitoringMiddleware(BaseHTTPMiddleware):
             endpoint: Endpoint experiencing failures
             provider: Provider handling the endpoint (or None if unknown)
             consecutive_failures: Current count of consecutive failures
+            now: Wall-clock time of the failure
 
         Example:
             ```python
             # Called automatically after server errors
-            self._check_alert_conditions("GET /api/summoner", "riot_api", 10)
+            self._check_alert_conditions("GET /api/summoner", "riot_api", 10, time.time())
             ```
         """
-        if consecutive_failures >= self.alert_threshold:
-            alert_key = f"consecutive_failures:{endpoint}"
-            current_time = time.time()
+        if consecutive_failures < self.alert_threshold:
+            return
 
-            # Check cooldown to avoid alert spam
-            last_alert_time = getattr(self, f"_last_alert_{alert_key.replace(':', '_')}", 0)
-            if current_time - last_alert_time > self.alert_cooldown:
-                self.active_alerts.add(alert_key)
-                setattr(self, f"_last_alert_{alert_key.replace(':', '_')}", current_time)
+        alert_key = f"consecutive_failures:{endpoint}"
 
-                logger.critical(
-                    f"ALERT: Endpoint {endpoint} has {consecutive_failures} "
-                    f"consecutive failures (provider: {provider})"
-                )
+        # Check cooldown to avoid alert spam
+        last_alert_time = self._last_alert_times.get(alert_key, 0.0)
+        if now - last_alert_time > self.alert_cooldown:
+            self.active_alerts.add(alert_key)
+            self._last_alert_times[alert_key] = now
+
+            logger.critical(
+                "ALERT: Endpoint {} has {} consecutive failures (provider: {})",
+                endpoint,
+                consecutive_failures,
+                provider,
+            )
 
     def get_error_metrics(self) -> ErrorMetrics:
         """
@@ -472,19 +576,15 @@ class ErrorMonitoringMiddleware(BaseHTTPMiddleware):
         current_time = time.time()
 
         # Calculate error rates for different time windows
-        recent_errors_5m = [e for e in self.recent_errors if current_time - e.timestamp <= 300]
-        recent_errors_1h = [e for e in self.error_history if current_time - e.timestamp <= 3600]
-
-        # Count server vs client errors
-        server_errors = sum(1 for e in self.error_history if e.is_server_error)
-        client_errors = sum(1 for e in self.error_history if e.is_client_error)
+        recent_errors_5m = _count_since(self.recent_errors, current_time - 300)
+        recent_errors_1h = _count_since(self.error_history, current_time - 3600)
 
         return ErrorMetrics(
             total_errors=len(self.error_history),
-            server_errors=server_errors,
-            client_errors=client_errors,
-            recent_errors_5min=len(recent_errors_5m),
-            recent_errors_1hour=len(recent_errors_1h),
+            server_errors=self._server_error_count,
+            client_errors=self._client_error_count,
+            recent_errors_5min=recent_errors_5m,
+            recent_errors_1hour=recent_errors_1h,
             error_rates_by_endpoint=dict(self.error_counts),
             error_rates_by_provider=dict(self.provider_error_counts),
             status_code_distribution=dict(self.status_code_counts),
@@ -515,7 +615,8 @@ class ErrorMonitoringMiddleware(BaseHTTPMiddleware):
                 print(f"{error.endpoint} - {error.status_code}")
             ```
         """
-        return list(self.recent_errors)[-limit:]
+        start = max(0, len(self.recent_errors) - limit)
+        return [record.to_model() for record in islice(self.recent_errors, start, None)]
 
     def reset_metrics(self):
         """Reset all error tracking metrics.
@@ -541,4 +642,7 @@ class ErrorMonitoringMiddleware(BaseHTTPMiddleware):
         self.consecutive_failures.clear()
         self.last_success_times.clear()
         self.active_alerts.clear()
+        self._last_alert_times.clear()
+        self._server_error_count = 0
+        self._client_error_count = 0
         logger.info("Error monitoring metrics reset")
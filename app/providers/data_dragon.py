@@ -49,6 +49,7 @@ class DataDragonProvider(BaseProvider):
         self.client = httpx.AsyncClient(
             timeout=settings.riot_request_timeout,
             follow_redirects=True,
+            http2=settings.upstream_http2,
         )
 
         logger.info(f"Initialized {self.name} provider [version={version}, locale={locale}]")
@@ -5,6 +5,7 @@ Manages provider instances and provides factory methods for creating
 and retrieving providers.
 """
 
+import asyncio
 from typing import TYPE_CHECKING
 
 from loguru import logger
@@ -91,18 +92,30 @@ class ProviderRegistry:
         """
         Check health of all registered providers.
 
+        The providers are checked concurrently, so the total time is that of
+        the slowest upstream rather than the sum of all of them.
+
         Returns:
             Dictionary mapping provider names to health status
         """
-        results = {}
-        for provider in self._providers.values():
-            results[provider.name] = await provider.health_check()
-        return results
+        providers = list(self._providers.values())
+        statuses = await asyncio.gather(*(provider.health_check() for provider in providers))
+        return {provider.name: status for provider, status in zip(providers, statuses)}
 
     async def close_all(self) -> None:
-        """Close all provider connections."""
-        for provider in self._providers.values():
-            await provider.close()
+        """
+        Close all provider connections concurrently.
+
+        A provider failing to close is logged and does not prevent the others
+        from closing.
+        """
+        providers = list(self._providers.values())
+        results = await asyncio.gather(
+            *(provider.close() for provider in providers), return_exceptions=True
+        )
+        for provider, result in zip(providers, results):
+            if isinstance(result, Exception):
+                logger.warning("Failed to close provider {}: {}", provider.name, result)
         logger.info("All providers closed")
 
     def clear(self) -> None:
@@ -146,7 +159,9 @@ def initialize_providers(settings_override: "Settings | None" = None) -> None:
         )
         _registry.register_provider(cdragon_provider)
 
-    logger.info(f"Initialized {len(_registry.get_all_providers())} provider(s)")
+    logger.opt(lazy=True).info(
+        "Initialized {} provider(s)", lambda: len(_registry.get_all_providers())
+    )
 
 
 def get_provider(provider_type: ProviderType) -> BaseProvider:
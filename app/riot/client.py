@@ -243,6 +243,7 @@ class RiotClient:
         # (will be added per-request from key rotator)
         self.client = httpx.AsyncClient(
             timeout=config.riot_request_timeout,
+            http2=config.upstream_http2,
         )
 
         key_count = len(api_keys)
@@ -6,6 +6,8 @@ available API keys, helping avoid rate limit exhaustion on a single key.
 """
 
 import threading
+from typing import Sequence
+
 from loguru import logger
 
 
@@ -22,12 +24,12 @@ class KeyRotator:
         >>> # Returns "key1", next call returns "key2", etc.
     """
 
-    def __init__(self, api_keys: list[str]):
+    def __init__(self, api_keys: Sequence[str]):
         """
         Initialize the key rotator.
 
         Args:
-            api_keys: List of Riot API keys to rotate through
+            api_keys: Riot API keys to rotate through
 
         Raises:
             ValueError: If api_keys list is empty
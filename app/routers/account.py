@@ -32,6 +32,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends
 
 from app.cache.helpers import fetch_with_cache
+from app.cache.redis_cache import key_for
 from app.config import settings
 from app.models.account import (
     AccountByPuuidParams,
@@ -42,14 +43,15 @@ from app.models.account import (
     ActiveShardQuery,
 )
 from app.riot.client import riot_client
+from app.utils.dependencies import model_dependency
 
 router = APIRouter(prefix="/riot/account/v1", tags=["account"])
 
 
 @router.get("/accounts/by-puuid/{puuid}")
 async def get_account_by_puuid(
-    params: Annotated[AccountByPuuidParams, Depends()],
-    query: Annotated[AccountByPuuidQuery, Depends()],
+    params: Annotated[AccountByPuuidParams, Depends(model_dependency(AccountByPuuidParams))],
+    query: Annotated[AccountByPuuidQuery, Depends(model_dependency(AccountByPuuidQuery))],
 ):
     """Retrieves account information by Player Universally Unique Identifier (PUUID).
 
@@ -118,7 +120,7 @@ async def get_account_by_puuid(
         https://developer.riotgames.com/apis#account-v1/GET_getByPuuid
     """
     return await fetch_with_cache(
-        cache_key=f"account:puuid:{query.region}:{params.puuid}",
+        cache_key=key_for("account:puuid", query.region, params.puuid),
         resource_name="Account",
         fetch_fn=lambda: riot_client.get(
             f"/riot/account/v1/accounts/by-puuid/{params.puuid}", query.region, True
@@ -130,8 +132,8 @@ async def get_account_by_puuid(
 
 @router.get("/accounts/by-riot-id/{gameName}/{tagLine}")
 async def get_account_by_riot_id(
-    params: Annotated[AccountByRiotIdParams, Depends()],
-    query: Annotated[AccountByRiotIdQuery, Depends()],
+    params: Annotated[AccountByRiotIdParams, Depends(model_dependency(AccountByRiotIdParams))],
+    query: Annotated[AccountByRiotIdQuery, Depends(model_dependency(AccountByRiotIdQuery))],
 ):
     """Retrieves account information by Riot ID (gameName and tagLine).
 
@@ -213,7 +215,7 @@ async def get_account_by_riot_id(
         https://developer.riotgames.com/apis#account-v1/GET_getByRiotId
     """
     return await fetch_with_cache(
-        cache_key=f"account:riotid:{query.region}:{params.gameName}:{params.tagLine}",
+        cache_key=key_for("account:riotid", query.region, f"{params.gameName}:{params.tagLine}"),
         resource_name="Account",
         fetch_fn=lambda: riot_client.get(
             f"/riot/account/v1/accounts/by-riot-id/{params.gameName}/{params.tagLine}",
@@ -227,8 +229,8 @@ async def get_account_by_riot_id(
 
 @router.get("/active-shards/by-game/{game}/by-puuid/{puuid}")
 async def get_active_shard(
-    params: Annotated[ActiveShardParams, Depends()],
-    query: Annotated[ActiveShardQuery, Depends()],
+    params: Annotated[ActiveShardParams, Depends(model_dependency(ActiveShardParams))],
+    query: Annotated[ActiveShardQuery, Depends(model_dependency(ActiveShardQuery))],
 ):
     """Retrieves the active game shard (server) where a player is currently active.
 
@@ -317,7 +319,7 @@ async def get_active_shard(
         https://developer.riotgames.com/apis#account-v1/GET_getActiveShard
     """
     return await fetch_with_cache(
-        cache_key=f"account:shard:{query.region}:{params.game}:{params.puuid}",
+        cache_key=key_for("account:shard", query.region, f"{params.game}:{params.puuid}"),
         resource_name="Active shard",
         fetch_fn=lambda: riot_client.get(
             f"/riot/account/v1/active-shards/by-game/{params.game}/by-puuid/{params.puuid}",
@@ -14,6 +14,7 @@ from app.config import settings
 from app.providers.base import ProviderType
 from app.providers.community_dragon import CommunityDragonProvider
 from app.providers.registry import get_provider
+from app.utils.dependencies import model_dependency
 
 router = APIRouter(prefix="/cdragon", tags=["community-dragon"])
 
@@ -36,7 +37,7 @@ class CommunityDragonQuery(BaseModel):
 
 @router.get("/chromas", summary="Get all chromas")
 async def get_chromas(
-    query: Annotated[CommunityDragonQuery, Depends()],
+    query: Annotated[CommunityDragonQuery, Depends(model_dependency(CommunityDragonQuery))],
 ):
     """
     Get all chroma data from Community Dragon.
@@ -73,12 +74,13 @@ async def get_chromas(
         ttl=settings.cache_ttl_ddragon,
         context={"version": version, "source": "community_dragon"},
         force_refresh=query.force,
+        negative_cache=True,
     )
 
 
 @router.get("/ward-skins", summary="Get all ward skins")
 async def get_ward_skins(
-    query: Annotated[CommunityDragonQuery, Depends()],
+    query: Annotated[CommunityDragonQuery, Depends(model_dependency(CommunityDragonQuery))],
 ):
     """
     Get all ward skin data from Community Dragon.
@@ -114,12 +116,13 @@ async def get_ward_skins(
         ttl=settings.cache_ttl_ddragon,
         context={"version": version, "source": "community_dragon"},
         force_refresh=query.force,
+        negative_cache=True,
     )
 
 
 @router.get("/missions", summary="Get missions/quests")
 async def get_missions(
-    query: Annotated[CommunityDragonQuery, Depends()],
+    query: Annotated[CommunityDragonQuery, Depends(model_dependency(CommunityDragonQuery))],
 ):
     """
     Get mission and quest data from Community Dragon.
@@ -157,12 +160,13 @@ async def get_missions(
         ttl=settings.cache_ttl_ddragon,
         context={"version": version, "source": "community_dragon"},
         force_refresh=query.force,
+        negative_cache=True,
     )
 
 
 @router.get("/champion-choices", summary="Get champion select choices")
 async def get_champion_choices(
-    query: Annotated[CommunityDragonQuery, Depends()],
+    query: Annotated[CommunityDragonQuery, Depends(model_dependency(CommunityDragonQuery))],
 ):
     """
     Get champion select choice data from Community Dragon.
@@ -196,12 +200,13 @@ async def get_champion_choices(
         ttl=settings.cache_ttl_ddragon,
         context={"version": version, "source": "community_dragon"},
         force_refresh=query.force,
+        negative_cache=True,
     )
 
 
 @router.get("/universes", summary="Get lore universes")
 async def get_universes(
-    query: Annotated[CommunityDragonQuery, Depends()],
+    query: Annotated[CommunityDragonQuery, Depends(model_dependency(CommunityDragonQuery))],
 ):
     """
     Get lore universe data from Community Dragon.
@@ -238,12 +243,13 @@ async def get_universes(
         ttl=settings.cache_ttl_ddragon,
         context={"version": version, "source": "community_dragon"},
         force_refresh=query.force,
+        negative_cache=True,
     )
 
 
 @router.get("/loot", summary="Get loot/crafting data")
 async def get_loot(
-    query: Annotated[CommunityDragonQuery, Depends()],
+    query: Annotated[CommunityDragonQuery, Depends(model_dependency(CommunityDragonQuery))],
 ):
     """
     Get loot and hextech crafting data from Community Dragon.
@@ -280,4 +286,5 @@ async def get_loot(
         ttl=settings.cache_ttl_ddragon,
         context={"version": version, "source": "community_dragon"},
         force_refresh=query.force,
+        negative_cache=True,
     )
@@ -15,6 +15,7 @@ from app.models.community_dragon import ChampionIdParams
 from app.providers.base import ProviderType
 from app.providers.community_dragon import CommunityDragonProvider
 from app.providers.registry import get_provider
+from app.utils.dependencies import model_dependency
 
 router = APIRouter(prefix="/cdragon", tags=["community-dragon"])
 
@@ -37,7 +38,7 @@ class CommunityDragonQuery(BaseModel):
 
 @router.get("/champions", summary="Get all champions (enhanced)")
 async def get_champions(
-    query: Annotated[CommunityDragonQuery, Depends()],
+    query: Annotated[CommunityDragonQuery, Depends(model_dependency(CommunityDragonQuery))],
 ):
     """
     Get enhanced data for all champions from Community Dragon.
@@ -75,12 +76,13 @@ async def get_champions(
         ttl=settings.cache_ttl_ddragon,
         context={"version": version, "source": "community_dragon"},
         force_refresh=query.force,
+        negative_cache=True,
     )
 
 
 @router.get("/champions/summary", summary="Get champion summary")
 async def get_champion_summary(
-    query: Annotated[CommunityDragonQuery, Depends()],
+    query: Annotated[CommunityDragonQuery, Depends(model_dependency(CommunityDragonQuery))],
 ):
     """
     Get lightweight champion summary data.
@@ -112,13 +114,14 @@ async def get_champion_summary(
         ttl=settings.cache_ttl_ddragon,
         context={"version": version, "source": "community_dragon"},
         force_refresh=query.force,
+        negative_cache=True,
     )
 
 
 @router.get("/champions/{champion_id}", summary="Get champion details (enhanced)")
 async def get_champion(
-    params: Annotated[ChampionIdParams, Depends()],
-    query: Annotated[CommunityDragonQuery, Depends()],
+    params: Annotated[ChampionIdParams, Depends(model_dependency(ChampionIdParams))],
+    query: Annotated[CommunityDragonQuery, Depends(model_dependency(CommunityDragonQuery))],
 ):
     """
     Get detailed enhanced data for a specific champion.
@@ -161,12 +164,13 @@ async def get_champion(
             "source": "community_dragon",
         },
         force_refresh=query.force,
+        negative_cache=True,
     )
 
 
 @router.get("/items", summary="Get all items (enhanced)")
 async def get_items(
-    query: Annotated[CommunityDragonQuery, Depends()],
+    query: Annotated[CommunityDragonQuery, Depends(model_dependency(CommunityDragonQuery))],
 ):
     """
     Get enhanced item data from Community Dragon.
@@ -202,12 +206,13 @@ async def get_items(
         ttl=settings.cache_ttl_ddragon,
         context={"version": version, "source": "community_dragon"},
         force_refresh=query.force,
+        negative_cache=True,
     )
 
 
 @router.get("/perks", summary="Get all perks/runes")
 async def get_perks(
-    query: Annotated[CommunityDragonQuery, Depends()],
+    query: Annotated[CommunityDragonQuery, Depends(model_dependency(CommunityDragonQuery))],
 ):
     """
     Get perk/rune data from Community Dragon.
@@ -238,12 +243,13 @@ async def get_perks(
         ttl=settings.cache_ttl_ddragon,
         context={"version": version, "source": "community_dragon"},
         force_refresh=query.force,
+        negative_cache=True,
     )
 
 
 @router.get("/summoner-spells", summary="Get summoner spells")
 async def get_summoner_spells(
-    query: Annotated[CommunityDragonQuery, Depends()],
+    query: Annotated[CommunityDragonQuery, Depends(model_dependency(CommunityDragonQuery))],
 ):
     """
     Get summoner spell data from Community Dragon.
@@ -275,4 +281,5 @@ async def get_summoner_spells(
         ttl=settings.cache_ttl_ddragon,
         context={"version": version, "source": "community_dragon"},
         force_refresh=query.force,
+        negative_cache=True,
     )
@@ -15,6 +15,7 @@ from app.models.community_dragon import SkinIdParams
 from app.providers.base import ProviderType
 from app.providers.community_dragon import CommunityDragonProvider
 from app.providers.registry import get_provider
+from app.utils.dependencies import model_dependency
 
 router = APIRouter(prefix="/cdragon", tags=["community-dragon"])
 
@@ -37,7 +38,7 @@ class SkinsQuery(BaseModel):
 
 @router.get("/skins", summary="Get all skins")
 async def get_skins(
-    query: Annotated[SkinsQuery, Depends()],
+    query: Annotated[SkinsQuery, Depends(model_dependency(SkinsQuery))],
 ):
     """
     Get data for all champion skins from Community Dragon.
@@ -76,13 +77,14 @@ async def get_skins(
         ttl=settings.cache_ttl_ddragon,
         context={"version": version, "source": "community_dragon"},
         force_refresh=query.force,
+        negative_cache=True,
     )
 
 
 @router.get("/skins/{skin_id}", summary="Get skin details")
 async def get_skin(
-    params: Annotated[SkinIdParams, Depends()],
-    query: Annotated[SkinsQuery, Depends()],
+    params: Annotated[SkinIdParams, Depends(model_dependency(SkinIdParams))],
+    query: Annotated[SkinsQuery, Depends(model_dependency(SkinsQuery))],
 ):
     """
     Get detailed data for a specific skin.
@@ -127,4 +129,5 @@ async def get_skin(
         ttl=settings.cache_ttl_ddragon,
         context={"skin_id": params.skin_id, "version": version, "source": "community_dragon"},
         force_refresh=query.force,
+        negative_cache=True,
     )
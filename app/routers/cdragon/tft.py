@@ -14,6 +14,7 @@ from app.config import settings
 from app.providers.base import ProviderType
 from app.providers.community_dragon import CommunityDragonProvider
 from app.providers.registry import get_provider
+from app.utils.dependencies import model_dependency
 
 router = APIRouter(prefix="/cdragon/tft", tags=["community-dragon", "tft"])
 
@@ -36,7 +37,7 @@ class TFTQuery(BaseModel):
 
 @router.get("/champions", summary="Get TFT champions")
 async def get_tft_champions(
-    query: Annotated[TFTQuery, Depends()],
+    query: Annotated[TFTQuery, Depends(model_dependency(TFTQuery))],
 ):
     """
     Get all TFT champion data from Community Dragon.
@@ -73,12 +74,13 @@ async def get_tft_champions(
         ttl=settings.cache_ttl_ddragon,
         context={"version": version, "source": "community_dragon", "game_mode": "tft"},
         force_refresh=query.force,
+        negative_cache=True,
     )
 
 
 @router.get("/items", summary="Get TFT items")
 async def get_tft_items(
-    query: Annotated[TFTQuery, Depends()],
+    query: Annotated[TFTQuery, Depends(model_dependency(TFTQuery))],
 ):
     """
     Get all TFT item data from Community Dragon.
@@ -114,12 +116,13 @@ async def get_tft_items(
         ttl=settings.cache_ttl_ddragon,
         context={"version": version, "source": "community_dragon", "game_mode": "tft"},
         force_refresh=query.force,
+        negative_cache=True,
     )
 
 
 @router.get("/traits", summary="Get TFT traits")
 async def get_tft_traits(
-    query: Annotated[TFTQuery, Depends()],
+    query: Annotated[TFTQuery, Depends(model_dependency(TFTQuery))],
 ):
     """
     Get all TFT trait data from Community Dragon.
@@ -162,12 +165,13 @@ async def get_tft_traits(
         ttl=settings.cache_ttl_ddragon,
         context={"version": version, "source": "community_dragon", "game_mode": "tft"},
         force_refresh=query.force,
+        negative_cache=True,
     )
 
 
 @router.get("/augments", summary="Get TFT augments")
 async def get_tft_augments(
-    query: Annotated[TFTQuery, Depends()],
+    query: Annotated[TFTQuery, Depends(model_dependency(TFTQuery))],
 ):
     """
     Get all TFT augment data from Community Dragon.
@@ -204,12 +208,13 @@ async def get_tft_augments(
         ttl=settings.cache_ttl_ddragon,
         context={"version": version, "source": "community_dragon", "game_mode": "tft"},
         force_refresh=query.force,
+        negative_cache=True,
     )
 
 
 @router.get("/tacticians", summary="Get TFT tacticians")
 async def get_tft_tacticians(
-    query: Annotated[TFTQuery, Depends()],
+    query: Annotated[TFTQuery, Depends(model_dependency(TFTQuery))],
 ):
     """
     Get all TFT tactician (Little Legend) data from Community Dragon.
@@ -246,4 +251,5 @@ async def get_tft_tacticians(
         ttl=settings.cache_ttl_ddragon,
         context={"version": version, "source": "community_dragon", "game_mode": "tft"},
         force_refresh=query.force,
+        negative_cache=True,
     )
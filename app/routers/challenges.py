@@ -7,6 +7,7 @@ https://developer.riotgames.com/apis#lol-challenges-v1
 from fastapi import APIRouter, Query
 
 from app.cache.helpers import fetch_with_cache
+from app.cache.redis_cache import key_for
 from app.config import settings
 from app.riot.client import riot_client
 
@@ -36,7 +37,7 @@ async def get_all_challenges_config(
         >>> curl "http://127.0.0.1:8080/lol/challenges/v1/challenges/config?region=euw1"
     """
     return await fetch_with_cache(
-        cache_key=f"challenges:config:{region}",
+        cache_key=key_for("challenges:config", region),
         resource_name="Challenges config",
         fetch_fn=lambda: riot_client.get("/lol/challenges/v1/challenges/config", region, False),
         ttl=settings.cache_ttl_challenges_config,
@@ -69,7 +70,7 @@ async def get_challenge_config(
         >>> curl "http://127.0.0.1:8080/lol/challenges/v1/challenges/1/config?region=euw1"
     """
     return await fetch_with_cache(
-        cache_key=f"challenges:config:{region}:{challengeId}",
+        cache_key=key_for("challenges:config", region, str(challengeId)),
         resource_name="Challenge config",
         fetch_fn=lambda: riot_client.get(
             f"/lol/challenges/v1/challenges/{challengeId}/config", region, False
@@ -112,7 +113,7 @@ async def get_challenge_leaderboard(
     params = {"limit": limit} if limit else None
 
     return await fetch_with_cache(
-        cache_key=f"challenges:leaderboard:{region}:{challengeId}:{level}:{limit}",
+        cache_key=key_for("challenges:leaderboard", region, f"{challengeId}:{level}:{limit}"),
         resource_name="Challenge leaderboard",
         fetch_fn=lambda: riot_client.get(path, region, False, params=params),
         ttl=settings.cache_ttl_challenges_leaderboard,
@@ -145,7 +146,7 @@ async def get_challenge_percentiles(
         >>> curl "http://127.0.0.1:8080/lol/challenges/v1/challenges/1/percentiles?region=euw1"
     """
     return await fetch_with_cache(
-        cache_key=f"challenges:percentiles:{region}:{challengeId}",
+        cache_key=key_for("challenges:percentiles", region, str(challengeId)),
         resource_name="Challenge percentiles",
         fetch_fn=lambda: riot_client.get(
             f"/lol/challenges/v1/challenges/{challengeId}/percentiles", region, False
@@ -180,7 +181,7 @@ async def get_player_challenges(
         >>> curl "http://127.0.0.1:8080/lol/challenges/v1/player-data/{puuid}?region=euw1"
     """
     return await fetch_with_cache(
-        cache_key=f"challenges:player:{region}:{puuid}",
+        cache_key=key_for("challenges:player", region, puuid),
         resource_name="Player challenges",
         fetch_fn=lambda: riot_client.get(f"/lol/challenges/v1/player-data/{puuid}", region, False),
         ttl=settings.cache_ttl_challenges_player,
@@ -33,6 +33,7 @@ See Also:
 from fastapi import APIRouter, Query
 
 from app.cache.helpers import fetch_with_cache
+from app.cache.redis_cache import key_for
 from app.config import settings
 from app.riot.client import riot_client
 
@@ -116,7 +117,7 @@ async def get_champion_rotations(
         https://developer.riotgames.com/apis#champion-v3/GET_getChampionInfo
     """
     return await fetch_with_cache(
-        cache_key=f"champion:rotation:{region}",
+        cache_key=key_for("champion:rotation", region),
         resource_name="Champion rotation",
         fetch_fn=lambda: riot_client.get("/lol/platform/v3/champion-rotations", region, False),
         ttl=settings.cache_ttl_champion_rotation,
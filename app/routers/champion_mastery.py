@@ -7,6 +7,7 @@ https://developer.riotgames.com/apis#champion-mastery-v4
 from fastapi import APIRouter, Query
 
 from app.cache.helpers import fetch_with_cache
+from app.cache.redis_cache import key_for
 from app.config import settings
 from app.riot.client import riot_client
 
@@ -37,7 +38,7 @@ async def get_all_champion_masteries(
         >>> curl "http://127.0.0.1:8080/lol/champion-mastery/v4/champion-masteries/by-puuid/{puuid}?region=euw1"
     """
     return await fetch_with_cache(
-        cache_key=f"mastery:all:{region}:{puuid}",
+        cache_key=key_for("mastery:all", region, puuid),
         resource_name="Champion masteries",
         fetch_fn=lambda: riot_client.get(
             f"/lol/champion-mastery/v4/champion-masteries/by-puuid/{puuid}", region, False
@@ -74,7 +75,7 @@ async def get_champion_mastery(
         >>> curl "http://127.0.0.1:8080/lol/champion-mastery/v4/champion-masteries/by-puuid/{puuid}/by-champion/1?region=euw1"
     """
     return await fetch_with_cache(
-        cache_key=f"mastery:champion:{region}:{puuid}:{championId}",
+        cache_key=key_for("mastery:champion", region, f"{puuid}:{championId}"),
         resource_name="Champion mastery",
         fetch_fn=lambda: riot_client.get(
             f"/lol/champion-mastery/v4/champion-masteries/by-puuid/{puuid}/by-champion/{championId}",
@@ -113,7 +114,7 @@ async def get_top_champion_masteries(
         >>> curl "http://127.0.0.1:8080/lol/champion-mastery/v4/champion-masteries/by-puuid/{puuid}/top?region=euw1&count=5"
     """
     return await fetch_with_cache(
-        cache_key=f"mastery:top:{region}:{puuid}:{count}",
+        cache_key=key_for("mastery:top", region, f"{puuid}:{count}"),
         resource_name="Top champion masteries",
         fetch_fn=lambda: riot_client.get(
             f"/lol/champion-mastery/v4/champion-masteries/by-puuid/{puuid}/top",
@@ -149,7 +150,7 @@ async def get_mastery_score(
         >>> curl "http://127.0.0.1:8080/lol/champion-mastery/v4/scores/by-puuid/{puuid}?region=euw1"
     """
     return await fetch_with_cache(
-        cache_key=f"mastery:score:{region}:{puuid}",
+        cache_key=key_for("mastery:score", region, puuid),
         resource_name="Mastery score",
         fetch_fn=lambda: riot_client.get(
             f"/lol/champion-mastery/v4/scores/by-puuid/{puuid}", region, False
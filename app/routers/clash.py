@@ -7,6 +7,7 @@ https://developer.riotgames.com/apis#clash-v1
 from fastapi import APIRouter, Query
 
 from app.cache.helpers import fetch_with_cache
+from app.cache.redis_cache import key_for
 from app.config import settings
 from app.riot.client import riot_client
 
@@ -37,7 +38,7 @@ async def get_clash_player(
         >>> curl "http://127.0.0.1:8080/lol/clash/v1/players/by-puuid/{puuid}?region=euw1"
     """
     return await fetch_with_cache(
-        cache_key=f"clash:player:{region}:{puuid}",
+        cache_key=key_for("clash:player", region, puuid),
         resource_name="Clash player",
         fetch_fn=lambda: riot_client.get(f"/lol/clash/v1/players/by-puuid/{puuid}", region, False),
         ttl=settings.cache_ttl_clash_player,
@@ -69,7 +70,7 @@ async def get_clash_team(
         >>> curl "http://127.0.0.1:8080/lol/clash/v1/teams/{teamId}?region=euw1"
     """
     return await fetch_with_cache(
-        cache_key=f"clash:team:{region}:{teamId}",
+        cache_key=key_for("clash:team", region, teamId),
         resource_name="Clash team",
         fetch_fn=lambda: riot_client.get(f"/lol/clash/v1/teams/{teamId}", region, False),
         ttl=settings.cache_ttl_clash_team,
@@ -99,7 +100,7 @@ async def get_clash_tournaments(
         >>> curl "http://127.0.0.1:8080/lol/clash/v1/tournaments?region=euw1"
     """
     return await fetch_with_cache(
-        cache_key=f"clash:tournaments:{region}",
+        cache_key=key_for("clash:tournaments", region),
         resource_name="Clash tournaments",
         fetch_fn=lambda: riot_client.get("/lol/clash/v1/tournaments", region, False),
         ttl=settings.cache_ttl_clash_tournament,
@@ -131,7 +132,7 @@ async def get_clash_tournament(
         >>> curl "http://127.0.0.1:8080/lol/clash/v1/tournaments/{tournamentId}?region=euw1"
     """
     return await fetch_with_cache(
-        cache_key=f"clash:tournament:{region}:{tournamentId}",
+        cache_key=key_for("clash:tournament", region, str(tournamentId)),
         resource_name="Clash tournament",
         fetch_fn=lambda: riot_client.get(
             f"/lol/clash/v1/tournaments/{tournamentId}", region, False
@@ -165,7 +166,7 @@ async def get_clash_tournament_by_team(
         >>> curl "http://127.0.0.1:8080/lol/clash/v1/tournaments/by-team/{teamId}?region=euw1"
     """
     return await fetch_with_cache(
-        cache_key=f"clash:tournament:team:{region}:{teamId}",
+        cache_key=key_for("clash:tournament:team", region, teamId),
         resource_name="Clash tournament by team",
         fetch_fn=lambda: riot_client.get(
             f"/lol/clash/v1/tournaments/by-team/{teamId}", region, False
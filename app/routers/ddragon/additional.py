@@ -14,6 +14,7 @@ from app.config import settings
 from app.providers.base import ProviderType
 from app.providers.data_dragon import DataDragonProvider
 from app.providers.registry import get_provider
+from app.utils.dependencies import model_dependency
 
 router = APIRouter(prefix="/ddragon", tags=["data-dragon"])
 
@@ -43,7 +44,7 @@ class StaticDataQuery(BaseModel):
 
 @router.get("/maps", summary="Get map data")
 async def get_maps(
-    query: Annotated[StaticDataQuery, Depends()],
+    query: Annotated[StaticDataQuery, Depends(model_dependency(StaticDataQuery))],
 ):
     """
     Get map data including Summoner's Rift, ARAM, and other game modes.
@@ -76,12 +77,13 @@ async def get_maps(
         ttl=settings.cache_ttl_ddragon,
         context={"version": version, "locale": locale},
         force_refresh=query.force,
+        negative_cache=True,
     )
 
 
 @router.get("/mission-assets", summary="Get mission assets")
 async def get_mission_assets(
-    query: Annotated[StaticDataQuery, Depends()],
+    query: Annotated[StaticDataQuery, Depends(model_dependency(StaticDataQuery))],
 ):
     """
     Get mission and event assets data.
@@ -116,12 +118,13 @@ async def get_mission_assets(
         ttl=settings.cache_ttl_ddragon,
         context={"version": version, "locale": locale},
         force_refresh=query.force,
+        negative_cache=True,
     )
 
 
 @router.get("/stickers", summary="Get stickers/emotes")
 async def get_stickers(
-    query: Annotated[StaticDataQuery, Depends()],
+    query: Annotated[StaticDataQuery, Depends(model_dependency(StaticDataQuery))],
 ):
     """
     Get sticker and emote data.
@@ -154,12 +157,13 @@ async def get_stickers(
         ttl=settings.cache_ttl_ddragon,
         context={"version": version, "locale": locale},
         force_refresh=query.force,
+        negative_cache=True,
     )
 
 
 @router.get("/language-strings", summary="Get language/translation strings")
 async def get_language_strings(
-    query: Annotated[StaticDataQuery, Depends()],
+    query: Annotated[StaticDataQuery, Depends(model_dependency(StaticDataQuery))],
 ):
     """
     Get language and translation strings for UI elements.
@@ -189,12 +193,13 @@ async def get_language_strings(
         ttl=settings.cache_ttl_ddragon,
         context={"version": version, "locale": locale},
         force_refresh=query.force,
+        negative_cache=True,
     )
 
 
 @router.get("/champions-full", summary="Get complete champion data (bulk)")
 async def get_champions_full(
-    query: Annotated[StaticDataQuery, Depends()],
+    query: Annotated[StaticDataQuery, Depends(model_dependency(StaticDataQuery))],
 ):
     """
     Get complete champion data for ALL champions in a single request.
@@ -249,4 +254,5 @@ async def get_champions_full(
         ttl=settings.cache_ttl_ddragon,
         context={"version": version, "locale": locale, "type": "full"},
         force_refresh=query.force,
+        negative_cache=True,
     )
@@ -15,6 +15,7 @@ from app.models.data_dragon import ChampionIdParams
 from app.providers.base import ProviderType
 from app.providers.data_dragon import DataDragonProvider
 from app.providers.registry import get_provider
+from app.utils.dependencies import model_dependency
 
 router = APIRouter(prefix="/ddragon", tags=["data-dragon"])
 
@@ -44,7 +45,7 @@ class ChampionQuery(BaseModel):
 
 @router.get("/champions", summary="Get all champions")
 async def get_all_champions(
-    query: Annotated[ChampionQuery, Depends()],
+    query: Annotated[ChampionQuery, Depends(model_dependency(ChampionQuery))],
 ):
     """
     Get data for all champions.
@@ -93,13 +94,14 @@ async def get_all_champions(
         ttl=settings.cache_ttl_ddragon,
         context={"version": version, "locale": locale},
         force_refresh=query.force,
+        negative_cache=True,
     )
 
 
 @router.get("/champions/{champion_id}", summary="Get champion details")
 async def get_champion(
-    params: Annotated[ChampionIdParams, Depends()],
-    query: Annotated[ChampionQuery, Depends()],
+    params: Annotated[ChampionIdParams, Depends(model_dependency(ChampionIdParams))],
+    query: Annotated[ChampionQuery, Depends(model_dependency(ChampionQuery))],
 ):
     """
     Get detailed data for a specific champion.
@@ -153,4 +155,5 @@ async def get_champion(
         ttl=settings.cache_ttl_ddragon,
         context={"champion_id": params.champion_id, "version": version, "locale": locale},
         force_refresh=query.force,
+        negative_cache=True,
     )
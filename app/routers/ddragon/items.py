@@ -14,6 +14,7 @@ from app.config import settings
 from app.providers.base import ProviderType
 from app.providers.data_dragon import DataDragonProvider
 from app.providers.registry import get_provider
+from app.utils.dependencies import model_dependency
 
 router = APIRouter(prefix="/ddragon", tags=["data-dragon"])
 
@@ -43,7 +44,7 @@ class StaticDataQuery(BaseModel):
 
 @router.get("/items", summary="Get all items")
 async def get_items(
-    query: Annotated[StaticDataQuery, Depends()],
+    query: Annotated[StaticDataQuery, Depends(model_dependency(StaticDataQuery))],
 ):
     """
     Get data for all items.
@@ -84,12 +85,13 @@ async def get_items(
         ttl=settings.cache_ttl_ddragon,
         context={"version": version, "locale": locale},
         force_refresh=query.force,
+        negative_cache=True,
     )
 
 
 @router.get("/runes", summary="Get all runes")
 async def get_runes(
-    query: Annotated[StaticDataQuery, Depends()],
+    query: Annotated[StaticDataQuery, Depends(model_dependency(StaticDataQuery))],
 ):
     """
     Get data for all runes (Runes Reforged).
@@ -137,12 +139,13 @@ async def get_runes(
         ttl=settings.cache_ttl_ddragon,
         context={"version": version, "locale": locale},
         force_refresh=query.force,
+        negative_cache=True,
     )
 
 
 @router.get("/summoner-spells", summary="Get all summoner spells")
 async def get_summoner_spells(
-    query: Annotated[StaticDataQuery, Depends()],
+    query: Annotated[StaticDataQuery, Depends(model_dependency(StaticDataQuery))],
 ):
     """
     Get data for all summoner spells.
@@ -182,12 +185,13 @@ async def get_summoner_spells(
         ttl=settings.cache_ttl_ddragon,
         context={"version": version, "locale": locale},
         force_refresh=query.force,
+        negative_cache=True,
     )
 
 
 @router.get("/profile-icons", summary="Get all profile icons")
 async def get_profile_icons(
-    query: Annotated[StaticDataQuery, Depends()],
+    query: Annotated[StaticDataQuery, Depends(model_dependency(StaticDataQuery))],
 ):
     """
     Get data for all profile icons.
@@ -221,4 +225,5 @@ async def get_profile_icons(
         ttl=settings.cache_ttl_ddragon,
         context={"version": version, "locale": locale},
         force_refresh=query.force,
+        negative_cache=True,
     )
@@ -14,6 +14,7 @@ from app.config import settings
 from app.models.data_dragon import RealmRegionParams
 from app.providers.base import ProviderType
 from app.providers.registry import get_provider
+from app.utils.dependencies import model_dependency
 
 router = APIRouter(prefix="/ddragon", tags=["data-dragon"])
 
@@ -29,7 +30,7 @@ class VersionQuery(BaseModel):
 
 @router.get("/versions", summary="Get available game versions")
 async def get_versions(
-    query: Annotated[VersionQuery, Depends()],
+    query: Annotated[VersionQuery, Depends(model_dependency(VersionQuery))],
 ):
     """
     Get list of all available League of Legends game versions.
@@ -50,12 +51,13 @@ async def get_versions(
         ttl=settings.cache_ttl_ddragon,
         context={"endpoint": "versions"},
         force_refresh=query.force,
+        negative_cache=True,
     )
 
 
 @router.get("/languages", summary="Get available languages")
 async def get_languages(
-    query: Annotated[VersionQuery, Depends()],
+    query: Annotated[VersionQuery, Depends(model_dependency(VersionQuery))],
 ):
     """
     Get list of all available language codes.
@@ -74,13 +76,14 @@ async def get_languages(
         ttl=settings.cache_ttl_ddragon,
         context={"endpoint": "languages"},
         force_refresh=query.force,
+        negative_cache=True,
     )
 
 
 @router.get("/realms/{region}", summary="Get realm data for region")
 async def get_realm(
-    params: Annotated[RealmRegionParams, Depends()],
-    query: Annotated[VersionQuery, Depends()],
+    params: Annotated[RealmRegionParams, Depends(model_dependency(RealmRegionParams))],
+    query: Annotated[VersionQuery, Depends(model_dependency(VersionQuery))],
 ):
     """
     Get realm data for a specific region.
@@ -115,4 +118,5 @@ async def get_realm(
         ttl=settings.cache_ttl_ddragon,
         context={"endpoint": "realm", "region": params.region},
         force_refresh=query.force,
+        negative_cache=True,
     )
@@ -49,6 +49,7 @@ See Also:
 from fastapi import APIRouter, Depends
 
 from app.cache.helpers import fetch_with_cache
+from app.cache.redis_cache import key_for
 from app.config import settings
 from app.models.league import (
     LeagueByQueueParams,
@@ -59,14 +60,15 @@ from app.models.league import (
     LeagueEntriesQuery,
 )
 from app.riot.client import riot_client
+from app.utils.dependencies import model_dependency
 
 router = APIRouter(prefix="/lol/league/v4", tags=["league"])
 
 
 @router.get("/challengerleagues/by-queue/{queue}")
 async def get_challenger_league(
-    params: LeagueByQueueParams = Depends(),
-    query: LeagueByQueueQuery = Depends(),
+    params: LeagueByQueueParams = Depends(model_dependency(LeagueByQueueParams)),
+    query: LeagueByQueueQuery = Depends(model_dependency(LeagueByQueueQuery)),
 ):
     """Retrieves the complete Challenger tier league for a specific ranked queue.
 
@@ -149,7 +151,7 @@ async def get_challenger_league(
         https://developer.riotgames.com/apis#league-v4/GET_getChallengerLeague
     """
     return await fetch_with_cache(
-        cache_key=f"league:challenger:{query.region}:{params.queue}",
+        cache_key=key_for("league:challenger", query.region, params.queue),
         resource_name="Challenger league",
         fetch_fn=lambda: riot_client.get(
             f"/lol/league/v4/challengerleagues/by-queue/{params.queue}", query.region, False
@@ -161,8 +163,8 @@ async def get_challenger_league(
 
 @router.get("/grandmasterleagues/by-queue/{queue}")
 async def get_grandmaster_league(
-    params: LeagueByQueueParams = Depends(),
-    query: LeagueByQueueQuery = Depends(),
+    params: LeagueByQueueParams = Depends(model_dependency(LeagueByQueueParams)),
+    query: LeagueByQueueQuery = Depends(model_dependency(LeagueByQueueQuery)),
 ):
     """
     Retrieves the Grandmaster league for a specific queue.
@@ -183,7 +185,7 @@ async def get_grandmaster_league(
         >>> curl "http://127.0.0.1:8080/lol/league/v4/grandmasterleagues/by-queue/RANKED_SOLO_5x5?region=euw1"
     """
     return await fetch_with_cache(
-        cache_key=f"league:grandmaster:{query.region}:{params.queue}",
+        cache_key=key_for("league:grandmaster", query.region, params.queue),
         resource_name="Grandmaster league",
         fetch_fn=lambda: riot_client.get(
             f"/lol/league/v4/grandmasterleagues/by-queue/{params.queue}", query.region, False
@@ -195,8 +197,8 @@ async def get_grandmaster_league(
 
 @router.get("/masterleagues/by-queue/{queue}")
 async def get_master_league(
-    params: LeagueByQueueParams = Depends(),
-    query: LeagueByQueueQuery = Depends(),
+    params: LeagueByQueueParams = Depends(model_dependency(LeagueByQueueParams)),
+    query: LeagueByQueueQuery = Depends(model_dependency(LeagueByQueueQuery)),
 ):
     """
     Retrieves the Master league for a specific queue.
@@ -217,7 +219,7 @@ async def get_master_league(
         >>> curl "http://127.0.0.1:8080/lol/league/v4/masterleagues/by-queue/RANKED_SOLO_5x5?region=euw1"
     """
     return await fetch_with_cache(
-        cache_key=f"league:master:{query.region}:{params.queue}",
+        cache_key=key_for("league:master", query.region, params.queue),
         resource_name="Master league",
         fetch_fn=lambda: riot_client.get(
             f"/lol/league/v4/masterleagues/by-queue/{params.queue}", query.region, False
@@ -229,8 +231,10 @@ async def get_master_league(
 
 @router.get("/entries/by-summoner/{encryptedSummonerId}")
 async def get_league_entries_by_summoner(
-    params: LeagueEntriesBySummonerParams = Depends(),
-    query: LeagueEntriesBySummonerQuery = Depends(),
+    params: LeagueEntriesBySummonerParams = Depends(
+        model_dependency(LeagueEntriesBySummonerParams)
+    ),
+    query: LeagueEntriesBySummonerQuery = Depends(model_dependency(LeagueEntriesBySummonerQuery)),
 ):
     """
     Retrieves the league entries for a summoner across all queues.
@@ -251,7 +255,7 @@ async def get_league_entries_by_summoner(
         >>> curl "http://127.0.0.1:8080/lol/league/v4/entries/by-summoner/{encryptedSummonerId}?region=euw1"
     """
     return await fetch_with_cache(
-        cache_key=f"league:entries:summoner:{query.region}:{params.encryptedSummonerId}",
+        cache_key=key_for("league:entries:summoner", query.region, params.encryptedSummonerId),
         resource_name="League entries",
         fetch_fn=lambda: riot_client.get(
             f"/lol/league/v4/entries/by-summoner/{params.encryptedSummonerId}", query.region, False
@@ -263,8 +267,8 @@ async def get_league_entries_by_summoner(
 
 @router.get("/entries/{queue}/{tier}/{division}")
 async def get_league_entries(
-    params: LeagueEntriesParams = Depends(),
-    query: LeagueEntriesQuery = Depends(),
+    params: LeagueEntriesParams = Depends(model_dependency(LeagueEntriesParams)),
+    query: LeagueEntriesQuery = Depends(model_dependency(LeagueEntriesQuery)),
 ):
     """
     Retrieves league entries by queue, tier, and division.
@@ -290,7 +294,11 @@ async def get_league_entries(
         path += f"?page={query.page}"
 
     return await fetch_with_cache(
-        cache_key=f"league:entries:{query.region}:{params.queue}:{params.tier}:{params.division}:{query.page}",
+        cache_key=key_for(
+            "league:entries",
+            query.region,
+            f"{params.queue}:{params.tier}:{params.division}:{query.page}",
+        ),
         resource_name="League entries",
         fetch_fn=lambda: riot_client.get(path, query.region, False),
         ttl=settings.cache_ttl_league,
@@ -9,17 +9,19 @@ Note: This is an experimental API providing paginated league entries.
 from fastapi import APIRouter, Depends
 
 from app.cache.helpers import fetch_with_cache
+from app.cache.redis_cache import key_for
 from app.config import settings
 from app.models.league_exp import LeagueExpEntriesParams, LeagueExpEntriesQuery
 from app.riot.client import riot_client
+from app.utils.dependencies import model_dependency
 
 router = APIRouter(prefix="/lol/league-exp/v4", tags=["league-exp"])
 
 
 @router.get("/entries/{queue}/{tier}/{division}")
 async def get_league_exp_entries(
-    params: LeagueExpEntriesParams = Depends(),
-    query: LeagueExpEntriesQuery = Depends(),
+    params: LeagueExpEntriesParams = Depends(model_dependency(LeagueExpEntriesParams)),
+    query: LeagueExpEntriesQuery = Depends(model_dependency(LeagueExpEntriesQuery)),
 ):
     """
     Retrieves league entries from the experimental endpoint.
@@ -45,7 +47,11 @@ async def get_league_exp_entries(
         path += f"?page={query.page}"
 
     return await fetch_with_cache(
-        cache_key=f"league-exp:entries:{query.region}:{params.queue}:{params.tier}:{params.division}:{query.page}",
+        cache_key=key_for(
+            "league-exp:entries",
+            query.region,
+            f"{params.queue}:{params.tier}:{params.division}:{query.page}",
+        ),
         resource_name="League exp entries",
         fetch_fn=lambda: riot_client.get(path, query.region, False),
         ttl=settings.cache_ttl_league,
@@ -61,6 +61,7 @@ from fastapi import APIRouter, Depends
 from loguru import logger
 
 from app.cache.helpers import fetch_with_cache
+from app.cache.redis_cache import key_for
 from app.cache.tracking import tracker
 from app.config import settings
 from app.models.match import (
@@ -72,14 +73,15 @@ from app.models.match import (
     MatchTimelineQuery,
 )
 from app.riot.client import riot_client
+from app.utils.dependencies import model_dependency
 
 router = APIRouter(prefix="/lol/match/v5", tags=["match"])
 
 
 @router.get("/matches/by-puuid/{puuid}/ids")
 async def get_match_ids_by_puuid(
-    params: Annotated[MatchIdsByPuuidParams, Depends()],
-    query: Annotated[MatchIdsByPuuidQuery, Depends()],
+    params: Annotated[MatchIdsByPuuidParams, Depends(model_dependency(MatchIdsByPuuidParams))],
+    query: Annotated[MatchIdsByPuuidQuery, Depends(model_dependency(MatchIdsByPuuidQuery))],
 ):
     """
     Retrieves a list of match IDs for a summoner.
@@ -134,8 +136,8 @@ async def get_match_ids_by_puuid(
 
 @router.get("/matches/{matchId}")
 async def get_match(
-    params: Annotated[MatchParams, Depends()],
-    query: Annotated[MatchQuery, Depends()],
+    params: Annotated[MatchParams, Depends(model_dependency(MatchParams))],
+    query: Annotated[MatchQuery, Depends(model_dependency(MatchQuery))],
 ):
     """
     Retrieves match details by match ID.
@@ -165,7 +167,7 @@ async def get_match(
     # Use helper with force_refresh flag based on force parameter and processed status
     # If force=True OR not processed yet, skip cache check
     data = await fetch_with_cache(
-        cache_key=f"match:{query.region}:{params.matchId}",
+        cache_key=key_for("match", query.region, params.matchId),
         resource_name="Match data",
         fetch_fn=lambda: riot_client.get(
             f"/lol/match/v5/matches/{params.matchId}", query.region, True
@@ -184,8 +186,8 @@ async def get_match(
 
 @router.get("/matches/{matchId}/timeline")
 async def get_match_timeline(
-    params: Annotated[MatchTimelineParams, Depends()],
-    query: Annotated[MatchTimelineQuery, Depends()],
+    params: Annotated[MatchTimelineParams, Depends(model_dependency(MatchTimelineParams))],
+    query: Annotated[MatchTimelineQuery, Depends(model_dependency(MatchTimelineQuery))],
 ):
     """
     Retrieves the timeline for a specific match.
@@ -206,7 +208,7 @@ async def get_match_timeline(
         >>> curl "http://127.0.0.1:8080/lol/match/v5/matches/EUW1_123456789/timeline?region=americas"
     """
     return await fetch_with_cache(
-        cache_key=f"match:timeline:{query.region}:{params.matchId}",
+        cache_key=key_for("match:timeline", query.region, params.matchId),
         resource_name="Match timeline",
         fetch_fn=lambda: riot_client.get(
             f"/lol/match/v5/matches/{params.matchId}/timeline", query.region, True
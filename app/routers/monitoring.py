@@ -9,7 +9,7 @@ Provides detailed monitoring including:
 - Alert status and history
 """
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Response
 from loguru import logger
 
 from app.middleware.error_monitoring import get_global_error_monitor
@@ -36,7 +36,9 @@ async def get_error_metrics():
     - Active alerts
 
     Returns:
-        ErrorMetrics object with current error statistics
+        ErrorMetrics object with current error statistics, serialized
+        directly (the model was just built by the monitor, so it is not
+        validated again as the response model)
 
     Example:
         >>> curl "http://127.0.0.1:8080/monitoring/errors"
@@ -44,7 +46,8 @@ async def get_error_metrics():
     logger.debug("Error metrics requested")
 
     error_monitor = get_error_monitoring()
-    return error_monitor.get_error_metrics()
+    metrics = error_monitor.get_error_metrics()
+    return Response(metrics.model_dump_json(), media_type="application/json")
 
 
 @router.get("/monitoring/errors/recent")
@@ -7,6 +7,7 @@ https://developer.riotgames.com/apis#lol-status-v4
 from fastapi import APIRouter, Query
 
 from app.cache.helpers import fetch_with_cache
+from app.cache.redis_cache import key_for
 from app.config import settings
 from app.riot.client import riot_client
 
@@ -36,7 +37,7 @@ async def get_platform_status(
         >>> curl "http://127.0.0.1:8080/lol/status/v4/platform-data?region=euw1"
     """
     return await fetch_with_cache(
-        cache_key=f"platform:status:{region}",
+        cache_key=key_for("platform:status", region),
         resource_name="Platform status",
         fetch_fn=lambda: riot_client.get("/lol/status/v4/platform-data", region, False),
         ttl=settings.cache_ttl_platform_status,
@@ -62,17 +62,19 @@ See Also:
 from fastapi import APIRouter, Depends
 
 from app.cache.helpers import fetch_with_cache
+from app.cache.redis_cache import key_for
 from app.config import settings
 from app.models.spectator import ActiveGameParams, ActiveGameQuery, FeaturedGamesQuery
 from app.riot.client import riot_client
+from app.utils.dependencies import model_dependency
 
 router = APIRouter(prefix="/lol/spectator/v5", tags=["spectator"])
 
 
 @router.get("/active-games/by-summoner/{encryptedPUUID}")
 async def get_active_game(
-    params: ActiveGameParams = Depends(),
-    query: ActiveGameQuery = Depends(),
+    params: ActiveGameParams = Depends(model_dependency(ActiveGameParams)),
+    query: ActiveGameQuery = Depends(model_dependency(ActiveGameQuery)),
 ):
     """
     Retrieves the active game for a summoner.
@@ -95,7 +97,7 @@ async def get_active_game(
         >>> curl "http://127.0.0.1:8080/lol/spectator/v5/active-games/by-summoner/{encryptedPUUID}?region=euw1"
     """
     return await fetch_with_cache(
-        cache_key=f"spectator:active:{query.region}:{params.encryptedPUUID}",
+        cache_key=key_for("spectator:active", query.region, params.encryptedPUUID),
         resource_name="Active game",
         fetch_fn=lambda: riot_client.get(
             f"/lol/spectator/v5/active-games/by-summoner/{params.encryptedPUUID}",
@@ -109,7 +111,7 @@ async def get_active_game(
 
 @router.get("/featured-games")
 async def get_featured_games(
-    query: FeaturedGamesQuery = Depends(),
+    query: FeaturedGamesQuery = Depends(model_dependency(FeaturedGamesQuery)),
 ):
     """
     Retrieves a list of featured games.
@@ -130,7 +132,7 @@ async def get_featured_games(
         >>> curl "http://127.0.0.1:8080/lol/spectator/v5/featured-games?region=euw1"
     """
     return await fetch_with_cache(
-        cache_key=f"spectator:featured:{query.region}",
+        cache_key=key_for("spectator:featured", query.region),
         resource_name="Featured games",
         fetch_fn=lambda: riot_client.get("/lol/spectator/v5/featured-games", query.region, False),
         ttl=settings.cache_ttl_spectator_featured,
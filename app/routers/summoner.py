@@ -65,6 +65,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends
 
 from app.cache.helpers import fetch_with_cache
+from app.cache.redis_cache import key_for
 from app.config import settings
 from app.models.summoner import (
     SummonerByIdParams,
@@ -75,14 +76,15 @@ from app.models.summoner import (
     SummonerByPuuidQuery,
 )
 from app.riot.client import riot_client
+from app.utils.dependencies import model_dependency
 
 router = APIRouter(prefix="/lol/summoner/v4", tags=["summoner"])
 
 
 @router.get("/summoners/by-name/{summonerName}")
 async def get_summoner_by_name(
-    params: Annotated[SummonerByNameParams, Depends()],
-    query: Annotated[SummonerByNameQuery, Depends()],
+    params: Annotated[SummonerByNameParams, Depends(model_dependency(SummonerByNameParams))],
+    query: Annotated[SummonerByNameQuery, Depends(model_dependency(SummonerByNameQuery))],
 ):
     """
     Retrieves a summoner by their summoner name.
@@ -104,7 +106,7 @@ async def get_summoner_by_name(
         >>> curl "http://127.0.0.1:8080/lol/summoner/v4/summoners/by-name/Faker?region=kr"
     """
     return await fetch_with_cache(
-        cache_key=f"summoner:name:{query.region}:{params.summonerName}",
+        cache_key=key_for("summoner:name", query.region, params.summonerName),
         resource_name="Summoner",
         fetch_fn=lambda: riot_client.get(
             f"/lol/summoner/v4/summoners/by-name/{params.summonerName}", query.region, False
@@ -116,8 +118,8 @@ async def get_summoner_by_name(
 
 @router.get("/summoners/by-puuid/{encryptedPUUID}")
 async def get_summoner_by_puuid(
-    params: Annotated[SummonerByPuuidParams, Depends()],
-    query: Annotated[SummonerByPuuidQuery, Depends()],
+    params: Annotated[SummonerByPuuidParams, Depends(model_dependency(SummonerByPuuidParams))],
+    query: Annotated[SummonerByPuuidQuery, Depends(model_dependency(SummonerByPuuidQuery))],
 ):
     """
     Retrieves a summoner by their PUUID.
@@ -138,7 +140,7 @@ async def get_summoner_by_puuid(
         >>> curl "http://127.0.0.1:8080/lol/summoner/v4/summoners/by-puuid/{encryptedPUUID}?region=euw1"
     """
     return await fetch_with_cache(
-        cache_key=f"summoner:puuid:{query.region}:{params.encryptedPUUID}",
+        cache_key=key_for("summoner:puuid", query.region, params.encryptedPUUID),
         resource_name="Summoner",
         fetch_fn=lambda: riot_client.get(
             f"/lol/summoner/v4/summoners/by-puuid/{params.encryptedPUUID}", query.region, False
@@ -150,8 +152,8 @@ async def get_summoner_by_puuid(
 
 @router.get("/summoners/{encryptedSummonerId}")
 async def get_summoner_by_id(
-    params: Annotated[SummonerByIdParams, Depends()],
-    query: Annotated[SummonerByIdQuery, Depends()],
+    params: Annotated[SummonerByIdParams, Depends(model_dependency(SummonerByIdParams))],
+    query: Annotated[SummonerByIdQuery, Depends(model_dependency(SummonerByIdQuery))],
 ):
     """
     Retrieves a summoner by their summoner ID.
@@ -172,7 +174,7 @@ async def get_summoner_by_id(
         >>> curl "http://127.0.0.1:8080/lol/summoner/v4/summoners/{encryptedSummonerId}?region=euw1"
     """
     return await fetch_with_cache(
-        cache_key=f"summoner:id:{query.region}:{params.encryptedSummonerId}",
+        cache_key=key_for("summoner:id", query.region, params.encryptedSummonerId),
         resource_name="Summoner",
         fetch_fn=lambda: riot_client.get(
             f"/lol/summoner/v4/summoners/{params.encryptedSummonerId}", query.region, False
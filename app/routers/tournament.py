@@ -84,6 +84,7 @@ from typing import Annotated
 from fastapi import APIRouter, Body, Query
 
 from app.cache.helpers import fetch_with_cache
+from app.cache.redis_cache import key_for
 from app.config import settings
 from app.riot.client import riot_client
 
@@ -241,7 +242,7 @@ async def get_tournament_code(
         >>> curl "http://127.0.0.1:8080/lol/tournament/v5/codes/{tournamentCode}?region=euw1"
     """
     return await fetch_with_cache(
-        cache_key=f"tournament:code:{region}:{tournamentCode}",
+        cache_key=key_for("tournament:code", region, tournamentCode),
         resource_name="Tournament code details",
         fetch_fn=lambda: riot_client.get(
             f"/lol/tournament/v5/codes/{tournamentCode}", region, False
@@ -322,7 +323,7 @@ async def get_lobby_events(
         >>> curl "http://127.0.0.1:8080/lol/tournament/v5/lobby-events/by-code/{tournamentCode}?region=euw1"
     """
     return await fetch_with_cache(
-        cache_key=f"tournament:lobby_events:{region}:{tournamentCode}",
+        cache_key=key_for("tournament:lobby_events", region, tournamentCode),
         resource_name="Tournament lobby events",
         fetch_fn=lambda: riot_client.get(
             f"/lol/tournament/v5/lobby-events/by-code/{tournamentCode}", region, False
@@ -100,6 +100,7 @@ from typing import Annotated
 from fastapi import APIRouter, Body, Query
 
 from app.cache.helpers import fetch_with_cache
+from app.cache.redis_cache import key_for
 from app.config import settings
 from app.riot.client import riot_client
 
@@ -258,7 +259,7 @@ async def get_tournament_code(
         >>> curl "http://127.0.0.1:8080/lol/tournament-stub/v5/codes/{tournamentCode}?region=euw1"
     """
     return await fetch_with_cache(
-        cache_key=f"tournament_stub:code:{region}:{tournamentCode}",
+        cache_key=key_for("tournament_stub:code", region, tournamentCode),
         resource_name="Tournament stub code details",
         fetch_fn=lambda: riot_client.get(
             f"/lol/tournament-stub/v5/codes/{tournamentCode}", region, False
@@ -341,7 +342,7 @@ async def get_lobby_events(
         >>> curl "http://127.0.0.1:8080/lol/tournament-stub/v5/lobby-events/by-code/{tournamentCode}?region=euw1"
     """
     return await fetch_with_cache(
-        cache_key=f"tournament_stub:lobby_events:{region}:{tournamentCode}",
+        cache_key=key_for("tournament_stub:lobby_events", region, tournamentCode),
         resource_name="Tournament stub lobby events",
         fetch_fn=lambda: riot_client.get(
             f"/lol/tournament-stub/v5/lobby-events/by-code/{tournamentCode}", region, False
@@ -0,0 +1,245 @@
+"""Settings schema for the gateway.
+
+Defines the pydantic-settings model behind app.config. It is kept in its own
+module so that pydantic_settings is only imported when settings are first
+used; import the instance through app.config instead of instantiating this
+class directly.
+
+See Also:
+    app.config: get_settings() and the global `settings` instance
+"""
+
+from typing import Annotated, Any, cast
+
+import orjson
+from pydantic import field_validator, model_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    """
+    Application settings loaded from environment variables.
+
+    This class defines all the configuration parameters for the application.
+    It uses Pydantic's BaseSettings to automatically load settings from
+    environment variables and a .env file.
+
+    Attributes:
+        riot_api_key (str): The API key for accessing the Riot Games API.
+        riot_api_keys (tuple[str, ...]): API keys for rotation (comma-separated in the environment).
+        riot_default_region (str): The default region to use for API requests.
+        riot_request_timeout (int): The timeout for HTTP requests to the Riot API.
+        upstream_http2 (bool): Negotiate HTTP/2 with the Riot API, Data Dragon and Community Dragon.
+        riot_rate_limit_per_second (int): The number of requests per second allowed by the rate limiter.
+        riot_rate_limit_per_2min (int): The number of requests per 2 minutes allowed by the rate limiter.
+        enabled_providers (frozenset[str]): Set of enabled API providers.
+        data_dragon_version (str): Data Dragon game version or "latest".
+        data_dragon_locale (str): Data Dragon language locale.
+        community_dragon_version (str): Community Dragon data version or "latest".
+        riot_max_concurrent_requests (int): Maximum concurrent upstream fetches per region from fetch_with_cache.
+        redis_host (str): The hostname of the Redis server.
+        redis_port (int): The port of the Redis server.
+        redis_db (int): The Redis database to use.
+        redis_password (str): The password for the Redis server.
+        redis_max_connections (int): Maximum connections in the shared Redis connection pool.
+        redis_pool_timeout (float): Seconds to wait for a free pool connection before failing the Redis call.
+        match_tracking_backend (str): Match tracking storage, "set" (exact) or "bloom" (RedisBloom).
+        match_tracking_local_mirror (bool): Keep an in-memory, pub/sub-synced copy of the processed sets in each worker (off by default; memory grows with the number of tracked matches).
+        match_tracking_bloom_capacity (int): Expected processed matches per region for the Bloom filter.
+        match_tracking_bloom_error_rate (float): False positive rate of the Bloom filter.
+        cache_ttl_account (int): The cache TTL for account data.
+        cache_ttl_account_shard (int): The cache TTL for active shard data.
+        cache_ttl_summoner (int): The cache TTL for summoner data.
+        cache_ttl_match (int): The cache TTL for match data.
+        cache_ttl_timeline (int): The cache TTL for match timeline data.
+        cache_ttl_league (int): The cache TTL for league data.
+        cache_ttl_mastery (int): The cache TTL for champion mastery data.
+        cache_ttl_challenges_config (int): The cache TTL for challenges config data.
+        cache_ttl_challenges_leaderboard (int): The cache TTL for challenges leaderboard data.
+        cache_ttl_challenges_percentiles (int): The cache TTL for challenges percentiles data.
+        cache_ttl_challenges_player (int): The cache TTL for player challenges data.
+        cache_ttl_clash_player (int): The cache TTL for Clash player data.
+        cache_ttl_clash_team (int): The cache TTL for Clash team data.
+        cache_ttl_clash_tournament (int): The cache TTL for Clash tournament data.
+        cache_ttl_champion_rotation (int): The cache TTL for champion rotation data.
+        cache_ttl_platform_status (int): The cache TTL for platform status data.
+        cache_ttl_spectator_active (int): The cache TTL for active spectator data.
+        cache_ttl_spectator_featured (int): The cache TTL for featured spectator data.
+        cache_ttl_ddragon (int): The cache TTL for Data Dragon data.
+        cache_ttl_tournament_code (int): The cache TTL for tournament code details.
+        cache_ttl_tournament_lobby_events (int): The cache TTL for tournament lobby events.
+        cache_ttl_default (int): The default cache TTL.
+        cache_ttl_negative (int): The cache TTL for "known missing" markers (upstream 404 / Data Dragon 403) on endpoints that opt in, capped at the endpoint's TTL.
+        cache_l1_ttl (int): Maximum lifetime of entries in the in-process L1 cache.
+        cache_l1_maxsize (int): Maximum number of entries held in the in-process L1 cache.
+        cache_op_timeout (float): Timeout in seconds for the Redis MGET of a cache read (decoding is not counted) before falling back to the API.
+        cache_breaker_threshold (int): Redis failures within the window that open the circuit breaker.
+        cache_breaker_window (int): Window in seconds over which Redis failures are counted.
+        cache_breaker_cooldown (int): Seconds the circuit breaker stays open before probing Redis again.
+        host (str): The host to bind the server to.
+        port (int): The port to bind the server to.
+        log_level (str): The logging level for the application.
+    """
+
+    # Riot API Configuration
+    riot_api_key: str | None = None  # Backward compatible - single key
+    # New - comma-separated keys for rotation, split into a tuple on load
+    riot_api_keys: Annotated[tuple[str, ...], NoDecode] = ()
+    riot_default_region: str = "euw1"
+    riot_request_timeout: int = 10
+    upstream_http2: bool = True  # Falls back to HTTP/1.1 when the server does not offer h2
+
+    # Provider Configuration
+    # Comma-separated in the environment (ENABLED_PROVIDERS="riot_api,data_dragon")
+    enabled_providers: Annotated[frozenset[str], NoDecode] = frozenset(
+        {"riot_api", "data_dragon", "community_dragon"}
+    )
+
+    @field_validator("riot_api_keys", mode="before")
+    @classmethod
+    def _split_api_keys(cls, value: Any) -> Any:
+        """Split comma-separated RIOT_API_KEYS, treating None and blanks as no keys."""
+        if value is None:
+            return ()
+        if isinstance(value, str):
+            return tuple(key.strip() for key in value.split(",") if key.strip())
+        return value
+
+    @field_validator("enabled_providers", mode="before")
+    @classmethod
+    def _parse_enabled_providers(cls, value: Any) -> Any:
+        """Accept comma-separated strings as well as JSON lists for enabled_providers."""
+        if isinstance(value, str):
+            value = value.strip()
+            if value.startswith("["):
+                return orjson.loads(value)
+            return [name.strip() for name in value.split(",") if name.strip()]
+        return value
+
+    # Data Dragon Configuration
+    data_dragon_version: str = "latest"  # Game version or "latest"
+    data_dragon_locale: str = "en_US"  # Language locale
+
+    # Community Dragon Configuration
+    community_dragon_version: str = "latest"  # Data version or specific patch
+
+    @field_validator("riot_api_key", mode="before")
+    @classmethod
+    def _strip_api_key(cls, value: Any) -> Any:
+        """Strip RIOT_API_KEY, treating empty or blank values as not configured."""
+        if isinstance(value, str):
+            return value.strip() or None
+        return value
+
+    @model_validator(mode="after")
+    def _require_api_key(self) -> "Settings":
+        """Fail at startup, not at the first request, when no API key is configured."""
+        if not (self.riot_api_keys or self.riot_api_key):
+            raise ValueError("No Riot API keys configured. Set RIOT_API_KEY or RIOT_API_KEYS")
+        return self
+
+    def get_api_keys(self) -> tuple[str, ...]:
+        """
+        Get the API keys with priority: RIOT_API_KEYS > RIOT_API_KEY.
+
+        Keys are split and validated when the settings are loaded (a missing
+        key fails Settings() itself), so this only picks the stored tuple.
+
+        Returns:
+            tuple[str, ...]: API keys for rotation
+        """
+        # _require_api_key guarantees RIOT_API_KEY is set when RIOT_API_KEYS is empty
+        return self.riot_api_keys or (cast(str, self.riot_api_key),)
+
+    # Rate Limits (Riot API compliance)
+    riot_rate_limit_per_second: int = 20
+    riot_rate_limit_per_2min: int = 100
+    riot_max_concurrent_requests: int = 20  # In-flight upstream fetches per region
+
+    # Redis Configuration
+    redis_host: str = "redis"
+    redis_port: int = 6379
+    redis_db: int = 0
+    redis_password: str = ""
+    redis_max_connections: int = 100  # Shared by the cache and match tracker
+    redis_pool_timeout: float = 2.0  # Wait for a free connection before failing
+
+    # Match tracking: "set" (exact) or "bloom" (RedisBloom filter + HyperLogLog count)
+    match_tracking_backend: str = "set"
+    match_tracking_local_mirror: bool = False  # In-memory copy of processed sets (set backend)
+    match_tracking_bloom_capacity: int = 10_000_000  # Expected matches per region
+    match_tracking_bloom_error_rate: float = 0.001  # False positive rate
+
+    # Cache TTL (seconds) - Organized by API service
+
+    # ACCOUNT-V1: Account and active shard endpoints
+    cache_ttl_account: int = 3600  # 1 hour - Account data (by puuid/riotId)
+    cache_ttl_account_shard: int = 600  # 10 minutes - Active shard (can change)
+
+    # SUMMONER-V4: Summoner profile data
+    cache_ttl_summoner: int = 3600  # 1 hour
+
+    # MATCH-V5: Match history and details
+    cache_ttl_match: int = 86400  # 24 hours - Match data (immutable)
+    cache_ttl_timeline: int = 86400  # 24 hours - Match timeline (immutable)
+
+    # LEAGUE-V4: Ranked league data
+    cache_ttl_league: int = 3600  # 1 hour
+
+    # CHAMPION-MASTERY-V4: Champion mastery points
+    cache_ttl_mastery: int = 3600  # 1 hour
+
+    # CHALLENGES-V1: Player challenges and leaderboards
+    cache_ttl_challenges_config: int = 86400  # 24 hours - Challenge configs (static)
+    cache_ttl_challenges_leaderboard: int = 600  # 10 minutes - Leaderboards (dynamic)
+    cache_ttl_challenges_percentiles: int = 3600  # 1 hour - Percentile data
+    cache_ttl_challenges_player: int = 3600  # 1 hour - Player challenges
+
+    # CLASH-V1: Clash tournament data
+    cache_ttl_clash_player: int = 300  # 5 minutes - Player info (changes during tournaments)
+    cache_ttl_clash_team: int = 300  # 5 minutes - Team info (changes during tournaments)
+    cache_ttl_clash_tournament: int = 600  # 10 minutes - Tournament schedule
+
+    # CHAMPION-V3: Champion rotation
+    cache_ttl_champion_rotation: int = 86400  # 24 hours - Rotation changes weekly
+
+    # LOL-STATUS-V4: Platform status
+    cache_ttl_platform_status: int = 300  # 5 minutes - Status can change frequently
+
+    # SPECTATOR-V5: Live game data
+    cache_ttl_spectator_active: int = 30  # 30 seconds - Active game (very dynamic)
+    cache_ttl_spectator_featured: int = 120  # 2 minutes - Featured games
+
+    # Data Dragon: Static game data (champions, items, etc.)
+    cache_ttl_ddragon: int = 604800  # 7 days - Static data updated per patch
+
+    # TOURNAMENT-V5: Tournament management
+    cache_ttl_tournament_code: int = 300  # 5 minutes - Tournament code details
+    cache_ttl_tournament_lobby_events: int = 30  # 30 seconds - Lobby events (very dynamic)
+
+    # Default TTL for any uncategorized cache
+    cache_ttl_default: int = 3600  # 1 hour
+
+    # Negative caching: upstream 404 / Data Dragon 403 responses
+    cache_ttl_negative: int = 60  # 1 minute - Repeated misses skip the upstream call
+
+    # In-process L1 cache (per worker, in front of Redis)
+    cache_l1_ttl: int = 60  # 1 minute - Upper bound, also capped by the endpoint TTL
+    cache_l1_maxsize: int = 4096  # Entries per worker (LRU eviction); 0 disables L1
+
+    # Redis circuit breaker (bypass the cache while Redis is failing or slow)
+    cache_op_timeout: float = 0.25  # 250 ms - Slower Redis replies count as failures
+    cache_breaker_threshold: int = 5  # Failures within the window that open the breaker
+    cache_breaker_window: int = 10  # 10 seconds
+    cache_breaker_cooldown: int = 30  # 30 seconds - Open time before probing Redis again
+
+    # Server Configuration
+    host: str = "127.0.0.1"
+    port: int = 8080
+    log_level: str = "INFO"
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=False,
+        extra="ignore",
+    )
@@ -5,8 +5,11 @@ Provides functions to format error responses conforming to the OpenAPI
 error specification.
 """
 
+from functools import lru_cache
 from typing import Any, Sequence
 
+import orjson
+
 from app.models.errors import ErrorResponse, ErrorStatus
 
 
@@ -42,6 +45,55 @@ def format_error_response(status_code: int, message: str) -> dict[str, Any]:
     return error_response.model_dump()
 
 
+# Encoded ErrorResponse with the status code and the JSON-encoded message filled in
+_ERROR_BODY_TEMPLATE = b'{"status":{"status_code":%d,"message":%b}}'
+
+
+@lru_cache(maxsize=256)
+def format_error_body(status_code: int, message: str) -> bytes:
+    """
+    Format an error response and encode it to JSON bytes.
+
+    The body is filled into a byte template matching the ErrorResponse
+    schema, so only the message goes through orjson and no model is built.
+    Error responses repeat the same few (status code, message) pairs, e.g.
+    default exception messages or Riot's "Data not found" texts, so encoded
+    bodies are also cached.
+
+    Args:
+        status_code: HTTP status code (400-599)
+        message: Human-readable error message
+
+    Returns:
+        JSON-encoded error response in OpenAPI Error schema format
+
+    Example:
+        >>> format_error_body(404, "Resource not found: summoner")
+        b'{"status":{"status_code":404,"message":"Resource not found: summoner"}}'
+    """
+    return _ERROR_BODY_TEMPLATE % (status_code, orjson.dumps(message))
+
+
+def format_internal_error_body(exc_type: type[BaseException]) -> bytes:
+    """
+    Encode the 500 error response for an unhandled exception class.
+
+    The message only depends on the class name, so the body comes from
+    format_error_body's cache when the same error repeats on every request.
+
+    Args:
+        exc_type: Class of the unhandled exception
+
+    Returns:
+        JSON-encoded 500 error response naming the exception class
+
+    Example:
+        >>> format_internal_error_body(KeyError)
+        b'{"status":{"status_code":500,"message":"Internal server error: KeyError"}}'
+    """
+    return format_error_body(500, f"Internal server error: {exc_type.__name__}")
+
+
 def format_validation_error(
     validation_errors: Sequence[dict[str, Any]] | list[dict[str, Any]],
 ) -> dict[str, Any]:
@@ -66,16 +118,38 @@ def format_validation_error(
             }
         }
     """
+    return format_error_response(400, _validation_message(validation_errors))
+
+
+def format_validation_body(
+    validation_errors: Sequence[dict[str, Any]] | list[dict[str, Any]],
+) -> bytes:
+    """
+    Format validation errors and encode them to JSON bytes.
+
+    Goes through format_error_body, so a validation failure that repeats
+    (same message and location) is served from the encoded-body cache.
+
+    Args:
+        validation_errors: List of validation error dictionaries from FastAPI
+
+    Returns:
+        JSON-encoded error response with 400 status code
+    """
+    return format_error_body(400, _validation_message(validation_errors))
+
+
+def _validation_message(
+    validation_errors: Sequence[dict[str, Any]] | list[dict[str, Any]],
+) -> str:
+    """Build the error message for a list of validation errors."""
     # Extract first error for simple message (could be enhanced to include all errors)
     if validation_errors:
         first_error = validation_errors[0]
         location = ".".join(str(loc) for loc in first_error.get("loc", []))
         msg = first_error.get("msg", "Validation error")
-        message = f"Invalid request parameters: {msg} at {location}"
-    else:
-        message = "Invalid request parameters: Validation failed"
-
-    return format_error_response(400, message)
+        return f"Invalid request parameters: {msg} at {location}"
+    return "Invalid request parameters: Validation failed"
 
 
 def get_standard_error_message(status_code: int, default_message: str | None = None) -> str:
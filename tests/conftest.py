@@ -16,7 +16,8 @@ async testing issues like event loop closure errors.
 import asyncio
 import os
 import sys
-from typing import AsyncGenerator, Generator
+from typing import Any, AsyncGenerator, Callable, Generator
+from unittest.mock import AsyncMock, MagicMock
 
 # Fix for Windows event loop cleanup issue
 if sys.platform == "win32":
@@ -210,6 +211,37 @@ def mock_riot_response():
     }
 
 
+@pytest.fixture
+def async_pipeline() -> Callable[..., MagicMock]:
+    """Provide a factory for mocked redis.asyncio pipelines.
+
+    The returned mock supports ``async with client.pipeline() as pipe`` and
+    records queued commands as plain MagicMock calls; only ``execute`` is
+    awaited.
+
+    Returns:
+        Callable: ``make(return_value=None, side_effect=None)`` building a
+        pipeline whose ``execute`` resolves to ``return_value`` or follows
+        ``side_effect``.
+
+    Example:
+        ```python
+        def test_batch(async_pipeline):
+            pipe = async_pipeline([True, True])
+            client.pipeline = MagicMock(return_value=pipe)
+        ```
+    """
+
+    def make(return_value: Any = None, side_effect: Any = None) -> MagicMock:
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=return_value, side_effect=side_effect)
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=None)
+        return pipe
+
+    return make
+
+
 @pytest.fixture(autouse=True)
 def reset_riot_client():
     """Reset Riot API client lifecycle for each test.
@@ -317,8 +349,8 @@ async def reset_cache():
     """Reset cache state between tests.
 
     This fixture provides automatic cache cleanup between tests to prevent
-    cache leakage. It flushes the Redis database before and after each test
-    if Redis is available, and gracefully handles Redis unavailability for
+    cache leakage. It clears the in-process L1 cache and flushes the Redis
+    database before and after each test if Redis is available, and gracefully handles Redis unavailability for
     unit tests that don't require cache integration.
 
     Autouse:
@@ -346,7 +378,12 @@ async def reset_cache():
         not other databases in the same Redis instance. Unit tests that don't
         require Redis will skip cache cleanup without errors.
     """
-    # Setup: Clear Redis cache if available
+    from app.cache.memory import local_cache
+    from app.cache.redis_cache import redis_breaker
+
+    # Setup: Clear in-process L1 and Redis cache if available
+    local_cache.clear()
+    redis_breaker.reset()
     try:
         from app.cache.redis_cache import cache
 
@@ -358,6 +395,7 @@ async def reset_cache():
     yield
 
     # Cleanup: Clear cache again after test
+    local_cache.clear()
     try:
         from app.cache.redis_cache import cache
 
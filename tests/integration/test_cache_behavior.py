@@ -22,18 +22,33 @@ Coverage Targets:
 """
 
 from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
 import uuid
 
+import httpx
 import pytest
+from loguru import logger
 
 from app.exceptions import (
+    ForbiddenException,
     NotFoundException,
     RateLimitException,
     InternalServerException,
+    UnauthorizedException,
 )
 
 # Import cache helpers after setting up test environment
 from app.cache import helpers as cache_helpers
+from app.cache.memory import MemoryCache, local_cache
+from app.cache.redis_cache import (
+    KeyTrie,
+    NamespacedCache,
+    RedisBreaker,
+    RedisCache,
+    key_for,
+    redis_breaker,
+)
+from app.models.common import PlatformRegion
 
 
 # Helper function to generate unique cache keys
@@ -61,7 +76,7 @@ def mock_cache():
     - Can be used with patch.object to replace the real cache
 
     Yields:
-        MagicMock: A mock cache object with get, set, and delete methods.
+        MagicMock: A mock cache object with get, set, delete, multi_get and multi_set methods.
     """
     cache_store = {}
 
@@ -77,14 +92,34 @@ def mock_cache():
     async def mock_delete(key: str):
         cache_store.pop(key, None)
 
+    async def mock_multi_set(pairs, ttl: int = None):
+        for key, value in pairs:
+            cache_store[key] = value
+
+    # MGET delegates to the get mock so tests can override get's behaviour
+    async def mock_multi_get(keys, timeout: float = None):
+        async def read():
+            return [await mock_cache_obj.get(key) for key in keys]
+
+        return await asyncio.wait_for(read(), timeout)
+
     # Create the mock cache object
     mock_cache_obj = MagicMock()
     mock_cache_obj.get = AsyncMock(side_effect=mock_get)
     mock_cache_obj.set = AsyncMock(side_effect=mock_set)
     mock_cache_obj.delete = AsyncMock(side_effect=mock_delete)
+    mock_cache_obj.multi_set = AsyncMock(side_effect=mock_multi_set)
+    mock_cache_obj.multi_get = AsyncMock(side_effect=mock_multi_get)
+
+    # Start from an empty in-process L1 and a closed breaker
+    local_cache.clear()
+    redis_breaker.reset()
 
     yield mock_cache_obj
 
+    local_cache.clear()
+    redis_breaker.reset()
+
 
 # ============================================================================
 # CACHE HIT / MISS TESTS
@@ -313,8 +348,9 @@ class TestCacheTTL:
             assert result2 == expected_data
             assert call_count == 1  # No new API call
 
-        # Clear the mock cache store to simulate TTL expiration
+        # Clear the mock cache store (and the L1 copy) to simulate TTL expiration
         mock_cache.get.side_effect = lambda k: None
+        local_cache.pop(cache_key)
 
         with patch.object(cache_helpers, "cache", mock_cache):
             # Third request - cache expired, should call API again
@@ -380,12 +416,10 @@ class TestCacheFailures:
     """Test cache behavior on failures and edge cases."""
 
     async def test_cache_unavailable_falls_back_to_api(self, mock_cache):
-        """If cache.get raises exception, it propagates to caller.
+        """If cache.get raises exception, data is fetched from the API.
 
-        This test verifies that cache failures are not silently swallowed.
-        The actual behavior is that cache exceptions propagate (which is
-        the current implementation - cache failures are caught by the
-        global error handler, not by fetch_with_cache).
+        This test verifies that cache failures never fail the request:
+        a failed read is treated as a miss and counted by the breaker.
         """
 
         call_count = 0
@@ -403,17 +437,61 @@ class TestCacheFailures:
         mock_cache.get.side_effect = mock_cache_raises
 
         with patch.object(cache_helpers, "cache", mock_cache):
-            # Request should raise the cache exception
-            with pytest.raises(Exception, match="Redis connection failed"):
+            result = await cache_helpers.fetch_with_cache(
+                cache_key=_unique_key("test:cache:down"),
+                resource_name="Test Resource",
+                fetch_fn=mock_fetch_fn,
+                ttl=60,
+            )
+
+        assert result == expected_data
+        assert call_count == 1
+
+    async def test_slow_cache_read_falls_back_to_api(self, mock_cache, monkeypatch):
+        """Reads slower than cache_op_timeout are treated as misses."""
+        monkeypatch.setattr(cache_helpers.settings, "cache_op_timeout", 0.01)
+
+        async def mock_cache_slow(*args, **kwargs):
+            await asyncio.sleep(1)
+
+        async def mock_fetch_fn():
+            return {"name": "TestSummoner"}
+
+        mock_cache.get.side_effect = mock_cache_slow
+
+        with patch.object(cache_helpers, "cache", mock_cache):
+            result = await cache_helpers.fetch_with_cache(
+                cache_key=_unique_key("test:cache:slow"),
+                resource_name="Test Resource",
+                fetch_fn=mock_fetch_fn,
+                ttl=60,
+            )
+
+        assert result == {"name": "TestSummoner"}
+
+    async def test_open_breaker_skips_redis(self, mock_cache):
+        """After repeated failures the breaker opens and Redis is bypassed."""
+
+        async def mock_cache_raises(*args, **kwargs):
+            raise Exception("Redis connection failed")
+
+        async def mock_fetch_fn():
+            return {"name": "TestSummoner"}
+
+        mock_cache.get.side_effect = mock_cache_raises
+        threshold = redis_breaker.threshold
+
+        with patch.object(cache_helpers, "cache", mock_cache):
+            for _ in range(threshold + 3):
                 await cache_helpers.fetch_with_cache(
-                    cache_key=_unique_key("test:cache:down"),
+                    cache_key=_unique_key("test:breaker"),
                     resource_name="Test Resource",
                     fetch_fn=mock_fetch_fn,
                     ttl=60,
                 )
 
-            # API should NOT have been called since cache.get failed first
-            assert call_count == 0
+        assert redis_breaker.state == RedisBreaker.OPEN
+        assert mock_cache.get.call_count == threshold
 
     async def test_api_404_does_not_cache(self, mock_cache):
         """API 404 errors should not be cached.
@@ -536,11 +614,11 @@ class TestCacheFailures:
             assert result["name"] == "TestSummoner"
             assert call_count == 2
 
-    async def test_cache_set_failure_propagates(self, mock_cache):
-        """If cache.set fails after successful fetch, exception propagates.
+    async def test_cache_set_failure_does_not_fail_request(self, mock_cache):
+        """If cache.set fails after successful fetch, the data is still returned.
 
-        This test verifies that if we successfully fetch from source but fail
-        to store in cache, the exception is raised (current implementation).
+        Cache writes are fire-and-forget: a failed write is logged and the
+        response is served from the successful fetch.
         """
 
         call_count = 0
@@ -555,25 +633,25 @@ class TestCacheFailures:
         async def mock_cache_get_none(*args, **kwargs):
             return None
 
-        # Mock cache.set to fail
+        # Mock the batched cache write to fail
         async def mock_cache_set_fail(*args, **kwargs):
             raise Exception("Redis write failed")
 
         mock_cache.get.side_effect = mock_cache_get_none
-        mock_cache.set.side_effect = mock_cache_set_fail
+        mock_cache.multi_set.side_effect = mock_cache_set_fail
 
         with patch.object(cache_helpers, "cache", mock_cache):
-            # Request should raise the cache set exception
-            with pytest.raises(Exception, match="Redis write failed"):
-                await cache_helpers.fetch_with_cache(
-                    cache_key=_unique_key("test:set:fail"),
-                    resource_name="Test Resource",
-                    fetch_fn=mock_fetch_fn,
-                    ttl=60,
-                )
+            result = await cache_helpers.fetch_with_cache(
+                cache_key=_unique_key("test:set:fail"),
+                resource_name="Test Resource",
+                fetch_fn=mock_fetch_fn,
+                ttl=60,
+            )
+            await cache_helpers.drain_cache_writes()
 
-            # API was called before cache.set failed
-            assert call_count == 1
+        assert result == expected_data
+        assert call_count == 1
+        mock_cache.multi_set.assert_awaited_once()
 
     async def test_multiple_cache_hits_same_key(self, mock_cache):
         """Multiple cache hits for the same key should all succeed.
@@ -615,6 +693,821 @@ class TestCacheFailures:
             # API should still only have been called once
             assert call_count == 1
 
+    async def test_l1_hit_skips_redis(self, mock_cache):
+        """Hot keys should be served from the in-process L1 cache.
+
+        This test verifies that once a key has been fetched, repeated reads
+        are answered from process memory without a Redis round trip.
+        """
+
+        async def mock_fetch_fn():
+            return {"name": "TestSummoner", "level": 100}
+
+        cache_key = _unique_key("test:l1:hit")
+
+        with patch.object(cache_helpers, "cache", mock_cache):
+            await cache_helpers.fetch_with_cache(
+                cache_key=cache_key,
+                resource_name="Test Resource",
+                fetch_fn=mock_fetch_fn,
+                ttl=60,
+            )
+            redis_reads = mock_cache.get.call_count
+
+            for _ in range(3):
+                await cache_helpers.fetch_with_cache(
+                    cache_key=cache_key,
+                    resource_name="Test Resource",
+                    fetch_fn=mock_fetch_fn,
+                    ttl=60,
+                )
+
+            # Only the initial miss went to Redis
+            assert mock_cache.get.call_count == redis_reads
+
+    async def test_redis_hit_populates_l1(self, mock_cache):
+        """A Redis hit should be copied into the L1 cache."""
+        cache_key = _unique_key("test:l1:populate")
+        await mock_cache.set(cache_key, {"cached": True}, ttl=60)
+
+        async def mock_fetch_fn():
+            raise AssertionError("API should not be called")
+
+        with patch.object(cache_helpers, "cache", mock_cache):
+            result = await cache_helpers.fetch_with_cache(
+                cache_key=cache_key,
+                resource_name="Test Resource",
+                fetch_fn=mock_fetch_fn,
+                ttl=60,
+            )
+
+        assert result == {"cached": True}
+        assert local_cache.get(cache_key) == {"cached": True}
+
+    @pytest.mark.parametrize("l1_ttl, ttl, lifetime", [(5, 3600, 5), (60, 10, 10)])
+    async def test_redis_hit_l1_lifetime_capped(
+        self, mock_cache, monkeypatch, l1_ttl, ttl, lifetime
+    ):
+        """A Redis hit is kept in L1 for min(cache_l1_ttl, ttl) seconds."""
+        monkeypatch.setattr(cache_helpers.settings, "cache_l1_ttl", l1_ttl)
+        now = 1000.0
+        monkeypatch.setattr("app.cache.memory.time.monotonic", lambda: now)
+        cache_key = _unique_key("test:l1:lifetime")
+        await mock_cache.set(cache_key, {"cached": True}, ttl=ttl)
+
+        async def mock_fetch_fn():
+            raise AssertionError("API should not be called")
+
+        with patch.object(cache_helpers, "cache", mock_cache):
+            await cache_helpers.fetch_with_cache(
+                cache_key=cache_key,
+                resource_name="Test Resource",
+                fetch_fn=mock_fetch_fn,
+                ttl=ttl,
+            )
+
+        now += lifetime - 1
+        assert local_cache.get(cache_key) == {"cached": True}
+        now += 1
+        assert local_cache.get(cache_key) is None
+
+    async def test_concurrent_misses_fetch_once(self, mock_cache):
+        """Concurrent misses for the same key should share one API call.
+
+        This test verifies request coalescing: while a fetch is in flight,
+        other callers await its result instead of calling the API again.
+        """
+        call_count = 0
+        release = asyncio.Event()
+
+        async def mock_fetch_fn():
+            nonlocal call_count
+            call_count += 1
+            await release.wait()
+            return {"name": "TestSummoner"}
+
+        cache_key = _unique_key("test:coalesce")
+
+        with patch.object(cache_helpers, "cache", mock_cache):
+            tasks = [
+                asyncio.create_task(
+                    cache_helpers.fetch_with_cache(
+                        cache_key=cache_key,
+                        resource_name="Test Resource",
+                        fetch_fn=mock_fetch_fn,
+                        ttl=60,
+                    )
+                )
+                for _ in range(10)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*tasks)
+
+        assert call_count == 1
+        assert all(result == {"name": "TestSummoner"} for result in results)
+        assert cache_key not in cache_helpers._inflight
+
+    async def test_cancelled_first_caller_does_not_fail_others(self, mock_cache):
+        """Cancelling the caller that started the fetch leaves it running for the rest."""
+        call_count = 0
+        release = asyncio.Event()
+
+        async def mock_fetch_fn():
+            nonlocal call_count
+            call_count += 1
+            await release.wait()
+            return {"name": "TestSummoner"}
+
+        cache_key = _unique_key("test:coalesce:cancel")
+
+        with patch.object(cache_helpers, "cache", mock_cache):
+            tasks = [
+                asyncio.create_task(
+                    cache_helpers.fetch_with_cache(
+                        cache_key=cache_key,
+                        resource_name="Test Resource",
+                        fetch_fn=mock_fetch_fn,
+                        ttl=60,
+                    )
+                )
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0)
+            tasks[0].cancel()
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert isinstance(results[0], asyncio.CancelledError)
+        assert results[1:] == [{"name": "TestSummoner"}] * 2
+        assert call_count == 1
+
+    async def test_fetch_cancelled_when_every_caller_is_cancelled(self, mock_cache):
+        """The shared fetch is cancelled once no caller is waiting for it."""
+        started = asyncio.Event()
+        fetch_cancelled = False
+
+        async def mock_fetch_fn():
+            nonlocal fetch_cancelled
+            started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                fetch_cancelled = True
+                raise
+
+        cache_key = _unique_key("test:coalesce:abandon")
+
+        with patch.object(cache_helpers, "cache", mock_cache):
+            tasks = [
+                asyncio.create_task(
+                    cache_helpers.fetch_with_cache(
+                        cache_key=cache_key,
+                        resource_name="Test Resource",
+                        fetch_fn=mock_fetch_fn,
+                        ttl=60,
+                    )
+                )
+                for _ in range(2)
+            ]
+            await started.wait()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await asyncio.sleep(0)
+
+        assert fetch_cancelled
+        assert cache_key not in cache_helpers._inflight
+
+    async def test_concurrent_misses_share_errors(self, mock_cache):
+        """Waiting callers should receive the error raised by the in-flight fetch."""
+        call_count = 0
+        release = asyncio.Event()
+
+        async def mock_fetch_fn():
+            nonlocal call_count
+            call_count += 1
+            await release.wait()
+            raise NotFoundException(resource_type="Summoner")
+
+        cache_key = _unique_key("test:coalesce:error")
+
+        with patch.object(cache_helpers, "cache", mock_cache):
+            tasks = [
+                asyncio.create_task(
+                    cache_helpers.fetch_with_cache(
+                        cache_key=cache_key,
+                        resource_name="Test Resource",
+                        fetch_fn=mock_fetch_fn,
+                        ttl=60,
+                    )
+                )
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert call_count == 1
+        assert all(isinstance(result, NotFoundException) for result in results)
+        mock_cache.multi_set.assert_not_called()
+
+    async def test_concurrent_writes_are_batched(self, mock_cache):
+        """Writes from concurrent misses should be flushed together.
+
+        This test verifies that distinct misses completing together are stored
+        with one pipelined write per TTL instead of one SET each.
+        """
+
+        async def mock_fetch_fn():
+            return {"name": "TestSummoner"}
+
+        keys = [_unique_key("test:batch") for _ in range(5)]
+
+        with patch.object(cache_helpers, "cache", mock_cache):
+            await asyncio.gather(
+                *(
+                    cache_helpers.fetch_with_cache(
+                        cache_key=key,
+                        resource_name="Test Resource",
+                        fetch_fn=mock_fetch_fn,
+                        ttl=60,
+                    )
+                    for key in keys
+                )
+            )
+            await cache_helpers.drain_cache_writes()
+
+        mock_cache.multi_set.assert_awaited_once()
+        pairs = mock_cache.multi_set.await_args.args[0]
+        assert sorted(key for key, _ in pairs) == sorted(keys)
+        mock_cache.set.assert_not_called()
+
+    async def test_access_logs_are_buffered_and_summarized(self, mock_cache):
+        """Hits and misses are logged off the request path and summarized."""
+        cache_helpers.flush_cache_logs()  # Discard records from earlier tests
+        messages = []
+        sink_id = logger.add(lambda m: messages.append(m.record["message"]), level="DEBUG")
+
+        async def mock_fetch_fn():
+            return {"name": "TestSummoner"}
+
+        cache_key = _unique_key("test:logs")
+        try:
+            with patch.object(cache_helpers, "cache", mock_cache):
+                for _ in range(3):
+                    await cache_helpers.fetch_with_cache(
+                        cache_key=cache_key,
+                        resource_name="Log Resource",
+                        fetch_fn=mock_fetch_fn,
+                        ttl=60,
+                    )
+                # Nothing has been formatted on the request path yet
+                assert not any("Log Resource" in m for m in messages)
+
+                cache_helpers.flush_cache_logs()
+        finally:
+            logger.remove(sink_id)
+
+        assert "Log Resource retrieved from riot_api" in messages
+        assert messages.count("Log Resource retrieved from cache") == 2
+        assert "Cache activity: 2 hit(s), 1 miss(es)" in messages
+
+    async def test_access_log_context_may_contain_source(self, mock_cache):
+        """A caller-provided "source" in context does not break log replay."""
+        cache_helpers.flush_cache_logs()  # Discard records from earlier tests
+        records = []
+        sink_id = logger.add(lambda m: records.append(m.record), level="DEBUG")
+
+        async def mock_fetch_fn():
+            return {"name": "TestSummoner"}
+
+        try:
+            with patch.object(cache_helpers, "cache", mock_cache):
+                await cache_helpers.fetch_with_cache(
+                    cache_key=_unique_key("test:logs:source"),
+                    resource_name="Log Resource",
+                    fetch_fn=mock_fetch_fn,
+                    ttl=60,
+                    context={"source": "community_dragon", "region": "euw1"},
+                )
+
+            cache_helpers.flush_cache_logs()
+        finally:
+            logger.remove(sink_id)
+
+        replayed = [r for r in records if r["message"] == "Log Resource retrieved from riot_api"]
+        assert len(replayed) == 1
+        # The cache source takes precedence; the rest of the context is kept
+        assert replayed[0]["extra"]["source"] == "riot_api"
+        assert replayed[0]["extra"]["region"] == "euw1"
+
+    @pytest.mark.parametrize(
+        "status_code,url,expected",
+        [
+            (403, "https://euw1.api.riotgames.com/x", ForbiddenException),
+            (403, "https://ddragon.leagueoflegends.com/x", ForbiddenException),
+            (404, "https://euw1.api.riotgames.com/x", NotFoundException),
+            (429, "https://euw1.api.riotgames.com/x", RateLimitException),
+            (503, "https://euw1.api.riotgames.com/x", InternalServerException),
+            (418, "https://euw1.api.riotgames.com/x", InternalServerException),
+        ],
+    )
+    async def test_http_status_errors_are_mapped(self, mock_cache, status_code, url, expected):
+        """Upstream HTTP errors are mapped to gateway exceptions by status code."""
+        request = httpx.Request("GET", url)
+        response = httpx.Response(status_code, request=request, headers={"Retry-After": "7"})
+
+        async def mock_fetch_fn():
+            raise httpx.HTTPStatusError("upstream error", request=request, response=response)
+
+        with patch.object(cache_helpers, "cache", mock_cache):
+            with pytest.raises(expected) as exc_info:
+                await cache_helpers.fetch_with_cache(
+                    cache_key=_unique_key("test:http:error"),
+                    resource_name="Test Resource",
+                    fetch_fn=mock_fetch_fn,
+                    ttl=60,
+                )
+
+        if status_code == 429:
+            assert exc_info.value.retry_after == 7
+        if "ddragon" in url:
+            assert "Data Dragon access forbidden" in exc_info.value.message
+
+    @pytest.mark.parametrize(
+        "message,expected",
+        [
+            ("API key is invalid or expired", UnauthorizedException),
+            ("API key doesn't have access to this endpoint", ForbiddenException),
+            ("Something else", InternalServerException),
+        ],
+    )
+    async def test_auth_errors_are_mapped(self, mock_cache, message, expected):
+        """Riot client authentication errors are mapped by message."""
+
+        async def mock_fetch_fn():
+            raise ValueError(message)
+
+        with patch.object(cache_helpers, "cache", mock_cache):
+            with pytest.raises(expected):
+                await cache_helpers.fetch_with_cache(
+                    cache_key=_unique_key("test:auth:error"),
+                    resource_name="Test Resource",
+                    fetch_fn=mock_fetch_fn,
+                    ttl=60,
+                )
+
+    async def test_upstream_404_is_negatively_cached(self, mock_cache):
+        """Repeated requests for a missing resource skip the upstream call."""
+        call_count = 0
+        request = httpx.Request("GET", "https://ddragon.leagueoflegends.com/x")
+        response = httpx.Response(404, request=request)
+
+        async def mock_fetch_fn():
+            nonlocal call_count
+            call_count += 1
+            raise httpx.HTTPStatusError("not found", request=request, response=response)
+
+        cache_key = _unique_key("test:negative")
+
+        with patch.object(cache_helpers, "cache", mock_cache):
+            for _ in range(3):
+                with pytest.raises(NotFoundException):
+                    await cache_helpers.fetch_with_cache(
+                        cache_key=cache_key,
+                        resource_name="Champion",
+                        fetch_fn=mock_fetch_fn,
+                        ttl=60,
+                        negative_cache=True,
+                    )
+            assert call_count == 1
+
+            # The marker is shared through Redis, not only the L1 cache
+            await cache_helpers.drain_cache_writes()
+            local_cache.clear()
+            with pytest.raises(NotFoundException):
+                await cache_helpers.fetch_with_cache(
+                    cache_key=cache_key,
+                    resource_name="Champion",
+                    fetch_fn=mock_fetch_fn,
+                    ttl=60,
+                    negative_cache=True,
+                )
+            assert call_count == 1
+
+            # force_refresh bypasses the negative marker
+            with pytest.raises(NotFoundException):
+                await cache_helpers.fetch_with_cache(
+                    cache_key=cache_key,
+                    resource_name="Champion",
+                    fetch_fn=mock_fetch_fn,
+                    ttl=60,
+                    force_refresh=True,
+                    negative_cache=True,
+                )
+            assert call_count == 2
+
+    async def test_upstream_404_not_negatively_cached_by_default(self, mock_cache):
+        """Without negative_cache, every request for a missing resource goes upstream."""
+        call_count = 0
+        request = httpx.Request("GET", "https://ddragon.leagueoflegends.com/x")
+        response = httpx.Response(404, request=request)
+
+        async def mock_fetch_fn():
+            nonlocal call_count
+            call_count += 1
+            raise httpx.HTTPStatusError("not found", request=request, response=response)
+
+        cache_key = _unique_key("test:negative:off")
+
+        with patch.object(cache_helpers, "cache", mock_cache):
+            for _ in range(2):
+                with pytest.raises(NotFoundException):
+                    await cache_helpers.fetch_with_cache(
+                        cache_key=cache_key,
+                        resource_name="Champion",
+                        fetch_fn=mock_fetch_fn,
+                        ttl=60,
+                    )
+            await cache_helpers.drain_cache_writes()
+
+        assert call_count == 2
+        assert await mock_cache.get(f"neg:{cache_key}") is None
+        # The negative key is not read either
+        assert mock_cache.multi_get.await_args.args[0] == [cache_key]
+
+    async def test_negative_ttl_capped_by_endpoint_ttl(self, mock_cache, monkeypatch):
+        """A missing marker never outlives the endpoint's own TTL."""
+        monkeypatch.setattr(cache_helpers.settings, "cache_ttl_negative", 60)
+        request = httpx.Request("GET", "https://ddragon.leagueoflegends.com/x")
+        response = httpx.Response(404, request=request)
+
+        async def mock_fetch_fn():
+            raise httpx.HTTPStatusError("not found", request=request, response=response)
+
+        cache_key = _unique_key("test:negative:cap")
+
+        with patch.object(cache_helpers, "cache", mock_cache):
+            with pytest.raises(NotFoundException):
+                await cache_helpers.fetch_with_cache(
+                    cache_key=cache_key,
+                    resource_name="Active game",
+                    fetch_fn=mock_fetch_fn,
+                    ttl=30,
+                    negative_cache=True,
+                )
+            await cache_helpers.drain_cache_writes()
+
+        mock_cache.multi_set.assert_awaited_once_with(
+            [(f"neg:{cache_key}", {"status": 404})], ttl=30
+        )
+
+    async def test_upstream_concurrency_is_bounded_per_region(self, mock_cache, monkeypatch):
+        """Concurrent misses never exceed the per-region upstream limit."""
+        monkeypatch.setattr(cache_helpers.settings, "riot_max_concurrent_requests", 2)
+        monkeypatch.setattr(cache_helpers, "_upstream_semaphores", {})
+        in_flight = 0
+        peak = 0
+
+        async def mock_fetch_fn():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"name": "TestSummoner"}
+
+        with patch.object(cache_helpers, "cache", mock_cache):
+            await asyncio.gather(
+                *(
+                    cache_helpers.fetch_with_cache(
+                        cache_key=_unique_key("test:semaphore"),
+                        resource_name="Test Resource",
+                        fetch_fn=mock_fetch_fn,
+                        ttl=60,
+                        context={"region": "euw1"},
+                    )
+                    for _ in range(6)
+                )
+            )
+
+        assert peak == 2
+        assert set(cache_helpers._upstream_semaphores) == {"euw1"}
+
+
+# ============================================================================
+# L1 MEMORY CACHE TESTS
+# ============================================================================
+
+
+class TestMemoryCache:
+    """Test the in-process L1 cache in isolation."""
+
+    def test_lifetime_capped_by_l1_ttl(self, monkeypatch):
+        """Entries never outlive the cache-wide TTL, even with a longer Redis TTL."""
+        now = 1000.0
+        monkeypatch.setattr("app.cache.memory.time.monotonic", lambda: now)
+
+        memory = MemoryCache(maxsize=10, ttl=5)
+        memory.set("key", "value", ttl=3600)
+        assert memory.get("key") == "value"
+
+        now += 6
+        assert memory.get("key") is None
+        assert len(memory) == 0
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted when full."""
+        memory = MemoryCache(maxsize=2, ttl=60)
+        memory.set("a", 1)
+        memory.set("b", 2)
+        memory.get("a")  # "b" is now least recently used
+        memory.set("c", 3)
+
+        assert memory.get("a") == 1
+        assert memory.get("b") is None
+        assert memory.get("c") == 3
+
+    def test_disabled_when_maxsize_zero(self):
+        """A maxsize of 0 disables the L1 cache."""
+        memory = MemoryCache(maxsize=0, ttl=60)
+        memory.set("key", "value")
+        assert memory.get("key") is None
+
+
+class TestRedisBreaker:
+    """Test the Redis circuit breaker state machine."""
+
+    def test_half_open_probe_closes_on_success(self, monkeypatch):
+        """After the cooldown one probe is allowed; success closes the breaker."""
+        now = 1000.0
+        monkeypatch.setattr("app.cache.redis_cache.time.monotonic", lambda: now)
+
+        breaker = RedisBreaker(threshold=2, window=10, cooldown=30)
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == RedisBreaker.OPEN
+        assert not breaker.allow()
+
+        now += 31
+        assert breaker.allow()  # probe
+        assert breaker.state == RedisBreaker.HALF_OPEN
+        assert not breaker.allow()  # only one probe per cooldown
+
+        breaker.record_success()
+        assert breaker.state == RedisBreaker.CLOSED
+        assert breaker.allow()
+
+    def test_half_open_probe_reopens_on_failure(self, monkeypatch):
+        """A failed probe opens the breaker for another cooldown."""
+        now = 1000.0
+        monkeypatch.setattr("app.cache.redis_cache.time.monotonic", lambda: now)
+
+        breaker = RedisBreaker(threshold=1, window=10, cooldown=30)
+        breaker.record_failure()
+        now += 31
+        assert breaker.allow()
+
+        breaker.record_failure()
+        assert breaker.state == RedisBreaker.OPEN
+        assert not breaker.allow()
+
+    def test_failures_outside_window_do_not_open(self, monkeypatch):
+        """Failures spread beyond the window keep the breaker closed."""
+        now = 1000.0
+        monkeypatch.setattr("app.cache.redis_cache.time.monotonic", lambda: now)
+
+        breaker = RedisBreaker(threshold=2, window=10, cooldown=30)
+        breaker.record_failure()
+        now += 11
+        breaker.record_failure()
+        assert breaker.state == RedisBreaker.CLOSED
+
+
+class TestNamespacedCache:
+    """Test the thin redis.asyncio cache wrapper."""
+
+    @pytest.fixture
+    def client(self, async_pipeline):
+        """Provide a mocked redis.asyncio client."""
+        client = MagicMock()
+        client.get = AsyncMock(return_value=b'{"id": 1}')
+        client.set = AsyncMock(return_value=True)
+        client.mget = AsyncMock(return_value=[b"[1, 2]", None])
+        client.pipeline.return_value = async_pipeline([True, True])
+        return client
+
+    async def test_get_and_set_use_namespaced_keys(self, client):
+        """Keys are prefixed with the namespace and values are JSON bytes."""
+        cache = NamespacedCache(client, namespace="lol")
+
+        assert await cache.get("summoner:euw1:a") == {"id": 1}
+        await cache.set("summoner:euw1:a", {1: "x"}, ttl=60)
+
+        client.get.assert_awaited_once_with("lol:summoner:euw1:a")
+        client.set.assert_awaited_once_with("lol:summoner:euw1:a", b'{"1":"x"}', ex=60)
+
+    async def test_delete_uses_unlink(self, client):
+        """Deletes are non-blocking UNLINKs of the namespaced key."""
+        client.unlink = AsyncMock(return_value=1)
+        cache = NamespacedCache(client, namespace="lol")
+
+        assert await cache.delete("summoner:euw1:a") == 1
+        client.unlink.assert_awaited_once_with("lol:summoner:euw1:a")
+        client.delete.assert_not_called()
+
+    async def test_multi_get_decodes_and_keeps_misses(self, client):
+        """MGET results are decoded in order with None for missing keys."""
+        cache = NamespacedCache(client, namespace="lol")
+
+        assert await cache.multi_get(["a", "b"]) == [[1, 2], None]
+        client.mget.assert_awaited_once_with(["lol:a", "lol:b"])
+
+    async def test_multi_get_timeout(self, client):
+        """An MGET slower than the timeout raises TimeoutError."""
+
+        async def slow_reply(keys):
+            await asyncio.sleep(1)
+
+        client.mget.side_effect = slow_reply
+        cache = NamespacedCache(client, namespace="lol")
+
+        with pytest.raises(TimeoutError):
+            await cache.multi_get(["a"], timeout=0.01)
+
+    async def test_multi_set_pipelines_set_with_expiry(self, client):
+        """Each pair is written with SET ... EX in a single pipeline."""
+        cache = NamespacedCache(client, namespace="lol")
+
+        await cache.multi_set([("a", 1), ("b", 2)], ttl=30)
+
+        pipe = client.pipeline.return_value
+        client.pipeline.assert_called_once_with(transaction=False)
+        assert [c.args for c in pipe.set.call_args_list] == [("lol:a", b"1"), ("lol:b", b"2")]
+        assert all(c.kwargs == {"ex": 30} for c in pipe.set.call_args_list)
+        pipe.execute.assert_awaited_once()
+
+
+class TestKeyFor:
+    """Test cache key construction with shared prefixes."""
+
+    def test_builds_expected_key(self):
+        """Keys keep the resource:region:ident layout."""
+        assert key_for("summoner:puuid", "euw1", "abc") == "summoner:puuid:euw1:abc"
+
+    def test_per_region_key_has_no_identifier(self):
+        """Without an identifier the key is resource:region, with no trailing separator."""
+        assert key_for("spectator:featured", "euw1") == "spectator:featured:euw1"
+        assert key_for("spectator:featured", PlatformRegion.EUROPE) == "spectator:featured:europe"
+
+    def test_region_enum_uses_value(self):
+        """Region enums and their string values produce the same key."""
+        assert key_for("match", PlatformRegion.EUROPE, "EUW1_1") == "match:europe:EUW1_1"
+        assert key_for("match", "europe", "EUW1_1") == "match:europe:EUW1_1"
+
+    def test_prefix_is_computed_once(self):
+        """The prefix is built once per (resource, region) and then reused."""
+        from app.cache.redis_cache import _key_prefix
+
+        key_for("match:timeline", "sea", "VN2_1")
+        hits = _key_prefix.cache_info().hits
+        assert key_for("match:timeline", "sea", "VN2_2") == "match:timeline:sea:VN2_2"
+        assert _key_prefix.cache_info().hits == hits + 1
+
+
+# ============================================================================
+# PREFIX INVALIDATION TESTS
+# ============================================================================
+
+
+class TestKeyTrie:
+    """Test the prefix index of cache keys."""
+
+    def test_pop_prefix_returns_matching_keys(self):
+        """Only keys under the prefix are returned and removed."""
+        trie = KeyTrie()
+        trie.add("summoner:euw1:a", ttl=60)
+        trie.add("summoner:euw1:b", ttl=60)
+        trie.add("summoner:na1:c", ttl=60)
+
+        assert sorted(trie.pop_prefix("summoner:euw1:")) == ["summoner:euw1:a", "summoner:euw1:b"]
+        assert trie.pop_prefix("summoner:euw1:") == []
+        assert trie.pop_prefix("summoner:") == ["summoner:na1:c"]
+        assert len(trie) == 0
+
+    def test_expired_keys_are_skipped_and_pruned(self, monkeypatch):
+        """Expired keys are not returned and prune() reclaims them."""
+        now = 1000.0
+        monkeypatch.setattr("app.cache.redis_cache.time.monotonic", lambda: now)
+
+        trie = KeyTrie()
+        trie.add("match:euw1:1", ttl=10)
+        trie.add("match:euw1:2", ttl=100)
+        now += 50
+
+        trie.prune()
+        assert len(trie) == 1
+        assert trie.pop_prefix("match:") == ["match:euw1:2"]
+
+    def test_maxsize_bounds_index(self):
+        """Keys beyond maxsize are not tracked."""
+        trie = KeyTrie(maxsize=2)
+        for i in range(5):
+            trie.add(f"key:{i}", ttl=60)
+        assert len(trie) == 2
+
+    def test_prefix_inside_a_segment(self):
+        """A prefix ending mid-segment matches the keys of every segment it starts."""
+        trie = KeyTrie()
+        for key in ("summoner:euw1:a", "summoner:eun1:b", "summoner:na1:c", "summoner:eu"):
+            trie.add(key, ttl=60)
+
+        assert sorted(trie.pop_prefix("summoner:eu")) == [
+            "summoner:eu",
+            "summoner:eun1:b",
+            "summoner:euw1:a",
+        ]
+        assert trie.pop_prefix("sum") == ["summoner:na1:c"]
+        assert len(trie) == 0
+
+    def test_full_index_prunes_at_most_once_per_interval(self, monkeypatch):
+        """A full index does not walk the trie on every insert."""
+        now = 1000.0
+        monkeypatch.setattr("app.cache.redis_cache.time.monotonic", lambda: now)
+
+        trie = KeyTrie(maxsize=2, prune_interval=60)
+        trie.add("key:0", ttl=600)
+        trie.add("key:1", ttl=600)
+        prunes = 0
+        original_prune = trie.prune
+
+        def counting_prune():
+            nonlocal prunes
+            prunes += 1
+            original_prune()
+
+        monkeypatch.setattr(trie, "prune", counting_prune)
+        for i in range(2, 10):
+            trie.add(f"key:{i}", ttl=600)
+        assert prunes == 1
+
+        now += 600
+        trie.add("key:10", ttl=600)
+        assert prunes == 2
+        assert trie.pop_prefix("key:") == ["key:10"]
+
+
+@pytest.mark.asyncio
+class TestInvalidatePrefix:
+    """Test bulk invalidation through RedisCache.invalidate_prefix."""
+
+    async def test_unlinks_known_keys_and_clears_l1(self, mock_cache, async_pipeline):
+        """Keys cached by fetch_with_cache are unlinked in one pipeline."""
+        trie = KeyTrie()
+        pipe = async_pipeline([2])
+        mock_cache.namespace = "lol"
+        mock_cache.client.pipeline.return_value = pipe
+
+        async def mock_fetch_fn():
+            return {"name": "TestSummoner"}
+
+        with (
+            patch.object(cache_helpers, "cache", mock_cache),
+            patch.object(cache_helpers, "known_keys", trie),
+            patch("app.cache.redis_cache.known_keys", trie),
+        ):
+            for key in ("summoner:euw1:a", "summoner:euw1:b", "summoner:na1:c"):
+                await cache_helpers.fetch_with_cache(
+                    cache_key=key,
+                    resource_name="Test Resource",
+                    fetch_fn=mock_fetch_fn,
+                    ttl=60,
+                )
+            await cache_helpers.drain_cache_writes()
+
+            redis = RedisCache()
+            redis.cache = mock_cache
+            count = await redis.invalidate_prefix("summoner:euw1:")
+
+        assert count == 2
+        unlinked = pipe.unlink.call_args.args
+        assert sorted(unlinked) == ["lol:summoner:euw1:a", "lol:summoner:euw1:b"]
+        pipe.execute.assert_awaited_once()
+        assert local_cache.get("summoner:euw1:a") is None
+        assert local_cache.get("summoner:na1:c") is not None
+
+    async def test_unknown_prefix_skips_redis(self, mock_cache):
+        """Nothing is sent to Redis when no key matches."""
+        redis = RedisCache()
+        redis.cache = mock_cache
+
+        with patch("app.cache.redis_cache.known_keys", KeyTrie()):
+            assert await redis.invalidate_prefix("summoner:kr:") == 0
+
+        mock_cache.client.pipeline.assert_not_called()
+
 
 # ============================================================================
 # CACHE CONSISTENCY TESTS
@@ -418,12 +418,15 @@ async def test_tournament_code_cache_key_format(async_client: AsyncClient):
         cache_calls.append(("get", key))
         return None
 
+    async def mock_multi_get(keys, timeout=None):
+        return [await mock_get(key) for key in keys]
+
     async def mock_set(key, value, ttl):
         cache_calls.append(("set", key, ttl))
 
     # Patch both Redis cache and Riot client
     with (
-        patch("app.cache.redis_cache.cache.get", side_effect=mock_get),
+        patch("app.cache.redis_cache.cache.multi_get", side_effect=mock_multi_get),
         patch("app.cache.redis_cache.cache.set", side_effect=mock_set),
     ):
         try:
@@ -459,7 +462,10 @@ async def test_tournament_stub_code_cache_key_format(async_client: AsyncClient):
         cache_calls.append(("get", key))
         return None
 
-    with patch("app.cache.redis_cache.cache.get", side_effect=mock_get):
+    async def mock_multi_get(keys, timeout=None):
+        return [await mock_get(key) for key in keys]
+
+    with patch("app.cache.redis_cache.cache.multi_get", side_effect=mock_multi_get):
         try:
             await async_client.get(f"/lol/tournament-stub/v5/codes/{test_code}?region={region}")
         except Exception:
@@ -488,7 +494,10 @@ async def test_tournament_lobby_events_cache_key_format(async_client: AsyncClien
         cache_calls.append(("get", key))
         return None
 
-    with patch("app.cache.redis_cache.cache.get", side_effect=mock_get):
+    async def mock_multi_get(keys, timeout=None):
+        return [await mock_get(key) for key in keys]
+
+    with patch("app.cache.redis_cache.cache.multi_get", side_effect=mock_multi_get):
         try:
             await async_client.get(
                 f"/lol/tournament/v5/lobby-events/by-code/{test_code}?region={region}"
@@ -2,6 +2,8 @@
 
 import os
 
+import pytest
+
 
 def test_config_imports():
     """Test that config module can be imported."""
@@ -86,6 +88,17 @@ def test_environment_override():
     reload(config)
 
 
+def test_get_settings_is_cached_singleton():
+    """Settings are built once and shared with the module-level alias."""
+    from app import config
+
+    assert config.get_settings() is config.get_settings()
+    assert config.settings is config.get_settings()
+
+    with pytest.raises(AttributeError):
+        config.not_a_setting
+
+
 def test_config_validation():
     """Test that configuration validation works."""
     from app.config import settings
@@ -99,8 +112,12 @@ def test_config_validation():
     assert settings.redis_port > 0
 
 
-def test_get_api_keys_handles_empty_strings(monkeypatch):
-    """Test that get_api_keys() treats empty strings as missing values (GitHub Actions compatibility)."""
+@pytest.mark.parametrize(
+    ("riot_api_key", "riot_api_keys"),
+    [("", None), (None, ""), ("", ""), ("   ", "  ")],
+)
+def test_missing_api_keys_fail_at_startup(riot_api_key, riot_api_keys):
+    """Empty or blank keys count as missing and fail Settings() (GitHub Actions compatibility)."""
     from app.config import Settings
     from pydantic_settings import SettingsConfigDict
 
@@ -108,34 +125,33 @@ def test_get_api_keys_handles_empty_strings(monkeypatch):
     class TestSettings(Settings):
         model_config = SettingsConfigDict(env_file=None, extra="ignore")
 
-    # Test empty RIOT_API_KEY should raise ValueError
-    test_settings = TestSettings(riot_api_key="", riot_api_keys=None)  # type: ignore[call-arg]
-    try:
-        test_settings.get_api_keys()
-        assert False, "Should have raised ValueError for empty string"
-    except ValueError as e:
-        assert "No Riot API keys configured" in str(e)
-
-    # Test empty RIOT_API_KEYS should raise ValueError
-    test_settings = TestSettings(riot_api_key=None, riot_api_keys="")  # type: ignore[call-arg]
-    try:
-        test_settings.get_api_keys()
-        assert False, "Should have raised ValueError for empty string"
-    except ValueError as e:
-        assert "No Riot API keys configured" in str(e)
-
-    # Test both empty should raise ValueError
-    test_settings = TestSettings(riot_api_key="", riot_api_keys="")  # type: ignore[call-arg]
-    try:
-        test_settings.get_api_keys()
-        assert False, "Should have raised ValueError for both empty"
-    except ValueError as e:
-        assert "No Riot API keys configured" in str(e)
-
-    # Test whitespace-only should also raise ValueError
-    test_settings = TestSettings(riot_api_key="   ", riot_api_keys="  ")  # type: ignore[call-arg]
-    try:
-        test_settings.get_api_keys()
-        assert False, "Should have raised ValueError for whitespace"
-    except ValueError as e:
-        assert "No Riot API keys configured" in str(e)
+    with pytest.raises(ValueError, match="No Riot API keys configured"):
+        TestSettings(riot_api_key=riot_api_key, riot_api_keys=riot_api_keys)  # type: ignore[call-arg]
+
+
+def test_riot_api_keys_are_split_on_load():
+    """RIOT_API_KEYS is split when settings load and returned as a tuple."""
+    from app.config import Settings
+    from pydantic_settings import SettingsConfigDict
+
+    class TestSettings(Settings):
+        model_config = SettingsConfigDict(env_file=None, extra="ignore")
+
+    test_settings = TestSettings(riot_api_keys=" key1 , key2 ")  # type: ignore[call-arg]
+    assert test_settings.riot_api_keys == ("key1", "key2")
+
+    assert test_settings.get_api_keys() == ("key1", "key2")
+
+
+@pytest.mark.parametrize(
+    "raw",
+    ["riot_api,data_dragon", " riot_api , data_dragon ,", '["riot_api", "data_dragon"]'],
+)
+def test_enabled_providers_from_env(monkeypatch, raw):
+    """ENABLED_PROVIDERS accepts comma-separated and JSON lists and yields a frozenset."""
+    from app.config import Settings
+
+    monkeypatch.setenv("ENABLED_PROVIDERS", raw)
+    test_settings = Settings()  # type: ignore[call-arg]
+
+    assert test_settings.enabled_providers == frozenset({"riot_api", "data_dragon"})
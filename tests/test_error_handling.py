@@ -4,6 +4,8 @@ Comprehensive tests for error handling conforming to OpenAPI specification.
 Tests all error types, exception handlers, and error formatting utilities.
 """
 
+import json
+
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
@@ -15,13 +17,19 @@ from app.exceptions import (
     NotFoundException,
     RateLimitException,
     ServiceUnavailableException,
+    STATUS_CODE_TO_EXCEPTION,
+    STATUS_CODES_WITH_MAPPING,
     UnauthorizedException,
     get_exception_for_status_code,
 )
 from app.main import app
+from app.models.common import ErrorRecord
 from app.models.errors import ErrorResponse, ErrorStatus
 from app.utils.error_formatter import (
+    format_error_body,
     format_error_response,
+    format_internal_error_body,
+    format_validation_body,
     format_validation_error,
     get_standard_error_message,
 )
@@ -139,6 +147,42 @@ class TestCustomExceptions:
         assert isinstance(exc_400, BadRequestException)
         assert "Bad input" in exc_400.message
 
+        # Defaults and unmapped codes; every call builds its own instance
+        exc_503 = get_exception_for_status_code(503)
+        assert isinstance(exc_503, ServiceUnavailableException)
+        assert get_exception_for_status_code(503) is not exc_503
+        assert isinstance(get_exception_for_status_code(418), InternalServerException)
+
+        # 404 and 429 fall back to their defaults without extra arguments
+        assert isinstance(get_exception_for_status_code(404), NotFoundException)
+        exc_429 = get_exception_for_status_code(429)
+        assert isinstance(exc_429, RateLimitException)
+        assert exc_429.retry_after == 1
+
+    def test_rate_limit_messages_are_reused(self):
+        """Common Retry-After values reuse precomputed messages; others are formatted."""
+        first = RateLimitException(retry_after=30)
+        second = RateLimitException(retry_after=30)
+        assert first.message == "Rate limit exceeded. Retry after 30 seconds"
+        assert first.message is second.message
+        assert first.headers == {"Retry-After": "30"}
+
+        assert first.headers is second.headers
+        with pytest.raises(TypeError):
+            first.headers["Retry-After"] = "0"  # type: ignore[index]
+
+        uncommon = RateLimitException(retry_after=7)
+        assert uncommon.message == "Rate limit exceeded. Retry after 7 seconds"
+        assert uncommon.headers == {"Retry-After": "7"}
+
+    def test_status_code_mapping_is_read_only(self):
+        """The shared status code mapping cannot be mutated."""
+        assert STATUS_CODE_TO_EXCEPTION[404] is NotFoundException
+        assert STATUS_CODES_WITH_MAPPING == frozenset(STATUS_CODE_TO_EXCEPTION)
+
+        with pytest.raises(TypeError):
+            STATUS_CODE_TO_EXCEPTION[418] = InternalServerException  # type: ignore[index]
+
 
 class TestErrorFormatter:
     """Test error formatting utilities."""
@@ -149,6 +193,13 @@ class TestErrorFormatter:
 
         assert result == {"status": {"status_code": 404, "message": "Resource not found: summoner"}}
 
+    def test_format_error_body_is_cached_json(self):
+        """Encoded error bodies match the dict format and are reused."""
+        body = format_error_body(404, "Resource not found: summoner")
+
+        assert json.loads(body) == format_error_response(404, "Resource not found: summoner")
+        assert format_error_body(404, "Resource not found: summoner") is body
+
     def test_format_validation_error(self):
         """Test validation error formatting."""
         validation_errors = [
@@ -168,6 +219,30 @@ class TestErrorFormatter:
         assert result["status"]["status_code"] == 400
         assert "Validation failed" in result["status"]["message"]
 
+    @pytest.mark.parametrize(
+        "message", ['Quote " and backslash \\', "Unicode: Kai'Sa 스킨", "Line\nbreak"]
+    )
+    def test_format_error_body_matches_model_encoding(self, message):
+        """The byte template encodes exactly like the ErrorResponse model."""
+        import orjson
+
+        assert format_error_body(429, message) == orjson.dumps(format_error_response(429, message))
+
+    def test_format_internal_error_body_is_cached_per_class(self):
+        """500 bodies name the exception class and are reused for that class."""
+        body = format_internal_error_body(KeyError)
+
+        assert json.loads(body) == format_error_response(500, "Internal server error: KeyError")
+        assert format_internal_error_body(KeyError) is body
+
+    def test_format_validation_body_matches_dict_format(self):
+        """Encoded validation bodies carry the same content as format_validation_error."""
+        validation_errors = [{"loc": ["query", "region"], "msg": "field required"}]
+
+        body = format_validation_body(validation_errors)
+
+        assert json.loads(body) == format_validation_error(validation_errors)
+
     def test_get_standard_error_message(self):
         """Test standard error message retrieval."""
         assert "Invalid request parameters" in get_standard_error_message(400)
@@ -198,6 +273,13 @@ class TestExceptionHandlers:
         # Note: This test may need adjustment based on actual validation rules
         assert response.status_code in [200, 400]  # Either succeeds or fails validation
 
+    def test_handlers_registered_at_construction(self):
+        """Test the handler table is passed to the app rather than added by decorators."""
+        from app.main import EXCEPTION_HANDLERS
+
+        for exc_class, handler in EXCEPTION_HANDLERS.items():
+            assert app.exception_handlers[exc_class] is handler
+
     def test_not_found_endpoint_returns_404(self):
         """Test 404 error for non-existent endpoint."""
         response = client.get("/nonexistent/endpoint")
@@ -296,5 +378,120 @@ class TestEndToEndErrorFlow:
         assert "message" in data
 
 
+class TestErrorMonitoringMiddleware:
+    """Test error tracking in the ASGI error monitoring middleware."""
+
+    @pytest.fixture
+    def monitored(self, monkeypatch):
+        """Provide a small app wrapped in its own monitor (the global one is restored)."""
+        from fastapi import FastAPI
+
+        from app.main import EXCEPTION_HANDLERS
+        from app.middleware import error_monitoring
+        from app.middleware.error_monitoring import ErrorMonitoringMiddleware
+
+        monkeypatch.setattr(error_monitoring, "_global_instance", None)
+        test_app = FastAPI(exception_handlers=EXCEPTION_HANDLERS)
+        test_app.add_middleware(ErrorMonitoringMiddleware, alert_threshold=2)
+
+        @test_app.get("/lol/ok")
+        async def ok():
+            return {"ok": True}
+
+        @test_app.get("/lol/missing")
+        async def missing():
+            raise NotFoundException(resource_type="summoner")
+
+        @test_app.get("/lol/boom")
+        async def boom():
+            raise RuntimeError("boom")
+
+        with TestClient(test_app) as test_client:
+            yield test_client, error_monitoring.get_global_error_monitor()
+
+    def test_client_error_is_recorded(self, monitored):
+        """4xx responses are recorded as client errors with the detected provider."""
+        test_client, monitor = monitored
+
+        response = test_client.get("/lol/missing")
+
+        assert response.status_code == 404
+        record = monitor.get_recent_errors()[-1]
+        assert record.is_client_error
+        assert record.endpoint == "GET /lol/missing"
+        assert record.provider == "riot_api"
+
+    def test_exception_returns_formatted_500(self, monitored):
+        """Unhandled exceptions become a 500 error body and count as consecutive failures."""
+        test_client, monitor = monitored
+
+        for _ in range(2):
+            response = test_client.get("/lol/boom")
+
+        assert response.status_code == 500
+        assert response.json() == format_error_response(500, "Internal server error: RuntimeError")
+        assert monitor.consecutive_failures["GET /lol/boom"] == 2
+        assert "consecutive_failures:GET /lol/boom" in monitor.active_alerts
+
+    def test_success_resets_consecutive_failures(self, monitored):
+        """2xx responses end the failure streak; healthy endpoints are not tracked."""
+        test_client, monitor = monitored
+        monitor.consecutive_failures["GET /lol/ok"] = 3
+
+        assert test_client.get("/lol/ok").status_code == 200
+        assert "GET /lol/ok" not in monitor.consecutive_failures
+        assert "GET /lol/ok" in monitor.last_success_times
+        assert monitor.get_recent_errors() == []
+
+        monitor.last_success_times.clear()
+        assert test_client.get("/lol/ok").status_code == 200
+        assert monitor.last_success_times == {}
+
+    def test_metrics_counts_follow_history_rotation(self, monkeypatch):
+        """Server/client counts and time windows only cover the retained history."""
+        import time
+
+        from app.middleware import error_monitoring
+        from app.middleware.error_monitoring import ErrorMonitoringMiddleware, _RawErrorRecord
+
+        monkeypatch.setattr(error_monitoring, "_global_instance", None)
+        monitor = ErrorMonitoringMiddleware(None, max_error_history=3)
+        now = time.time()
+        for age, is_server_error in [(7200, True), (1800, True), (600, False), (60, False)]:
+            monitor._record_error(
+                _RawErrorRecord(
+                    timestamp=now - age,
+                    endpoint="GET /lol/x",
+                    status_code=500 if is_server_error else 404,
+                    method="GET",
+                    path="/lol/x",
+                    duration=0.0,
+                    is_server_error=is_server_error,
+                    is_client_error=not is_server_error,
+                )
+            )
+
+        metrics = monitor.get_error_metrics()
+        assert (metrics.total_errors, metrics.server_errors, metrics.client_errors) == (3, 1, 2)
+        assert (metrics.recent_errors_5min, metrics.recent_errors_1hour) == (1, 3)
+        assert [type(record) for record in monitor.get_recent_errors(2)] == [ErrorRecord] * 2
+
+    @pytest.mark.parametrize(
+        "path, provider",
+        [
+            ("/lol/summoner/v4/summoners/by-puuid/x", "riot_api"),
+            ("/CDRAGON/latest/skins", "community_dragon"),
+            ("/cdn/lol/profile-icons", "riot_api"),  # earlier providers win
+            ("/ddragon/15.1.1/item", "data_dragon"),
+            ("/health/detailed", "unknown"),
+        ],
+    )
+    def test_detect_provider(self, monitored, path, provider):
+        """Providers are detected case-insensitively, in provider_patterns order."""
+        _, monitor = monitored
+
+        assert monitor._detect_provider(path) == provider
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -103,7 +103,7 @@ class TestSettingsKeyParsing:
         keys = settings.get_api_keys()
 
         assert len(keys) == 3
-        assert keys == ["key1", "key2", "key3"]
+        assert keys == ("key1", "key2", "key3")
 
     def test_get_api_keys_with_riot_api_key_fallback(self, monkeypatch):
         """Test get_api_keys() falls back to RIOT_API_KEY if RIOT_API_KEYS not set."""
@@ -121,7 +121,7 @@ class TestSettingsKeyParsing:
         keys = settings.get_api_keys()
 
         assert len(keys) == 1
-        assert keys == ["single_key"]
+        assert keys == ("single_key",)
 
     def test_get_api_keys_with_spaces(self, monkeypatch):
         """Test get_api_keys() trims whitespace from keys."""
@@ -131,7 +131,7 @@ class TestSettingsKeyParsing:
         keys = settings.get_api_keys()
 
         assert len(keys) == 3
-        assert keys == ["key1", "key2", "key3"]
+        assert keys == ("key1", "key2", "key3")
 
     def test_get_api_keys_with_empty_strings(self, monkeypatch):
         """Test get_api_keys() filters out empty strings."""
@@ -141,10 +141,10 @@ class TestSettingsKeyParsing:
         keys = settings.get_api_keys()
 
         assert len(keys) == 3
-        assert keys == ["key1", "key2", "key3"]
+        assert keys == ("key1", "key2", "key3")
 
     def test_get_api_keys_no_keys_configured(self, monkeypatch):
-        """Test get_api_keys() raises ValueError if no keys configured."""
+        """Test Settings() raises ValueError at startup if no keys configured."""
         monkeypatch.delenv("RIOT_API_KEY", raising=False)
         monkeypatch.delenv("RIOT_API_KEYS", raising=False)
 
@@ -155,8 +155,7 @@ class TestSettingsKeyParsing:
             model_config = SettingsConfigDict(env_file=None, extra="ignore")
 
         with pytest.raises(ValueError, match="No Riot API keys configured"):
-            settings = TestSettings()  # type: ignore[call-arg]
-            settings.get_api_keys()
+            TestSettings()  # type: ignore[call-arg]
 
 
 class TestRiotClientKeyRotation:
@@ -93,3 +93,73 @@ def test_app_metadata(test_app):
     assert "info" in openapi_schema
     assert "title" in openapi_schema["info"]
     assert "version" in openapi_schema["info"]
+
+
+def test_openapi_schema_built_at_startup(client: TestClient, test_app):
+    """The schema is generated during startup and served from FastAPI's cache."""
+    assert test_app.openapi_schema is not None
+    assert client.get("/openapi.json").json() == test_app.openapi_schema
+
+
+def test_error_metrics_endpoint(client: TestClient):
+    """Error metrics are served as JSON matching the documented ErrorMetrics model."""
+    from app.models.common import ErrorMetrics
+
+    response = client.get("/monitoring/errors")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert ErrorMetrics.model_validate(response.json()).total_errors >= 0
+
+
+def test_routers_skip_disabled_providers(monkeypatch):
+    """Routers of providers missing from ENABLED_PROVIDERS are not included."""
+    from fastapi import FastAPI
+
+    import app.main as main
+    from app.config import Settings
+
+    monkeypatch.setattr(main, "settings", Settings(enabled_providers=["riot_api"]))
+    riot_only = FastAPI()
+    main.include_routers(riot_only)
+
+    paths = [route.path for route in riot_only.routes]
+    assert "/health" in paths
+    assert not any(path.startswith(("/ddragon", "/cdragon")) for path in paths)
+
+
+def test_unmatched_path_and_method(client: TestClient):
+    """Unmatched paths and methods get the router's 404 and 405 responses."""
+    assert client.get("/ddragon/does-not-exist").status_code == 404
+    assert client.delete("/health").status_code == 405
+
+
+def test_default_response_class_is_orjson(test_app):
+    """Endpoint responses are serialized with orjson."""
+    from fastapi.responses import ORJSONResponse
+
+    assert test_app.router.default_response_class is ORJSONResponse
+
+
+def test_no_threadpool_handlers_or_dependencies(test_app):
+    """Endpoints and their dependencies all run on the event loop."""
+    import inspect
+
+    from fastapi.routing import APIRoute
+
+    def walk(dependant):
+        for sub in dependant.dependencies:
+            yield sub
+            yield from walk(sub)
+
+    for route in test_app.routes:
+        if isinstance(route, APIRoute):
+            assert inspect.iscoroutinefunction(route.endpoint), route.path
+            for sub in walk(route.dependant):
+                assert inspect.iscoroutinefunction(sub.call), f"{route.path}: {sub.call}"
+
+
+def test_model_dependency_validation_unchanged(client: TestClient):
+    """Inlined model dependencies still reject invalid parameters with 400."""
+    response = client.get("/lol/summoner/v4/summoners/by-puuid/x", params={"region": "nope"})
+    assert response.status_code == 400
@@ -198,6 +198,32 @@ class TestProviderRegistry:
         assert ddragon.version == "13.24.1"
         assert ddragon.locale == "en_US"
 
+    async def test_close_all_continues_after_failure(self, monkeypatch):
+        """Test that one provider failing to close does not stop the others."""
+        registry = ProviderRegistry()
+        registry.clear()
+
+        settings = Settings(riot_api_key="test-key")
+        riot_provider = RiotAPIProvider(settings_override=settings)
+        ddragon_provider = DataDragonProvider()
+        registry.register_provider(riot_provider)
+        registry.register_provider(ddragon_provider)
+
+        closed = []
+
+        async def failing_close():
+            raise RuntimeError("boom")
+
+        async def close():
+            closed.append(ddragon_provider.name)
+
+        monkeypatch.setattr(riot_provider, "close", failing_close)
+        monkeypatch.setattr(ddragon_provider, "close", close)
+
+        await registry.close_all()
+
+        assert closed == [ddragon_provider.name]
+
 
 class TestProviderIntegration:
     """Integration tests for providers."""
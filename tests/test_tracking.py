@@ -0,0 +1,205 @@
+"""Tests for the match tracking service."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.cache.tracking import MatchTracker
+
+
+@pytest.fixture
+def connected_tracker():
+    """Provide a MatchTracker backed by a mocked Redis client."""
+    tracker = MatchTracker()
+    tracker.redis = MagicMock()
+    tracker.redis.smismember = AsyncMock(return_value=[1, 0, 1])
+    tracker.redis.sadd = AsyncMock(return_value=2)
+    return tracker
+
+
+class TestBulkTracking:
+    """Test the single-round-trip bulk tracking helpers."""
+
+    async def test_is_processed_many_uses_single_command(self, connected_tracker):
+        """All IDs are checked with one SMISMEMBER call."""
+        result = await connected_tracker.is_processed_many("euw1", ["EUW1_1", "EUW1_2", "EUW1_3"])
+
+        assert result == [True, False, True]
+        connected_tracker.redis.smismember.assert_awaited_once_with(
+            "processed_matches:euw1", ["EUW1_1", "EUW1_2", "EUW1_3"]
+        )
+
+    async def test_mark_processed_many_uses_single_command(self, connected_tracker):
+        """All IDs are added with one SADD call."""
+        await connected_tracker.mark_processed_many("euw1", ["EUW1_1", "EUW1_2"])
+
+        connected_tracker.redis.sadd.assert_awaited_once_with(
+            "processed_matches:euw1", "EUW1_1", "EUW1_2"
+        )
+
+    async def test_empty_batches_skip_redis(self, connected_tracker):
+        """Empty batches never reach Redis."""
+        assert await connected_tracker.is_processed_many("euw1", []) == []
+        await connected_tracker.mark_processed_many("euw1", [])
+
+        connected_tracker.redis.smismember.assert_not_called()
+        connected_tracker.redis.sadd.assert_not_called()
+
+    async def test_not_connected_defaults(self):
+        """Without a connection, matches are reported as not processed."""
+        tracker = MatchTracker()
+
+        assert await tracker.is_processed_many("euw1", ["EUW1_1", "EUW1_2"]) == [False, False]
+        await tracker.mark_processed_many("euw1", ["EUW1_1"])
+
+
+@pytest.fixture
+def bloom_tracker(async_pipeline):
+    """Provide a MatchTracker using the Bloom filter backend with a mocked Redis client."""
+    tracker = MatchTracker()
+    tracker.use_bloom = True
+    tracker.redis = MagicMock()
+    tracker.redis.execute_command = AsyncMock(return_value=[1, 0])
+    tracker.redis.pfcount = AsyncMock(return_value=42)
+
+    pipe = async_pipeline([[1, 1], 1])
+    tracker.redis.pipeline = MagicMock(return_value=pipe)
+    tracker.pipe = pipe
+    return tracker
+
+
+class TestBloomTracking:
+    """Test the RedisBloom + HyperLogLog tracking backend."""
+
+    async def test_is_processed_many_uses_bf_mexists(self, bloom_tracker):
+        """Membership is checked against the region's Bloom filter."""
+        result = await bloom_tracker.is_processed_many("euw1", ["EUW1_1", "EUW1_2"])
+
+        assert result == [True, False]
+        bloom_tracker.redis.execute_command.assert_awaited_once_with(
+            "BF.MEXISTS", "processed_matches_bf:euw1", "EUW1_1", "EUW1_2"
+        )
+
+    async def test_mark_processed_many_pipelines_filter_and_counter(self, bloom_tracker):
+        """Matches are added to the filter and the HyperLogLog in one round trip."""
+        from app.config import settings
+
+        await bloom_tracker.mark_processed_many("euw1", ["EUW1_1", "EUW1_2"])
+
+        bloom_tracker.redis.pipeline.assert_called_once_with(transaction=False)
+        bloom_tracker.pipe.execute_command.assert_called_once_with(
+            "BF.INSERT",
+            "processed_matches_bf:euw1",
+            "CAPACITY",
+            settings.match_tracking_bloom_capacity,
+            "ERROR",
+            settings.match_tracking_bloom_error_rate,
+            "ITEMS",
+            "EUW1_1",
+            "EUW1_2",
+        )
+        bloom_tracker.pipe.pfadd.assert_called_once_with(
+            "processed_matches_hll:euw1", "EUW1_1", "EUW1_2"
+        )
+        bloom_tracker.pipe.execute.assert_awaited_once()
+
+    async def test_processed_count_uses_pfcount(self, bloom_tracker):
+        """The processed count is read from the HyperLogLog."""
+        assert await bloom_tracker.get_processed_count("euw1") == 42
+        bloom_tracker.redis.pfcount.assert_awaited_once_with("processed_matches_hll:euw1")
+
+
+class TestLocalMirror:
+    """Test the in-memory, pub/sub-synced copy of the processed sets."""
+
+    async def test_is_processed_answers_from_mirror(self, connected_tracker):
+        """Mirrored regions are answered without touching Redis."""
+        connected_tracker.redis.sismember = AsyncMock()
+        connected_tracker._local["americas"] = {"NA1_1"}
+
+        assert await connected_tracker.is_processed("americas", "NA1_1") is True
+        assert await connected_tracker.is_processed_many("americas", ["NA1_1", "NA1_2"]) == [
+            True,
+            False,
+        ]
+        connected_tracker.redis.sismember.assert_not_called()
+        connected_tracker.redis.smismember.assert_not_called()
+
+    async def test_mark_processed_updates_mirror_and_publishes(
+        self, connected_tracker, async_pipeline
+    ):
+        """Marks update the local set, then SADD and PUBLISH share one round trip."""
+        from app.cache.tracking import EVENTS_CHANNEL
+
+        pipe = async_pipeline([1, 1])
+        connected_tracker.redis.pipeline = MagicMock(return_value=pipe)
+        connected_tracker._local["americas"] = set()
+
+        await connected_tracker.mark_processed("americas", "NA1_1")
+
+        assert connected_tracker._local["americas"] == {"NA1_1"}
+        pipe.sadd.assert_called_once_with("processed_matches:americas", "NA1_1")
+        pipe.publish.assert_called_once_with(EVENTS_CHANNEL, "americas:NA1_1")
+        connected_tracker.redis.sadd.assert_not_called()
+
+    async def test_listener_applies_events_from_other_workers(self, connected_tracker):
+        """Published events are added to the matching region's mirror."""
+
+        async def listen():
+            yield {"type": "subscribe", "data": 1}
+            yield {"type": "message", "data": b"europe:EUW1_9"}
+            yield {"type": "message", "data": b"unknown:X_1"}
+
+        connected_tracker._pubsub = MagicMock()
+        connected_tracker._pubsub.listen = listen
+        connected_tracker._local["europe"] = set()
+
+        await connected_tracker._listen()
+
+        assert connected_tracker._local == {"europe": {"EUW1_9"}}
+
+    async def test_load_sets_pipelines_sscan_across_regions(
+        self, connected_tracker, async_pipeline
+    ):
+        """Each round trip scans every unfinished region; finished regions drop out."""
+        pipe = async_pipeline(
+            side_effect=[
+                [(7, [b"NA1_1"]), (0, [b"EUW1_1", b"EUW1_2"])],
+                [(0, [b"NA1_2"])],
+            ]
+        )
+        connected_tracker.redis.pipeline = MagicMock(return_value=pipe)
+
+        members = await connected_tracker._load_sets(["na1", "euw1"])
+
+        assert members == {"na1": {"NA1_1", "NA1_2"}, "euw1": {"EUW1_1", "EUW1_2"}}
+        assert pipe.execute.await_count == 2
+        pipe.sscan.assert_called_with("processed_matches:na1", cursor=7, count=1000)
+        assert pipe.sscan.call_count == 3
+
+    async def test_mirror_falls_back_to_redis_when_unavailable(self, connected_tracker):
+        """A failed load leaves no mirror, so lookups go to Redis."""
+        pubsub = MagicMock()
+        pubsub.subscribe = AsyncMock(side_effect=ConnectionError("down"))
+        pubsub.aclose = AsyncMock()
+        connected_tracker.redis.pubsub = MagicMock(return_value=pubsub)
+
+        await connected_tracker._start_mirror()
+
+        assert connected_tracker._local == {}
+        assert connected_tracker._listener is None
+        assert await connected_tracker.is_processed_many("americas", ["A", "B", "C"]) == [
+            True,
+            False,
+            True,
+        ]
+
+
+async def test_connect_shares_cache_connection_pool():
+    """The tracker reuses the cache's connection pool instead of opening its own."""
+    from app.cache.redis_cache import cache
+
+    tracker = MatchTracker()
+    await tracker.connect()
+
+    assert tracker.redis.connection_pool is cache.client.connection_pool